@@ -780,7 +780,8 @@ async def test_perplexity_interactive(test_config: PerplexityTest):
         response = await perplexity._query_perplexity(
             query=test_config.query,
             system_prompt="You are an expert automotive market analyst. Provide clear, data-driven insights.",
-            max_tokens=test_config.max_tokens
+            max_tokens=test_config.max_tokens,
+            model=test_config.model
         )
         
         end_time = datetime.utcnow()
@@ -121,6 +121,24 @@ class Settings(BaseSettings):
         default=100,
         description="Daily limit for Perplexity API calls"
     )
+    FIRECRAWL_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="Maximum concurrent Firecrawl scrape requests"
+    )
+    PERPLEXITY_MAX_CONCURRENCY: int = Field(
+        default=10,
+        description="Maximum concurrent Perplexity API requests"
+    )
+    PERPLEXITY_REQUESTS_PER_MINUTE: int = Field(
+        default=300,
+        description="Perplexity API requests allowed per rolling minute (tier limit)"
+    )
+    
+    # Playwright
+    PLAYWRIGHT_CAPTURE_API_STACKS: bool = Field(
+        default=False,
+        description="Let playwright-python capture a call stack on every API call (debugging only)"
+    )
     
     def get_allowed_hosts_list(self) -> List[str]:
         """Convert ALLOWED_HOSTS string to list for FastAPI"""
@@ -5,12 +5,16 @@ from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
 import uvicorn
 import os
+import sys
 from pathlib import Path
 from loguru import logger
 
 from src.core.config import settings
 from src.core.database import connect_to_mongo, close_mongo_connection
 from src.api.v1 import api_router
+from src.services.perplexity_service import close_perplexity_clients
+from src.services.http_api_service import close_http_api_client
+from src.services.firecrawl_service import close_firecrawl_clients
 
 
 @asynccontextmanager
@@ -27,6 +31,14 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Car Finder application...")
     await close_mongo_connection()
     logger.info("Disconnected from MongoDB")
+    await close_perplexity_clients()
+    await close_http_api_client()
+    await close_firecrawl_clients()
+    
+    # Playwright is imported lazily by the endpoints that use it
+    playwright_service = sys.modules.get("src.services.playwright_service")
+    if playwright_service is not None:
+        await playwright_service.PlaywrightScrapingService.shutdown()
 
 
 # Create FastAPI application
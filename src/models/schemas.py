@@ -107,6 +107,7 @@ class SearchCriteria(BaseModel):
     price_max: Optional[float] = Field(default=50000, description="Maximum price")
     mileage_max: Optional[int] = Field(default=150000, description="Maximum mileage")
     locations: List[str] = Field(default_factory=list, description="Target locations/states")
+    max_results: Optional[int] = Field(default=100, description="Maximum vehicles to collect per marketplace search")
 
     @field_validator('year_min', 'year_max')
     @classmethod
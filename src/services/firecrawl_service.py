@@ -6,18 +6,159 @@ using the Firecrawl API for robust and scalable data extraction.
 """
 
 import asyncio
+import itertools
+from functools import lru_cache
+import random
 import httpx
-from typing import List, Dict, Any, Optional
+import orjson
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlencode, quote_plus
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import re
+import weakref
 
 from src.core.config import settings
 from src.models.schemas import Vehicle, VehicleLocation, SearchCriteria
 
+# Responses worth retrying (rate limited / temporarily unavailable)
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_BACKOFF_SECONDS = 20.0
 
-@dataclass
+# Markdown larger than this is parsed in a worker thread instead of on the event loop
+OFFLOAD_EXTRACTION_CHARS = 50_000
+
+# Feature keywords looked for on vehicle detail pages, matched in one regex pass
+FEATURE_KEYWORDS = (
+    'leather', 'sunroof', 'navigation', 'bluetooth', 'backup camera',
+    'heated seats', 'air conditioning', 'cruise control', 'alloy wheels',
+    'automatic', 'manual', 'awd', '4wd', 'fwd'
+)
+FEATURE_PATTERN = re.compile('|'.join(map(re.escape, FEATURE_KEYWORDS)), re.IGNORECASE)
+
+# Marketplace configurations based on real URL analysis
+MARKETPLACE_CONFIGS = {
+    "edmunds": {
+        "base_url": "https://www.edmunds.com/inventory/srp.html",
+        "search_patterns": {
+            "make": "make",
+            "model": "model", 
+            "year_min": "year_min",
+            "year_max": "year_max",
+            "price_min": "price_min",
+            "price_max": "price_max",
+            "location": "zip"
+        }
+    },
+    "cars_com": {
+        "base_url": "https://www.cars.com/shopping/results/",
+        "search_patterns": {
+            "make": "makes[]",  # Encoded to makes%5B%5D by urlencode
+            "model": "models[]",
+            "year_min": "year_min", 
+            "year_max": "year_max",
+            "price_min": "price_min",
+            "price_max": "price_max",
+            "location": "zip"
+        }
+    },
+    "cargurus": {
+        "base_url": "https://www.cargurus.com/Cars/l-Used-Audi-A4-Tampa-d396_L50",
+        "search_patterns": {
+            "make": "make_lookup",  # Special handling needed
+            "model": "model_lookup",
+            "year_min": "year_min",
+            "year_max": "year_max", 
+            "price_min": "price_min",
+            "price_max": "price_max",
+            "location": "zip"
+        }
+    }
+}
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url_cached(marketplace: str, criteria_key: Tuple, location_zip: str) -> str:
+    """Build (and memoize) a marketplace search URL from a hashable criteria fingerprint"""
+    makes, models, year_min, year_max, price_min, price_max = criteria_key
+    config = MARKETPLACE_CONFIGS[marketplace]
+    base_url = config["base_url"]
+    patterns = config["search_patterns"]
+    
+    # (key, value) pairs; urlencode handles escaping (e.g. "Alfa Romeo")
+    params: List[Tuple[str, str]] = []
+    
+    # Add make/model filters with marketplace-specific formatting
+    if makes and models:
+        make = makes[0].lower()
+        model = models[0].lower()
+        
+        if marketplace == "cars_com":
+            # Cars.com format: makes[]=audi&models[]=audi-a4
+            params.append((patterns['make'], make))
+            params.append((patterns['model'], f"{make}-{model}"))
+        elif marketplace == "edmunds":
+            # Edmunds format: make=audi&model=audi|a4
+            params.append((patterns['make'], make))
+            params.append((patterns['model'], f"{make}|{model}"))
+        else:
+            # Default format for other marketplaces
+            params.append((patterns['make'], make))
+            params.append((patterns['model'], model))
+    
+    # Add year range
+    if year_min:
+        params.append((patterns['year_min'], str(year_min)))
+    if year_max:
+        params.append((patterns['year_max'], str(year_max)))
+    
+    # Add price range  
+    if price_min:
+        params.append((patterns['price_min'], str(int(price_min))))
+    if price_max:
+        params.append((patterns['price_max'], str(int(price_max))))
+    
+    # Add location
+    if location_zip:
+        params.append((patterns['location'], location_zip))
+    
+    # Special handling per marketplace based on real URL analysis
+    if marketplace == "edmunds":
+        params.extend([
+            ("inventorytype", "used,cpo"),
+            ("radius", "50")
+        ])
+    elif marketplace == "cars_com":
+        params.extend([
+            ("stock_type", "used"),
+            ("maximum_distance", "30")  # Match real URL pattern
+        ])
+    elif marketplace == "cargurus":
+        # CarGurus uses a completely different URL structure
+        # We'll need special handling for this marketplace
+        params.extend([
+            ("distance", "50")
+        ])
+    
+    return f"{base_url}?{urlencode(params, quote_via=quote_plus)}"
+
+
+def build_search_url(marketplace: str, criteria: SearchCriteria, location_zip: str) -> str:
+    """Build the search results URL for a marketplace (shared with the direct HTTP fetchers)"""
+    # SearchCriteria isn't hashable, so fingerprint the fields the URL depends on
+    criteria_key = (
+        tuple(criteria.makes or ()),
+        tuple(criteria.models or ()),
+        criteria.year_min,
+        criteria.year_max,
+        criteria.price_min,
+        criteria.price_max
+    )
+    return _build_search_url_cached(marketplace, criteria_key, location_zip)
+
+
+@dataclass(slots=True)
 class ScrapingResult:
     """Result of a scraping operation"""
     vehicles: List[Dict[str, Any]]
@@ -28,53 +169,76 @@ class ScrapingResult:
     raw_content: Optional[str] = None  # For debugging extraction issues
 
 
+@dataclass
+class _LoopState:
+    """HTTP clients and asyncio primitives bound to one event loop"""
+    # Shared HTTP clients, one per API key, so connections and TLS sessions are reused
+    # across service instances (most callers create one FirecrawlService per request)
+    clients: Dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    # Cap on scrapes in flight across every instance, matching the provider's concurrent limit
+    concurrency: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(settings.FIRECRAWL_MAX_CONCURRENCY or 8)
+    )
+
+
+# Clients and semaphores can't move between event loops, and scripts call asyncio.run more than once,
+# so each loop gets its own; entries go away with their loop
+_LOOP_STATES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+
+def _loop_state() -> _LoopState:
+    """Get (or lazily create) the shared state for the running event loop"""
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATES.get(loop)
+    if state is None:
+        state = _LOOP_STATES[loop] = _LoopState()
+    return state
+
+
+def _get_client(api_key: str) -> httpx.AsyncClient:
+    """Get (or lazily create) the shared Firecrawl HTTP client for an API key"""
+    clients = _loop_state().clients
+    client = clients.get(api_key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30.0),
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+        clients[api_key] = client
+    return client
+
+
+async def close_firecrawl_clients() -> None:
+    """Close the shared Firecrawl HTTP clients of the running event loop (call on application shutdown)"""
+    clients = _loop_state().clients
+    for client in clients.values():
+        await client.aclose()
+    clients.clear()
+
+
 class FirecrawlService:
     """Service for scraping vehicle data using Firecrawl API"""
     
     def __init__(self, api_key: str = None):
         self.api_key = api_key or settings.FIRECRAWL_API_KEY
         self.base_url = "https://api.firecrawl.dev/v1"
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.max_retries = 5
+        
+        # Monotonic suffix so listings parsed in the same second get unique external IDs
+        self._id_counter = itertools.count()
         
         # Marketplace configurations based on real URL analysis
-        self.marketplaces = {
-            "edmunds": {
-                "base_url": "https://www.edmunds.com/inventory/srp.html",
-                "search_patterns": {
-                    "make": "make",
-                    "model": "model", 
-                    "year_min": "year_min",
-                    "year_max": "year_max",
-                    "price_min": "price_min",
-                    "price_max": "price_max",
-                    "location": "zip"
-                }
-            },
-            "cars_com": {
-                "base_url": "https://www.cars.com/shopping/results/",
-                "search_patterns": {
-                    "make": "makes%5B%5D",  # URL encoded makes[]
-                    "model": "models%5B%5D", # URL encoded models[]
-                    "year_min": "year_min", 
-                    "year_max": "year_max",
-                    "price_min": "price_min",
-                    "price_max": "price_max",
-                    "location": "zip"
-                }
-            },
-            "cargurus": {
-                "base_url": "https://www.cargurus.com/Cars/l-Used-Audi-A4-Tampa-d396_L50",
-                "search_patterns": {
-                    "make": "make_lookup",  # Special handling needed
-                    "model": "model_lookup",
-                    "year_min": "year_min",
-                    "year_max": "year_max", 
-                    "price_min": "price_min",
-                    "price_max": "price_max",
-                    "location": "zip"
-                }
-            }
-        }
+        self.marketplaces = MARKETPLACE_CONFIGS
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive/HTTP2 pool for this API key on the running event loop; outlives this instance"""
+        return _get_client(self.api_key)
     
     async def search_marketplace(self, marketplace: str, criteria: SearchCriteria, location_zip: str = None) -> ScrapingResult:
         """
@@ -112,7 +276,13 @@ class FirecrawlService:
             
             # Extract vehicle data from scraped content
             content = scrape_result["data"]
-            vehicles = self._extract_vehicles_from_content(content, marketplace)
+            markdown = content.get("data", {}).get("markdown") or ""
+            max_results = criteria.max_results or 100
+            if len(markdown) > OFFLOAD_EXTRACTION_CHARS:
+                # Keep the event loop free for other scrapes while regexes run
+                vehicles = await asyncio.to_thread(self._extract_vehicles_from_content, content, marketplace, max_results)
+            else:
+                vehicles = self._extract_vehicles_from_content(content, marketplace, max_results)
             
             logger.info(f"Found {len(vehicles)} vehicles on {marketplace}")
             
@@ -182,72 +352,19 @@ class FirecrawlService:
     
     def _build_search_url(self, marketplace: str, criteria: SearchCriteria, location_zip: str) -> str:
         """Build search URL for specific marketplace"""
-        config = self.marketplaces[marketplace]
-        base_url = config["base_url"]
-        patterns = config["search_patterns"]
-        
-        params = []
-        
-        # Add make/model filters with marketplace-specific formatting
-        if criteria.makes and criteria.models:
-            make = criteria.makes[0].lower()
-            model = criteria.models[0].lower()
-            
-            if marketplace == "cars_com":
-                # Cars.com format: makes%5B%5D=audi&models%5B%5D=audi-a4
-                params.append(f"{patterns['make']}={make}")
-                params.append(f"{patterns['model']}={make}-{model}")
-            elif marketplace == "edmunds":
-                # Edmunds format: make=audi&model=audi%7Ca4 (audi|a4 URL encoded)
-                params.append(f"{patterns['make']}={make}")
-                params.append(f"{patterns['model']}={make}%7C{model}")
-            else:
-                # Default format for other marketplaces
-                params.append(f"{patterns['make']}={make}")
-                params.append(f"{patterns['model']}={model}")
-        
-        # Add year range
-        if criteria.year_min:
-            params.append(f"{patterns['year_min']}={criteria.year_min}")
-        if criteria.year_max:
-            params.append(f"{patterns['year_max']}={criteria.year_max}")
-        
-        # Add price range  
-        if criteria.price_min:
-            params.append(f"{patterns['price_min']}={int(criteria.price_min)}")
-        if criteria.price_max:
-            params.append(f"{patterns['price_max']}={int(criteria.price_max)}")
-        
-        # Add location
-        if location_zip:
-            params.append(f"{patterns['location']}={location_zip}")
-        
-        # Special handling per marketplace based on real URL analysis
-        if marketplace == "edmunds":
-            params.extend([
-                "inventorytype=used%2Ccpo",  # URL encoded "used,cpo"
-                "radius=50"
-            ])
-        elif marketplace == "cars_com":
-            params.extend([
-                "stock_type=used",
-                "maximum_distance=30"  # Match real URL pattern
-            ])
-        elif marketplace == "cargurus":
-            # CarGurus uses a completely different URL structure
-            # We'll need special handling for this marketplace
-            params.extend([
-                "distance=50"
-            ])
-        
-        return f"{base_url}?{'&'.join(params)}"
+        return build_search_url(marketplace, criteria, location_zip)
     
-    async def _scrape_with_firecrawl(self, url: str, marketplace: str) -> Dict[str, Any]:
-        """Use Firecrawl API to scrape a URL"""
+    async def _scrape_with_firecrawl(self, url: str, marketplace: str, include_html: bool = False) -> Dict[str, Any]:
+        """
+        Use Firecrawl API to scrape a URL
+        
+        Only markdown is requested by default; HTML roughly doubles the response
+        size and is only needed by callers that parse raw markup.
+        """
         try:
             payload = {
                 "url": url,
-                "formats": ["markdown", "html"],
+                "formats": ["markdown", "html"] if include_html else ["markdown"],
                 "onlyMainContent": True,
                 "waitFor": 3000,  # Wait 3 seconds for dynamic content
                 "actions": [
@@ -264,25 +381,19 @@ class FirecrawlService:
                 "includeTags": ["div", "span", "a", "img", "p", "h1", "h2", "h3"]
             }
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             logger.info(f"🔥 FIRECRAWL: Making API call to {self.base_url}/scrape")
             logger.info(f"🔥 FIRECRAWL: Payload URL: {url}")
             logger.info(f"🔥 FIRECRAWL: API key present: {bool(self.api_key)}")
             
-            response = await self.client.post(
+            response = await self._post_with_retry(
                 f"{self.base_url}/scrape",
-                json=payload,
-                headers=headers
+                content=orjson.dumps(payload)
             )
             
             logger.info(f"🔥 FIRECRAWL: Response status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 content_length = len(str(data)) if data else 0
                 logger.info(f"🔥 FIRECRAWL: Success! Content length: {content_length} chars")
                 return {
@@ -303,7 +414,51 @@ class FirecrawlService:
                 "error": str(e)
             }
     
-    def _extract_vehicles_from_content(self, scraped_data: Dict[str, Any], marketplace: str) -> List[Dict[str, Any]]:
+    async def _post_with_retry(self, url: str, **kwargs) -> httpx.Response:
+        """
+        POST to Firecrawl, retrying transport errors and 429/503 responses
+        
+        Uses exponential backoff with jitter, honoring the Retry-After header
+        when the API provides one. The last response (or error) is returned
+        to the caller once retries are exhausted.
+        
+        Each attempt holds a slot of the loop-wide concurrency limit, so callers
+        stay under the provider's limit instead of failing into 429s; the slot
+        is given back before sleeping between attempts.
+        """
+        concurrency = _loop_state().concurrency
+        for attempt in range(self.max_retries):
+            try:
+                async with concurrency:
+                    response = await self.client.post(url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"🔥 FIRECRAWL: Transport error ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_retries - 1:
+                return response
+            
+            delay = self._backoff_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(f"🔥 FIRECRAWL: HTTP {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        return response
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Compute retry delay in seconds (Retry-After if numeric, else exponential with jitter)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+            except ValueError:
+                pass
+        return min(2 ** attempt + random.uniform(0, 1), MAX_BACKOFF_SECONDS)
+    
+    def _extract_vehicles_from_content(self, scraped_data: Dict[str, Any], marketplace: str,
+                                       max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """Extract vehicle information from scraped content"""
         vehicles = []
         
@@ -313,13 +468,17 @@ class FirecrawlService:
             if not content:
                 content = scraped_data.get("data", {}).get("html", "")
             
+            # Read the clock once per batch instead of once per listing
+            now = datetime.utcnow()
+            ts_str = now.strftime('%Y%m%d_%H%M%S')
+            
             # Marketplace-specific extraction patterns
             if marketplace == "edmunds":
-                vehicles = self._extract_edmunds_vehicles(content)
+                vehicles = self._extract_edmunds_vehicles(content, now, ts_str, max_results)
             elif marketplace == "cars_com":
-                vehicles = self._extract_cars_com_vehicles(content)
+                vehicles = self._extract_cars_com_vehicles(content, now, ts_str, max_results)
             elif marketplace == "cargurus":
-                vehicles = self._extract_cargurus_vehicles(content)
+                vehicles = self._extract_cargurus_vehicles(content, now, ts_str, max_results)
             
             logger.info(f"Extracted {len(vehicles)} vehicles from {marketplace}")
             
@@ -328,7 +487,8 @@ class FirecrawlService:
         
         return vehicles
     
-    def _extract_edmunds_vehicles(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_edmunds_vehicles(self, content: str, now: datetime, ts_str: str,
+                                  max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """Extract vehicle data from Edmunds content"""
         vehicles = []
         
@@ -341,9 +501,11 @@ class FirecrawlService:
         listings = content.split('\n\n')
         
         for listing in listings:
+            if max_results and len(vehicles) >= max_results:
+                break
             if any(keyword in listing.lower() for keyword in ['$', 'mile', 'year', 'mpg']):
                 try:
-                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern)
+                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern, now, ts_str)
                     if vehicle_data:
                         vehicle_data['source'] = 'edmunds'
                         vehicles.append(vehicle_data)
@@ -353,7 +515,8 @@ class FirecrawlService:
         
         return vehicles
     
-    def _extract_cars_com_vehicles(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_cars_com_vehicles(self, content: str, now: datetime, ts_str: str,
+                                   max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """Extract vehicle data from Cars.com content"""
         vehicles = []
         
@@ -365,9 +528,11 @@ class FirecrawlService:
         listings = content.split('\n\n')
         
         for listing in listings:
+            if max_results and len(vehicles) >= max_results:
+                break
             if any(keyword in listing.lower() for keyword in ['$', 'mile', 'year', 'mpg']):
                 try:
-                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern)
+                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern, now, ts_str)
                     if vehicle_data:
                         vehicle_data['source'] = 'cars.com'
                         vehicles.append(vehicle_data)
@@ -377,7 +542,8 @@ class FirecrawlService:
         
         return vehicles
     
-    def _extract_cargurus_vehicles(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_cargurus_vehicles(self, content: str, now: datetime, ts_str: str,
+                                   max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """Extract vehicle data from CarGurus content"""
         vehicles = []
         
@@ -389,9 +555,11 @@ class FirecrawlService:
         listings = content.split('\n\n')
         
         for listing in listings:
+            if max_results and len(vehicles) >= max_results:
+                break
             if any(keyword in listing.lower() for keyword in ['$', 'mile', 'year', 'mpg']):
                 try:
-                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern)
+                    vehicle_data = self._parse_listing_text(listing, price_pattern, year_pattern, mileage_pattern, now, ts_str)
                     if vehicle_data:
                         vehicle_data['source'] = 'cargurus'
                         vehicles.append(vehicle_data)
@@ -401,7 +569,8 @@ class FirecrawlService:
         
         return vehicles
     
-    def _parse_listing_text(self, text: str, price_pattern: str, year_pattern: str, mileage_pattern: str) -> Optional[Dict[str, Any]]:
+    def _parse_listing_text(self, text: str, price_pattern: str, year_pattern: str, mileage_pattern: str,
+                            now: datetime, ts_str: str) -> Optional[Dict[str, Any]]:
         """Parse a single listing text and extract vehicle data"""
         try:
             # Extract price
@@ -438,9 +607,9 @@ class FirecrawlService:
                     'mileage': mileage or 0,
                     'location': location,
                     'url': '',  # We'll need to extract this from the HTML
-                    'external_id': f"{make}_{model}_{year}_{price}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                    'last_seen_at': datetime.utcnow(),
-                    'discovered_at': datetime.utcnow(),
+                    'external_id': f"{make}_{model}_{year}_{price}_{ts_str}_{next(self._id_counter)}",
+                    'last_seen_at': now,
+                    'discovered_at': now,
                     'is_active': True,
                     'images': [],
                     'features': []
@@ -498,18 +667,28 @@ class FirecrawlService:
         """
         Batch scrape multiple vehicle detail URLs
         
+        URLs are fed through a queue to a bounded pool of workers, so every
+        URL is processed as fast as the Firecrawl concurrency limit allows.
+        
         Args:
             urls: List of vehicle detail page URLs
             
         Returns:
-            List of detailed vehicle data
+            List of detailed vehicle data (in input order)
         """
-        tasks = []
-        for url in urls[:10]:  # Limit to 10 concurrent requests
-            task = self._scrape_vehicle_details(url)
-            tasks.append(task)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            queue.put_nowait((index, url))
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        
+        async def worker():
+            while not queue.empty():
+                index, url = queue.get_nowait()
+                results[index] = await self._scrape_vehicle_details(url)
+        
+        worker_count = min(settings.FIRECRAWL_MAX_CONCURRENCY or 8, len(urls))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
         
         valid_results = []
         for result in results:
@@ -529,19 +708,13 @@ class FirecrawlService:
                 "excludeTags": ["script", "style", "nav", "footer"]
             }
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            response = await self.client.post(
+            response = await self._post_with_retry(
                 f"{self.base_url}/scrape",
-                json=payload,
-                headers=headers
+                content=orjson.dumps(payload)
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return {
                     "success": True,
                     "data": self._parse_vehicle_details(data.get("data", {}))
@@ -575,19 +748,9 @@ class FirecrawlService:
     
     def _extract_features(self, content: str) -> List[str]:
         """Extract vehicle features from content"""
-        features = []
-        feature_keywords = [
-            'leather', 'sunroof', 'navigation', 'bluetooth', 'backup camera',
-            'heated seats', 'air conditioning', 'cruise control', 'alloy wheels',
-            'automatic', 'manual', 'awd', '4wd', 'fwd'
-        ]
-        
-        content_lower = content.lower()
-        for keyword in feature_keywords:
-            if keyword in content_lower:
-                features.append(keyword.title())
-        
-        return features
+        # Single pass over the content instead of one substring scan per keyword
+        found = {match.lower() for match in FEATURE_PATTERN.findall(content)}
+        return [keyword.title() for keyword in FEATURE_KEYWORDS if keyword in found]
     
     def _extract_condition(self, content: str) -> str:
         """Extract vehicle condition from content"""
@@ -607,8 +770,7 @@ class FirecrawlService:
         return []
     
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed by close_firecrawl_clients() on shutdown"""
 
 
 # Helper function to create service instance
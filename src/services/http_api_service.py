@@ -0,0 +1,308 @@
+"""
+Direct HTTP Marketplace Fetcher
+
+Fetches marketplace search results over plain HTTP and reads the structured
+listing data embedded in the server-rendered HTML, so searches can skip the
+browser entirely. Playwright remains the fallback when this returns nothing.
+"""
+
+import asyncio
+import itertools
+import re
+import weakref
+import orjson
+import httpx
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from loguru import logger
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.models.schemas import SearchCriteria
+from src.services.firecrawl_service import build_search_url
+
+# Browser-like headers; marketplaces serve a different (or blocked) page to unknown clients
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# JSON-LD blocks embedded in result pages
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+VEHICLE_LD_TYPES = {"Car", "Vehicle"}
+# Generic Product blocks (gift cards, accessories, ...) only count when they carry vehicle fields
+VEHICLE_LD_FIELDS = ("brand", "model", "vehicleModelDate", "vehicleIdentificationNumber", "mileageFromOdometer")
+
+# Monotonic suffix so VIN-less listings parsed in the same second get unique external IDs
+_id_counter = itertools.count()
+
+
+@dataclass
+class _LoopState:
+    """HTTP client bound to one event loop"""
+    client: Optional[httpx.AsyncClient] = None
+
+
+# Clients can't move between event loops, and scripts call asyncio.run more than once,
+# so each loop gets its own; entries go away with their loop
+_LOOP_STATES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+
+def _loop_state() -> _LoopState:
+    """Get (or lazily create) the shared state for the running event loop"""
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATES.get(loop)
+    if state is None:
+        state = _LOOP_STATES[loop] = _LoopState()
+    return state
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the running event loop's shared keep-alive HTTP client for marketplace fetches"""
+    state = _loop_state()
+    if state.client is None or state.client.is_closed:
+        state.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0),
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True
+        )
+    return state.client
+
+
+async def close_http_api_client() -> None:
+    """Close the running event loop's shared HTTP client (call on application shutdown)"""
+    state = _loop_state()
+    if state.client is not None:
+        await state.client.aclose()
+        state.client = None
+
+
+async def try_fetch(marketplace: str, criteria: SearchCriteria, location_zip: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Try to get search results without a browser
+
+    Args:
+        marketplace: Marketplace key ('cars_com', 'edmunds', 'cargurus')
+        criteria: Search criteria
+        location_zip: ZIP code for location-based search
+
+    Returns:
+        Vehicle dicts in the Playwright scraper format, or None when the
+        marketplace isn't supported or the page had no usable listing data
+    """
+    fetcher = _FETCHERS.get(marketplace)
+    if fetcher is None:
+        return None
+
+    try:
+        vehicles = await fetcher(criteria, location_zip)
+    except Exception as e:
+        logger.debug(f"🌐 Direct HTTP fetch failed for {marketplace}: {str(e)}")
+        return None
+
+    return vehicles or None
+
+
+async def fetch_cars_com(criteria: SearchCriteria, location_zip: str) -> List[Dict[str, Any]]:
+    """Fetch a Cars.com results page and parse its embedded JSON-LD listings"""
+    url = build_search_url("cars_com", criteria, location_zip)
+    response = await get_http_client().get(url)
+    if response.status_code != 200:
+        logger.debug(f"🌐 Cars.com returned HTTP {response.status_code} for {url}")
+        return []
+
+    vehicles = parse_json_ld_vehicles(response.text, "cars.com", "https://www.cars.com", criteria.max_results or 100)
+    logger.info(f"🌐 Cars.com direct fetch returned {len(vehicles)} vehicles")
+    return vehicles
+
+
+def parse_json_ld_vehicles(
+    html: str,
+    source: str,
+    base_url: str,
+    max_results: int = 100,
+    timestamps: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse the JSON-LD vehicle listings embedded in a results page
+
+    Args:
+        html: Page HTML
+        source: Source name stored on each vehicle (e.g. 'cars.com')
+        base_url: Prefix for relative listing URLs
+        max_results: Stop after this many vehicles
+        timestamps: (ISO `discovered_at`, compact `external_id` suffix) for the page; read once here if omitted
+
+    Returns:
+        Vehicle dicts in the Playwright scraper format
+    """
+    blocks = (match.group(1) for match in JSON_LD_PATTERN.finditer(html))
+    return parse_json_ld_blocks(blocks, source, base_url, max_results, timestamps)
+
+
+def parse_json_ld_blocks(
+    blocks: Iterable[str],
+    source: str,
+    base_url: str,
+    max_results: int = 100,
+    timestamps: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse vehicle listings from raw JSON-LD script contents
+
+    Args:
+        blocks: Text of each <script type="application/ld+json"> element
+        source: Source name stored on each vehicle (e.g. 'cars.com')
+        base_url: Prefix for relative listing URLs
+        max_results: Stop after this many vehicles
+        timestamps: (ISO `discovered_at`, compact `external_id` suffix) for the page; read once here if omitted
+
+    Returns:
+        Vehicle dicts in the Playwright scraper format
+    """
+    if timestamps is None:
+        # Read the clock once per page instead of once per listing
+        now = datetime.utcnow()
+        timestamps = (now.isoformat(), now.strftime('%Y%m%d_%H%M%S'))
+    
+    vehicles = []
+    for item in _iter_json_ld_items(blocks):
+        # One malformed listing shouldn't cost the rest of the page
+        try:
+            vehicle = _vehicle_from_json_ld(item, source, base_url, timestamps)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug(f"🌐 Skipping malformed JSON-LD item: {str(e)}")
+            continue
+        if vehicle:
+            vehicles.append(vehicle)
+            if len(vehicles) >= max_results:
+                break
+    return vehicles
+
+
+def _iter_json_ld_items(blocks: Iterable[str]):
+    """Yield every JSON-LD object in the given blocks, flattening @graph and ItemList wrappers"""
+    for block in blocks:
+        try:
+            data = orjson.loads(block.strip())
+        except orjson.JSONDecodeError:
+            continue
+
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop(0)
+            if not isinstance(item, dict):
+                continue
+            if "@graph" in item:
+                graph = item["@graph"]
+                stack.extend(graph if isinstance(graph, list) else [graph])
+            elif item.get("@type") == "ItemList":
+                elements = item.get("itemListElement") or []
+                if not isinstance(elements, list):
+                    elements = [elements]
+                stack.extend(element.get("item", element) if isinstance(element, dict) else element for element in elements)
+            else:
+                yield item
+
+
+def _vehicle_from_json_ld(item: Dict[str, Any], source: str, base_url: str,
+                          timestamps: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Map a schema.org Car/Vehicle object onto the scraper's vehicle dict"""
+    ld_type = item.get("@type")
+    ld_types = set(ld_type) if isinstance(ld_type, list) else {ld_type}
+    if not ld_types & VEHICLE_LD_TYPES:
+        if "Product" not in ld_types or not any(item.get(key) for key in VEHICLE_LD_FIELDS):
+            return None
+
+    vehicle_data: Dict[str, Any] = {
+        "source": source,
+        "discovered_at": timestamps[0],
+        "is_active": True,
+        "images": [],
+        "features": []
+    }
+
+    offers = item.get("offers") or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if not isinstance(offers, dict):
+        offers = {}
+    price = offers.get("price")
+    if price is not None:
+        try:
+            vehicle_data["price"] = int(float(str(price).replace(',', '')))
+        except ValueError:
+            pass
+
+    brand = item.get("brand")
+    make = brand.get("name") if isinstance(brand, dict) else brand
+    model = item.get("model")
+    if isinstance(model, dict):
+        model = model.get("name")
+    make = make if isinstance(make, str) else None
+    model = model if isinstance(model, str) else None
+    year = item.get("vehicleModelDate") or item.get("modelDate")
+
+    # Fall back to the listing name, e.g. "2019 Honda Accord EX"
+    name = item.get("name")
+    name_parts = name.split() if isinstance(name, str) else []
+    if len(name_parts) >= 3 and name_parts[0].isdigit():
+        year = year or name_parts[0]
+        make = make or name_parts[1]
+        model = model or name_parts[2]
+
+    if make:
+        vehicle_data["make"] = make
+    if model:
+        vehicle_data["model"] = model
+    if year and str(year).isdigit():
+        vehicle_data["year"] = int(year)
+
+    mileage = item.get("mileageFromOdometer")
+    if isinstance(mileage, dict):
+        mileage = mileage.get("value")
+    if mileage is not None:
+        try:
+            vehicle_data["mileage"] = int(float(str(mileage).replace(',', '')))
+        except ValueError:
+            pass
+
+    url = item.get("url") or offers.get("url")
+    if isinstance(url, str) and url:
+        vehicle_data["url"] = url if url.startswith('http') else f"{base_url}{url}"
+
+    image = item.get("image")
+    if isinstance(image, str):
+        vehicle_data["images"] = [image]
+    elif isinstance(image, list):
+        vehicle_data["images"] = [img for img in image if isinstance(img, str)]
+
+    seller = offers.get("seller") or {}
+    address = seller.get("address") if isinstance(seller, dict) else None
+    if isinstance(address, dict) and address.get("addressLocality"):
+        vehicle_data["location"] = ", ".join(
+            part for part in (address.get("addressLocality"), address.get("addressRegion")) if isinstance(part, str) and part
+        )
+
+    if "make" in vehicle_data and "model" in vehicle_data:
+        vin = item.get("vehicleIdentificationNumber")
+        vehicle_data["external_id"] = vin if isinstance(vin, str) and vin else (
+            f"{vehicle_data['make']}_{vehicle_data['model']}_{vehicle_data.get('year', 'unknown')}_"
+            f"{vehicle_data.get('price', 'unknown')}_{timestamps[1]}_{next(_id_counter)}"
+        )
+
+    # Same bar as the browser extractors: at least a price or a make
+    if "price" in vehicle_data or "make" in vehicle_data:
+        return vehicle_data
+    return None
+
+
+# Marketplaces with a browser-free fetch path
+_FETCHERS = {
+    "cars_com": fetch_cars_com
+}
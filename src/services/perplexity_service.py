@@ -6,17 +6,273 @@ vehicle valuation insights using the Perplexity API.
 """
 
 import asyncio
+import hashlib
+import heapq
 import httpx
-import json
-from typing import Dict, Any, List, Optional
+import io
+import numpy as np
+import orjson
+import random
+import re
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from datetime import datetime
 
 from src.core.config import settings
+from src.core.database import get_redis
 from src.models.schemas import Vehicle, MarketAnalysis
 
 
+# Extraction patterns as (field, pattern); within a field, earlier patterns
+# take precedence
+_FIELD_PATTERNS = (
+    ("price_range", r'\$([0-9,]+)\s*(?:-|to)\s*\$([0-9,]+)'),
+    ("price_range", r'([0-9]+)k\s*(?:-|to)\s*([0-9]+)k'),
+    ("price_range", r'low:\s*\$([0-9,]+).*high:\s*\$([0-9,]+)'),
+    ("price_range", r'range.*\$([0-9,]+).*\$([0-9,]+)'),
+    ("dollar", r'\$[0-9,]+'),
+    ("avg_price", r'average.*\$([0-9,]+)'),
+    ("avg_price", r'typical.*\$([0-9,]+)'),
+    ("avg_price", r'median.*\$([0-9,]+)'),
+    ("days", r'([0-9]+)\s*days?\s*on\s*market'),
+    ("days", r'sell.*([0-9]+)\s*days?'),
+    ("days", r'([0-9]+)\s*days?.*sell'),
+    ("source", r'(AutoTrader|Cars\.com|CarGurus|KBB|Kelley Blue Book|Edmunds|NADA)'),
+    ("source", r'according to ([^,\.]+)'),
+    ("source", r'source: ([^,\.]+)'),
+    ("score", r'score.*([0-9]\.?[0-9]*)'),
+    ("score", r'rating.*([0-9]\.?[0-9]*)'),
+    ("score", r'([0-9])/10'),
+    ("score", r'([0-9])\.?[0-9]*/5'),
+    ("timing", r'(spring|summer|fall|winter)'),
+    ("timing", r'([0-9]+)\s*(?:days?|weeks?|months?)'),
+    ("timing", r'(immediately|quickly|soon|later)'),
+)
+
+_FIELD_RES: Dict[str, Tuple["re.Pattern", ...]] = {}
+for _field, _body in _FIELD_PATTERNS:
+    _FIELD_RES.setdefault(_field, ())
+    _FIELD_RES[_field] += (re.compile(_body, re.IGNORECASE),)
+
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """
+    Compile lowercase keywords into one multi-pattern matcher
+    
+    The lookahead makes finditer report overlapping hits (e.g. "market data"
+    and "data shows"), so group(1) yields every keyword occurrence in one scan.
+    """
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+# Keyword groups matched against lowercased response text
+_CONDITIONS_RE = _keyword_pattern([
+    "market conditions", "current market", "market situation",
+    "demand", "supply", "pricing trends"
+])
+_REGIONAL_RE = _keyword_pattern([
+    "florida", "georgia", "southeast", "regional", "local",
+    "weather", "climate", "hurricane", "seasonal"
+])
+_RESALE_FACTOR_RE = _keyword_pattern([
+    "reliability", "maintenance", "depreciation", "demand",
+    "reputation", "fuel economy", "features", "condition"
+])
+_CONFIDENCE_RE = _keyword_pattern([
+    "according to", "data shows", "recent sales", "market data",
+    "statistics", "analysis", "research", "$"
+])
+_POSITIVE_RE = _keyword_pattern(["excellent", "good", "strong", "high", "favorable"])
+_NEGATIVE_RE = _keyword_pattern(["poor", "weak", "low", "unfavorable", "difficult"])
+_RISING_RE = _keyword_pattern(["increasing", "rising", "upward", "growth"])
+_FALLING_RE = _keyword_pattern(["decreasing", "falling", "declining", "down"])
+_STABLE_RE = _keyword_pattern(["stable", "steady", "consistent", "flat"])
+_SEASONS = ("spring", "summer", "fall", "winter")
+_SEASON_RE = _keyword_pattern(_SEASONS)
+
+_SENTENCE_END_RE = re.compile(r'\.')
+
+# Query complexity classification used for model routing
+_SIMPLE_QUERY_RE = re.compile(r'^(?:what is|what are|how many|how much)\b')
+_DEEP_QUERY_RE = re.compile(r'compare.*\bvs\.?\b|analysis of|\banalyze\b')
+
+
+def _compact_prompt(text: str) -> str:
+    """Strip indentation and blank lines from a prompt; they cost tokens but carry no meaning"""
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+_DEFAULT_SYSTEM_PROMPT = _compact_prompt("""
+    You are an expert automotive market analyst specializing in used car
+    valuation and market trends. Provide accurate, data-driven insights based on current
+    market conditions. Focus on actionable information for car dealers and investors.
+""").replace("\n", " ")
+
+
+# Upper bound for a single retry backoff delay
+MAX_BACKOFF_SECONDS = 32.0
+
+@dataclass(frozen=True)
+class _ParsedContent:
+    """Response text with its lowercase form and sentence splits, computed once per parse"""
+    raw: str
+    lower: str
+    sentences: List[str]
+    lower_sentences: List[str]
+    _match_cache: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = field(default_factory=dict, repr=False, compare=False)
+    
+    @classmethod
+    def from_text(cls, content: str) -> "_ParsedContent":
+        lower = content.lower()
+        return cls(
+            raw=content,
+            lower=lower,
+            sentences=content.split('.'),
+            lower_sentences=lower.split('.')
+        )
+    
+    def field_matches(self, field_name: str) -> List[Tuple[int, Tuple[str, ...]]]:
+        """
+        Get (pattern index, groups) for each pattern of a field that matches
+        
+        Each pattern contributes its leftmost match ("source" keeps every match);
+        results are cached so a field is scanned at most once per parse.
+        """
+        cached = self._match_cache.get(field_name)
+        if cached is None:
+            cached = []
+            for index, pattern in enumerate(_FIELD_RES[field_name]):
+                if field_name == "source":
+                    cached.extend((index, (match.group(1),)) for match in pattern.finditer(self.raw))
+                else:
+                    match = pattern.search(self.raw)
+                    if match:
+                        cached.append((index, match.groups()))
+            self._match_cache[field_name] = cached
+        return cached
+    
+    @cached_property
+    def sentence_ends(self) -> np.ndarray:
+        """Offsets of the '.' separators that split the text into sentences"""
+        return np.fromiter(
+            (match.start() for match in _SENTENCE_END_RE.finditer(self.lower)),
+            dtype=np.int64
+        )
+    
+    def sentence_hits(self, pattern: "re.Pattern") -> Tuple[List[str], np.ndarray]:
+        """
+        Scan the lowercased text once with a keyword matcher
+        
+        Returns:
+            (keywords, sentence_indices): every keyword hit in text order and the
+            index into sentences/lower_sentences of the sentence containing it
+        """
+        keywords = []
+        positions = []
+        for match in pattern.finditer(self.lower):
+            keywords.append(match.group(1))
+            positions.append(match.start())
+        return keywords, np.searchsorted(self.sentence_ends, positions)
+    
+    def matching_sentences(self, pattern: "re.Pattern") -> np.ndarray:
+        """Indices (ascending) of the sentences containing at least one keyword hit"""
+        return np.unique(self.sentence_hits(pattern)[1])
+
+
+@dataclass
+class _LoopState:
+    """HTTP clients and asyncio primitives bound to one event loop"""
+    # Shared HTTP clients, one per API key, so connections and TLS sessions are reused
+    clients: Dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    # Cap on requests in flight, matching the per-account API limit
+    concurrency: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(settings.PERPLEXITY_MAX_CONCURRENCY)
+    )
+
+
+# Clients and semaphores can't move between event loops, and scripts call asyncio.run
+# more than once, so each loop gets its own; entries go away with their loop
+_LOOP_STATES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+
+def _loop_state() -> _LoopState:
+    """Get (or lazily create) the shared state for the running event loop"""
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATES.get(loop)
+    if state is None:
+        state = _LOOP_STATES[loop] = _LoopState()
+    return state
+
+
+def _get_client(api_key: str) -> httpx.AsyncClient:
+    """Get (or lazily create) the shared Perplexity HTTP client for an API key"""
+    clients = _loop_state().clients
+    client = clients.get(api_key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),  # Reduced from 120s for better UX
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0),
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+        clients[api_key] = client
+    return client
+
+
+# Send times (past or reserved) of the latest requests, for the per-account requests-per-minute limit
+_REQUEST_TIMES: deque = deque(maxlen=settings.PERPLEXITY_REQUESTS_PER_MINUTE)
+
+
+async def _acquire_rate_slot() -> None:
+    """
+    Wait until sending another request stays within the requests-per-minute limit
+    
+    The send time is reserved without awaiting, so throttled callers sleep
+    concurrently instead of queuing behind one another.
+    """
+    now = time.monotonic()
+    send_at = now
+    if len(_REQUEST_TIMES) == _REQUEST_TIMES.maxlen:
+        send_at = max(now, _REQUEST_TIMES[0] + 60)
+    _REQUEST_TIMES.append(send_at)
+    if send_at > now:
+        await asyncio.sleep(send_at - now)
+
+
+# Per-cache-key locks so concurrent misses for the same key fetch once: key -> [lock, users]
+_KEY_LOCKS: Dict[str, List[Any]] = {}
+
+# Queries currently awaiting a response, keyed by request hash, shared by every service instance
+_INFLIGHT: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _forget_inflight(key: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+    """Drop a finished query from the in-flight map"""
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    # Mark retrieved so a failure nobody is still awaiting doesn't log a warning
+    if not task.cancelled():
+        task.exception()
+
+
+async def close_perplexity_clients() -> None:
+    """Close the shared Perplexity HTTP clients of the running event loop (call on application shutdown)"""
+    clients = _loop_state().clients
+    for client in clients.values():
+        await client.aclose()
+    clients.clear()
+
+
 @dataclass
 class MarketInsight:
     """Market analysis insight from Perplexity"""
@@ -39,21 +295,53 @@ class CompetitiveAnalysis:
     days_on_market_avg: Optional[int]
 
 
+# Shared (Redis) second-level cache: survives restarts and is shared by workers
+_L2_KEY_PREFIX = "pplx:"
+_L2_TYPES = {"MarketInsight": MarketInsight, "CompetitiveAnalysis": CompetitiveAnalysis}
+
+
+def _l2_dumps(data: Any) -> bytes:
+    """Serialize a cached result, tagging dataclasses so they can be rebuilt"""
+    type_name = type(data).__name__
+    if type_name in _L2_TYPES:
+        return orjson.dumps({"type": type_name, "data": asdict(data)})
+    return orjson.dumps({"type": None, "data": data})
+
+
+def _l2_loads(raw: bytes) -> Any:
+    """Rebuild a cached result serialized by _l2_dumps"""
+    payload = orjson.loads(raw)
+    data = payload["data"]
+    if payload["type"] == "MarketInsight":
+        data["analysis_date"] = datetime.fromisoformat(data["analysis_date"])
+    if payload["type"] in _L2_TYPES:
+        return _L2_TYPES[payload["type"]](**data)
+    return data
+
+
 class PerplexityService:
     """Service for AI-powered market analysis using Perplexity API"""
     
     def __init__(self, api_key: str = None):
         self.api_key = api_key or settings.PERPLEXITY_API_KEY
         self.base_url = "https://api.perplexity.ai"
-        self.client = httpx.AsyncClient(timeout=30.0)  # Reduced from 120s for better UX
         
         # Model configuration
-        self.model = "sonar"  # Advanced search model with enhanced citations
+        self.model = "sonar"  # Fast search model for simple/standard queries
+        self.deep_model = "sonar-pro"  # Advanced search model with enhanced citations
         self.max_tokens = 4000
         
         # Cache for recent queries to avoid duplicate API calls
-        self._cache = {}
-        self._cache_duration = timedelta(hours=6)  # Cache for 6 hours
+        # LRU order in the OrderedDict, expiry tracked in a min-heap of monotonic deadlines
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._cache_ttl_seconds = 6 * 3600.0  # Cache for 6 hours
+        self._cache_max_size = 100
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive/HTTP2 pool for this API key on the running event loop; outlives this instance"""
+        return _get_client(self.api_key)
     
     async def analyze_vehicle_market(self, vehicle: Vehicle, location_state: str = None) -> MarketInsight:
         """
@@ -84,40 +372,38 @@ class PerplexityService:
             """
             
             # Check cache first
-            cache_key = f"market_analysis_{vehicle.make}_{vehicle.model}_{vehicle.year}_{vehicle.mileage//1000}k_{location_state}"
-            cached_result = self._get_cached_result(cache_key)
+            cache_key = self._vehicle_cache_key("market_analysis", vehicle, location_state=(location_state or "").strip().lower())
+            cached_result = await self._get_cached_result(cache_key)
             
             if cached_result:
                 logger.info(f"Using cached market analysis for {vehicle.year} {vehicle.make} {vehicle.model}")
                 return cached_result
             
-            # Get AI analysis
-            response = await self._query_perplexity(query)
-            
-            if not response["success"]:
-                raise Exception(f"Perplexity API error: {response['error']}")
-            
-            # Parse the response
-            insight = self._parse_market_analysis(response["data"], vehicle, location_state)
-            
-            # Cache the result
-            self._cache_result(cache_key, insight)
-            
-            logger.info(f"Generated market analysis for {vehicle.year} {vehicle.make} {vehicle.model}")
-            return insight
+            async with self._key_lock(cache_key):
+                # Another coroutine may have fetched this while we waited for the lock
+                cached_result = await self._get_cached_result(cache_key)
+                if cached_result:
+                    return cached_result
+                
+                # Get AI analysis
+                response = await self._query_perplexity(query, model=self.deep_model, max_tokens=1200)
+                
+                if not response["success"]:
+                    raise Exception(f"Perplexity API error: {response['error']}")
+                
+                # Parse the response
+                insight = self._parse_market_analysis(response["data"], vehicle, location_state)
+                
+                # Cache the result
+                await self._cache_result(cache_key, insight)
+                
+                logger.info(f"Generated market analysis for {vehicle.year} {vehicle.make} {vehicle.model}")
+                return insight
             
         except Exception as e:
             logger.error(f"Error analyzing vehicle market: {str(e)}")
             # Return a basic insight with error indication
-            return MarketInsight(
-                vehicle_info=f"{vehicle.year} {vehicle.make} {vehicle.model}",
-                market_value_range=None,
-                market_conditions=f"Analysis unavailable: {str(e)}",
-                regional_factors=[],
-                confidence_score=0.0,
-                sources=[],
-                analysis_date=datetime.utcnow()
-            )
+            return self._fallback_market_insight(vehicle, e)
     
     async def get_competitive_pricing(self, vehicle: Vehicle, radius_miles: int = 100) -> CompetitiveAnalysis:
         """
@@ -146,33 +432,33 @@ class PerplexityService:
             """
             
             # Check cache
-            cache_key = f"competitive_pricing_{vehicle.make}_{vehicle.model}_{vehicle.year}_{vehicle.mileage//1000}k"
-            cached_result = self._get_cached_result(cache_key)
+            cache_key = self._vehicle_cache_key("competitive_pricing", vehicle)
+            cached_result = await self._get_cached_result(cache_key)
             
             if cached_result:
                 return cached_result
             
-            response = await self._query_perplexity(query)
-            
-            if not response["success"]:
-                raise Exception(f"Perplexity API error: {response['error']}")
-            
-            analysis = self._parse_competitive_analysis(response["data"], vehicle)
-            
-            # Cache result
-            self._cache_result(cache_key, analysis)
-            
-            return analysis
+            async with self._key_lock(cache_key):
+                # Another coroutine may have fetched this while we waited for the lock
+                cached_result = await self._get_cached_result(cache_key)
+                if cached_result:
+                    return cached_result
+                
+                response = await self._query_perplexity(query, max_tokens=800)
+                
+                if not response["success"]:
+                    raise Exception(f"Perplexity API error: {response['error']}")
+                
+                analysis = self._parse_competitive_analysis(response["data"], vehicle)
+                
+                # Cache result
+                await self._cache_result(cache_key, analysis)
+                
+                return analysis
             
         except Exception as e:
             logger.error(f"Error getting competitive pricing: {str(e)}")
-            return CompetitiveAnalysis(
-                average_market_price=vehicle.price,  # Fallback to listed price
-                price_range={"min": vehicle.price * 0.9, "max": vehicle.price * 1.1},
-                comparable_listings=[],
-                market_trend="unknown",
-                days_on_market_avg=None
-            )
+            return self._fallback_competitive_analysis(vehicle)
     
     async def analyze_resale_potential(self, vehicle: Vehicle, target_market: str = "Southeast") -> Dict[str, Any]:
         """
@@ -201,7 +487,7 @@ class PerplexityService:
             Provide insights on optimal resale timing and pricing strategy.
             """
             
-            response = await self._query_perplexity(query)
+            response = await self._query_perplexity(query, max_tokens=1000)
             
             if not response["success"]:
                 raise Exception(f"Perplexity API error: {response['error']}")
@@ -210,12 +496,7 @@ class PerplexityService:
             
         except Exception as e:
             logger.error(f"Error analyzing resale potential: {str(e)}")
-            return {
-                "resale_score": 0.5,
-                "factors": [f"Analysis unavailable: {str(e)}"],
-                "optimal_timing": "unknown",
-                "pricing_strategy": "market_rate"
-            }
+            return self._fallback_resale_analysis(e)
     
     async def research_market_trends(self, make: str, model: str = None, timeframe: str = "6 months") -> Dict[str, Any]:
         """
@@ -245,23 +526,29 @@ class PerplexityService:
             Focus on data that would help with buying and reselling decisions.
             """
             
-            cache_key = f"market_trends_{make}_{model or 'all'}_{timeframe}"
-            cached_result = self._get_cached_result(cache_key)
+            cache_key = self._cache_key("market_trends", make.strip().lower(), (model or "all").strip().lower(), timeframe.strip().lower())
+            cached_result = await self._get_cached_result(cache_key)
             
             if cached_result:
                 return cached_result
             
-            response = await self._query_perplexity(query)
-            
-            if not response["success"]:
-                raise Exception(f"Perplexity API error: {response['error']}")
-            
-            trends = self._parse_market_trends(response["data"])
-            
-            # Cache for longer since trends change slowly
-            self._cache_result(cache_key, trends, duration=timedelta(hours=12))
-            
-            return trends
+            async with self._key_lock(cache_key):
+                # Another coroutine may have fetched this while we waited for the lock
+                cached_result = await self._get_cached_result(cache_key)
+                if cached_result:
+                    return cached_result
+                
+                response = await self._query_perplexity(query, model=self.model, max_tokens=600)
+                
+                if not response["success"]:
+                    raise Exception(f"Perplexity API error: {response['error']}")
+                
+                trends = self._parse_market_trends(response["data"])
+                
+                # Cache for longer since trends change slowly
+                await self._cache_result(cache_key, trends, ttl_seconds=12 * 3600.0)
+                
+                return trends
             
         except Exception as e:
             logger.error(f"Error researching market trends: {str(e)}")
@@ -271,23 +558,145 @@ class PerplexityService:
                 "factors": [f"Analysis unavailable: {str(e)}"]
             }
     
-    async def _query_perplexity(self, query: str, system_prompt: str = None, max_tokens: int = None) -> Dict[str, Any]:
+    async def full_report(self, vehicle: Vehicle, location_state: str = None) -> Dict[str, Any]:
         """
-        Send a query to Perplexity API
+        Run market, competitive pricing and resale analyses concurrently
+        
+        The three analyses are independent, so callers that need all of them
+        should use this instead of awaiting each one in sequence.
+        
+        Args:
+            vehicle: Vehicle to analyze
+            location_state: State for regional market analysis
+            
+        Returns:
+            Dictionary with market_analysis, competitive_pricing and resale_potential
+        """
+        market, competitive, resale = await asyncio.gather(
+            self.analyze_vehicle_market(vehicle, location_state),
+            self.get_competitive_pricing(vehicle),
+            self.analyze_resale_potential(vehicle),
+            return_exceptions=True
+        )
+        
+        # One failed analysis shouldn't discard the others
+        if isinstance(market, Exception):
+            logger.error(f"Error analyzing vehicle market: {str(market)}")
+            market = self._fallback_market_insight(vehicle, market)
+        if isinstance(competitive, Exception):
+            logger.error(f"Error getting competitive pricing: {str(competitive)}")
+            competitive = self._fallback_competitive_analysis(vehicle)
+        if isinstance(resale, Exception):
+            logger.error(f"Error analyzing resale potential: {str(resale)}")
+            resale = self._fallback_resale_analysis(resale)
+        
+        return {
+            "market_analysis": market,
+            "competitive_pricing": competitive,
+            "resale_potential": resale
+        }
+    
+    def _fallback_market_insight(self, vehicle: Vehicle, error: Exception) -> MarketInsight:
+        """Basic market insight returned when analysis fails"""
+        return MarketInsight(
+            vehicle_info=f"{vehicle.year} {vehicle.make} {vehicle.model}",
+            market_value_range=None,
+            market_conditions=f"Analysis unavailable: {str(error)}",
+            regional_factors=[],
+            confidence_score=0.0,
+            sources=[],
+            analysis_date=datetime.utcnow()
+        )
+    
+    def _fallback_competitive_analysis(self, vehicle: Vehicle) -> CompetitiveAnalysis:
+        """Competitive analysis based on the listed price, used when analysis fails"""
+        return CompetitiveAnalysis(
+            average_market_price=vehicle.price,  # Fallback to listed price
+            price_range={"min": vehicle.price * 0.9, "max": vehicle.price * 1.1},
+            comparable_listings=[],
+            market_trend="unknown",
+            days_on_market_avg=None
+        )
+    
+    def _fallback_resale_analysis(self, error: Exception) -> Dict[str, Any]:
+        """Neutral resale analysis returned when analysis fails"""
+        return {
+            "resale_score": 0.5,
+            "factors": [f"Analysis unavailable: {str(error)}"],
+            "optimal_timing": "unknown",
+            "pricing_strategy": "market_rate"
+        }
+    
+    def _select_model(self, query: str) -> Tuple[str, int]:
+        """
+        Pick a model and token budget for a query based on its complexity
+        
+        Simple lookups and standard questions go to the cheaper, faster model;
+        comparisons and in-depth analyses get the advanced model.
+        
+        Returns:
+            (model, max_tokens) tuple
+        """
+        text = " ".join(query.split()).lower()
+        
+        if len(text) < 200 and _SIMPLE_QUERY_RE.search(text):
+            complexity = "simple"
+        elif len(text) > 1500 or _DEEP_QUERY_RE.search(text):
+            complexity = "deep"
+        else:
+            complexity = "standard"
+        
+        return {
+            "simple": (self.model, 512),
+            "standard": (self.model, 1024),
+            "deep": (self.deep_model, self.max_tokens)
+        }[complexity]
+    
+    async def _query_perplexity(self, query: str, system_prompt: str = None, max_tokens: int = None,
+                                model: str = None) -> Dict[str, Any]:
+        """
+        Send a query to Perplexity API, coalescing identical in-flight queries
+        
+        Concurrent callers asking the same question await a single request
+        instead of each paying for a separate API round-trip.
         
         Args:
             query: The research query
             system_prompt: Optional system prompt
+            max_tokens: Optional response token cap (defaults from query complexity)
+            model: Optional model override (defaults from query complexity)
             
         Returns:
             API response
         """
+        # Triple-quoted prompts carry per-line indentation; don't pay tokens for it
+        query = _compact_prompt(query)
+        if system_prompt:
+            system_prompt = _compact_prompt(system_prompt)
+        
+        selected_model, selected_max_tokens = self._select_model(query)
+        model = model or selected_model
+        max_tokens = max_tokens or selected_max_tokens
+        
+        key = hashlib.sha256(orjson.dumps(
+            {"api_key": self.api_key, "q": query, "model": model, "system": system_prompt, "max_tokens": max_tokens},
+            option=orjson.OPT_SORT_KEYS
+        )).hexdigest()
+        
+        task = _INFLIGHT.get(key)
+        if task is not None:
+            logger.debug("Joining in-flight Perplexity query")
+        else:
+            # The fetch runs as its own task, so a caller that's cancelled doesn't fail the others
+            task = asyncio.create_task(self._send_query(query, system_prompt, max_tokens, model))
+            _INFLIGHT[key] = task
+            task.add_done_callback(lambda done: _forget_inflight(key, done))
+        return await asyncio.shield(task)
+    
+    async def _send_query(self, query: str, system_prompt: str = None, max_tokens: int = None,
+                          model: str = None) -> Dict[str, Any]:
+        """Send a single query to the Perplexity chat completions endpoint"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             messages = []
             
             if system_prompt:
@@ -298,9 +707,7 @@ class PerplexityService:
             else:
                 messages.append({
                     "role": "system", 
-                    "content": """You are an expert automotive market analyst specializing in used car 
-                    valuation and market trends. Provide accurate, data-driven insights based on current 
-                    market conditions. Focus on actionable information for car dealers and investors."""
+                    "content": _DEFAULT_SYSTEM_PROMPT
                 })
             
             messages.append({
@@ -309,32 +716,37 @@ class PerplexityService:
             })
             
             payload = {
-                "model": self.model,
+                "model": model or self.model,
                 "messages": messages,
                 "max_tokens": max_tokens or self.max_tokens,  # Use custom max_tokens if provided
                 "temperature": 0.2,  # Lower temperature for more factual responses
                 "top_p": 0.9,
-                "stream": False
+                "stream": True  # Overlap generation with transfer instead of waiting for the full body
             }
             
-            response = await self.client.post(
+            concurrency = _loop_state().concurrency
+            response = await self._post_with_retry(
                 f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload
+                orjson.dumps(payload),  # Encoded once, reused across retries
+                concurrency
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "data": data
-                }
-            else:
-                logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}"
-                }
+            try:
+                if response.status_code == 200:
+                    data = await self._read_stream(response)
+                    return {
+                        "success": True,
+                        "data": data
+                    }
+                else:
+                    await response.aread()
+                    logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status_code}: {response.text}"
+                    }
+            finally:
+                await response.aclose()
+                concurrency.release()
                 
         except Exception as e:
             logger.error(f"Error querying Perplexity: {str(e)}")
@@ -343,25 +755,110 @@ class PerplexityService:
                 "error": str(e)
             }
     
+    async def _read_stream(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Assemble a streamed (SSE) chat completion into the non-streaming response shape
+        
+        Content deltas are concatenated; metadata such as citations and usage
+        is taken from the latest chunk that carries it.
+        """
+        buffer = io.StringIO()
+        data: Dict[str, Any] = {}
+        finish_reason = None
+        
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            chunk_text = line[5:].strip()
+            if chunk_text == "[DONE]":
+                break
+            
+            chunk = orjson.loads(chunk_text)
+            for field_name in ("id", "model", "created", "usage", "citations"):
+                if chunk.get(field_name):
+                    data[field_name] = chunk[field_name]
+            
+            choices = chunk.get("choices") or []
+            if choices:
+                delta = choices[0].get("delta") or {}
+                if delta.get("content"):
+                    buffer.write(delta["content"])
+                finish_reason = choices[0].get("finish_reason") or finish_reason
+        
+        data["choices"] = [{
+            "index": 0,
+            "message": {"role": "assistant", "content": buffer.getvalue()},
+            "finish_reason": finish_reason
+        }]
+        return data
+    
+    async def _post_with_retry(self, url: str, body: bytes, concurrency: asyncio.Semaphore,
+                               max_retries: int = 5) -> httpx.Response:
+        """
+        POST to Perplexity, retrying rate limits and server errors
+        
+        429 responses wait for Retry-After when given; 429/5xx otherwise back off
+        exponentially with jitter. Other responses are returned immediately, and
+        the last response is returned once retries are exhausted.
+        
+        Each attempt waits for a rate-limit slot before taking a `concurrency`
+        slot, and the slot is given back during backoff, so waiting callers
+        don't hold one while idle.
+        
+        The response is opened in streaming mode and still holds its
+        `concurrency` slot; the caller must close it and release the slot.
+        """
+        for attempt in range(max_retries):
+            await _acquire_rate_slot()
+            await concurrency.acquire()
+            try:
+                request = self.client.build_request("POST", url, content=body)
+                response = await self.client.send(request, stream=True)
+            except BaseException:
+                concurrency.release()
+                raise
+            
+            status = response.status_code
+            if status != 429 and status < 500:
+                return response
+            if attempt == max_retries - 1:
+                break
+            await response.aclose()
+            concurrency.release()
+            
+            delay = min(1.0 * (2 ** attempt) + random.random() * 0.5, MAX_BACKOFF_SECONDS)
+            retry_after = response.headers.get("retry-after")
+            if status == 429 and retry_after:
+                try:
+                    delay = min(float(retry_after), MAX_BACKOFF_SECONDS)
+                except ValueError:
+                    pass
+            
+            logger.warning(f"Perplexity API returned {status} (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        return response
+    
     def _parse_market_analysis(self, api_response: Dict[str, Any], vehicle: Vehicle, location: str) -> MarketInsight:
         """Parse market analysis from API response"""
         try:
             content = api_response["choices"][0]["message"]["content"]
+            parsed = _ParsedContent.from_text(content)
             
             # Extract market value range using regex
-            value_range = self._extract_price_range(content)
+            value_range = self._extract_price_range(parsed)
             
             # Extract market conditions
-            conditions = self._extract_market_conditions(content)
+            conditions = self._extract_market_conditions(parsed)
             
             # Extract regional factors
-            regional_factors = self._extract_regional_factors(content)
+            regional_factors = self._extract_regional_factors(parsed)
             
             # Calculate confidence based on specificity of response
-            confidence = self._calculate_confidence(content)
+            confidence = self._calculate_confidence(parsed)
             
             # Extract sources (if available)
-            sources = self._extract_sources(content)
+            sources = self._extract_sources(parsed)
             
             return MarketInsight(
                 vehicle_info=f"{vehicle.year} {vehicle.make} {vehicle.model}",
@@ -389,21 +886,22 @@ class PerplexityService:
         """Parse competitive analysis from API response"""
         try:
             content = api_response["choices"][0]["message"]["content"]
+            parsed = _ParsedContent.from_text(content)
             
             # Extract average price
-            avg_price = self._extract_average_price(content) or vehicle.price
+            avg_price = self._extract_average_price(parsed) or vehicle.price
             
             # Extract price range
-            price_range = self._extract_price_range(content) or {
+            price_range = self._extract_price_range(parsed) or {
                 "min": avg_price * 0.85,
                 "max": avg_price * 1.15
             }
             
             # Extract market trend
-            trend = self._extract_market_trend(content)
+            trend = self._extract_market_trend(parsed)
             
             # Extract days on market
-            days_on_market = self._extract_days_on_market(content)
+            days_on_market = self._extract_days_on_market(parsed)
             
             return CompetitiveAnalysis(
                 average_market_price=avg_price,
@@ -427,12 +925,13 @@ class PerplexityService:
         """Parse resale potential analysis"""
         try:
             content = api_response["choices"][0]["message"]["content"]
+            parsed = _ParsedContent.from_text(content)
             
             return {
-                "resale_score": self._extract_resale_score(content),
-                "factors": self._extract_resale_factors(content),
-                "optimal_timing": self._extract_optimal_timing(content),
-                "pricing_strategy": self._extract_pricing_strategy(content),
+                "resale_score": self._extract_resale_score(parsed),
+                "factors": self._extract_resale_factors(parsed),
+                "optimal_timing": self._extract_optimal_timing(parsed),
+                "pricing_strategy": self._extract_pricing_strategy(parsed),
                 "analysis_text": content
             }
             
@@ -449,12 +948,14 @@ class PerplexityService:
         """Parse market trends analysis"""
         try:
             content = api_response["choices"][0]["message"]["content"]
+            parsed = _ParsedContent.from_text(content)
+            factors, seasonal_patterns = self._analyze_trend_sentences(parsed)
             
             return {
-                "trend_direction": self._extract_trend_direction(content),
-                "confidence": self._calculate_confidence(content),
-                "factors": self._extract_trend_factors(content),
-                "seasonal_patterns": self._extract_seasonal_patterns(content),
+                "trend_direction": self._extract_market_trend(parsed),
+                "confidence": self._calculate_confidence(parsed),
+                "factors": factors,
+                "seasonal_patterns": seasonal_patterns,
                 "analysis_text": content
             }
             
@@ -466,192 +967,107 @@ class PerplexityService:
                 "factors": ["Analysis parsing failed"]
             }
     
-    def _extract_price_range(self, content: str) -> Optional[Dict[str, float]]:
+    def _extract_price_range(self, parsed: _ParsedContent) -> Optional[Dict[str, float]]:
         """Extract price range from analysis text"""
-        import re
-        
         # Look for patterns like "$15,000 - $18,000" or "15k to 18k"
-        price_patterns = [
-            r'\$([0-9,]+)\s*(?:-|to)\s*\$([0-9,]+)',
-            r'([0-9]+)k\s*(?:-|to)\s*([0-9]+)k',
-            r'low:\s*\$([0-9,]+).*high:\s*\$([0-9,]+)',
-            r'range.*\$([0-9,]+).*\$([0-9,]+)'
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                try:
-                    match = matches[0]
-                    if 'k' in pattern:
-                        min_price = float(match[0]) * 1000
-                        max_price = float(match[1]) * 1000
-                    else:
-                        min_price = float(match[0].replace(',', ''))
-                        max_price = float(match[1].replace(',', ''))
-                    
-                    # Calculate average
-                    avg_price = (min_price + max_price) / 2
-                    
-                    return {
-                        "min": min_price,
-                        "max": max_price,
-                        "average": avg_price
-                    }
-                except (ValueError, IndexError):
-                    continue
+        for index, match in parsed.field_matches("price_range"):
+            try:
+                if index == 1:  # "15k to 18k"
+                    min_price = float(match[0]) * 1000
+                    max_price = float(match[1]) * 1000
+                else:
+                    min_price = float(match[0].replace(',', ''))
+                    max_price = float(match[1].replace(',', ''))
+                
+                # Calculate average
+                avg_price = (min_price + max_price) / 2
+                
+                return {
+                    "min": min_price,
+                    "max": max_price,
+                    "average": avg_price
+                }
+            except (ValueError, IndexError):
+                continue
         
         return None
     
-    def _extract_average_price(self, content: str) -> Optional[float]:
+    def _extract_average_price(self, parsed: _ParsedContent) -> Optional[float]:
         """Extract average market price from text"""
-        import re
-        
-        avg_patterns = [
-            r'average.*\$([0-9,]+)',
-            r'typical.*\$([0-9,]+)',
-            r'median.*\$([0-9,]+)'
-        ]
-        
-        for pattern in avg_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    return float(match.group(1).replace(',', ''))
-                except ValueError:
-                    continue
+        for _, match in parsed.field_matches("avg_price"):
+            try:
+                return float(match[0].replace(',', ''))
+            except ValueError:
+                continue
         
         return None
     
-    def _extract_market_conditions(self, content: str) -> str:
+    def _extract_market_conditions(self, parsed: _ParsedContent) -> str:
         """Extract market conditions summary"""
         # Look for key phrases about market conditions
-        conditions_indicators = [
-            "market conditions", "current market", "market situation", 
-            "demand", "supply", "pricing trends"
-        ]
-        
-        sentences = content.split('.')
-        relevant_sentences = []
-        
-        for sentence in sentences:
-            if any(indicator in sentence.lower() for indicator in conditions_indicators):
-                relevant_sentences.append(sentence.strip())
+        relevant_sentences = [parsed.sentences[i].strip() for i in parsed.matching_sentences(_CONDITIONS_RE)[:3]]
         
-        return '. '.join(relevant_sentences[:3]) if relevant_sentences else "Market conditions not specified"
+        return '. '.join(relevant_sentences) if relevant_sentences else "Market conditions not specified"
     
-    def _extract_regional_factors(self, content: str) -> List[str]:
+    def _extract_regional_factors(self, parsed: _ParsedContent) -> List[str]:
         """Extract regional factors affecting pricing"""
-        factors = []
-        regional_keywords = [
-            "florida", "georgia", "southeast", "regional", "local", 
-            "weather", "climate", "hurricane", "seasonal"
-        ]
-        
-        sentences = content.lower().split('.')
-        for sentence in sentences:
-            if any(keyword in sentence for keyword in regional_keywords):
-                factors.append(sentence.strip().capitalize())
-        
-        return factors[:5]  # Limit to top 5 factors
+        # Limit to top 5 factors
+        return [parsed.lower_sentences[i].strip().capitalize() for i in parsed.matching_sentences(_REGIONAL_RE)[:5]]
     
-    def _extract_market_trend(self, content: str) -> str:
+    def _extract_market_trend(self, parsed: _ParsedContent) -> str:
         """Extract market trend direction"""
-        content_lower = content.lower()
+        content_lower = parsed.lower
         
-        if any(word in content_lower for word in ["increasing", "rising", "upward", "growth"]):
+        if _RISING_RE.search(content_lower):
             return "rising"
-        elif any(word in content_lower for word in ["decreasing", "falling", "declining", "down"]):
+        elif _FALLING_RE.search(content_lower):
             return "falling"
-        elif any(word in content_lower for word in ["stable", "steady", "consistent", "flat"]):
+        elif _STABLE_RE.search(content_lower):
             return "stable"
         else:
             return "unknown"
     
-    def _extract_days_on_market(self, content: str) -> Optional[int]:
+    def _extract_days_on_market(self, parsed: _ParsedContent) -> Optional[int]:
         """Extract average days on market"""
-        import re
-        
-        patterns = [
-            r'([0-9]+)\s*days?\s*on\s*market',
-            r'sell.*([0-9]+)\s*days?',
-            r'([0-9]+)\s*days?.*sell'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    continue
+        for _, match in parsed.field_matches("days"):
+            try:
+                return int(match[0])
+            except ValueError:
+                continue
         
         return None
     
-    def _extract_sources(self, content: str) -> List[str]:
+    def _extract_sources(self, parsed: _ParsedContent) -> List[str]:
         """Extract sources mentioned in the analysis"""
-        sources = []
-        source_patterns = [
-            r'(AutoTrader|Cars\.com|CarGurus|KBB|Kelley Blue Book|Edmunds|NADA)',
-            r'according to ([^,\.]+)',
-            r'source: ([^,\.]+)'
-        ]
-        
-        for pattern in source_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            sources.extend(matches)
+        sources = [match[0] for _, match in parsed.field_matches("source")]
         
         return list(set(sources))[:5]  # Remove duplicates and limit
     
-    def _calculate_confidence(self, content: str) -> float:
+    def _calculate_confidence(self, parsed: _ParsedContent) -> float:
         """Calculate confidence score based on content specificity"""
-        confidence_indicators = [
-            "according to", "data shows", "recent sales", "market data",
-            "statistics", "analysis", "research", "$"
-        ]
-        
-        score = 0.0
-        content_lower = content.lower()
-        
-        for indicator in confidence_indicators:
-            if indicator in content_lower:
-                score += 0.1
+        # One pass over the text; each distinct indicator found adds 0.1
+        indicators_found = {match.group(1) for match in _CONFIDENCE_RE.finditer(parsed.lower)}
+        score = 0.1 * len(indicators_found)
         
         # Bonus for specific numbers
-        import re
-        if re.search(r'\$[0-9,]+', content):
+        if parsed.field_matches("dollar"):
             score += 0.2
         
         return min(score, 1.0)  # Cap at 1.0
     
-    def _extract_resale_score(self, content: str) -> float:
+    def _extract_resale_score(self, parsed: _ParsedContent) -> float:
         """Extract or calculate resale potential score"""
         # Look for explicit scores or ratings
-        import re
-        
-        score_patterns = [
-            r'score.*([0-9]\.?[0-9]*)',
-            r'rating.*([0-9]\.?[0-9]*)',
-            r'([0-9])/10',
-            r'([0-9])\.?[0-9]*/5'
-        ]
-        
-        for pattern in score_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    score = float(match.group(1))
-                    return min(score / 10.0, 1.0) if score > 1.0 else score
-                except ValueError:
-                    continue
+        for _, match in parsed.field_matches("score"):
+            try:
+                score = float(match[0])
+                return min(score / 10.0, 1.0) if score > 1.0 else score
+            except ValueError:
+                continue
         
         # If no explicit score, infer from positive/negative language
-        positive_words = ["excellent", "good", "strong", "high", "favorable"]
-        negative_words = ["poor", "weak", "low", "unfavorable", "difficult"]
-        
-        content_lower = content.lower()
-        positive_count = sum(1 for word in positive_words if word in content_lower)
-        negative_count = sum(1 for word in negative_words if word in content_lower)
+        positive_count = len({match.group(1) for match in _POSITIVE_RE.finditer(parsed.lower)})
+        negative_count = len({match.group(1) for match in _NEGATIVE_RE.finditer(parsed.lower)})
         
         if positive_count > negative_count:
             return 0.7
@@ -660,40 +1076,20 @@ class PerplexityService:
         else:
             return 0.5
     
-    def _extract_resale_factors(self, content: str) -> List[str]:
+    def _extract_resale_factors(self, parsed: _ParsedContent) -> List[str]:
         """Extract factors affecting resale"""
-        sentences = content.split('.')
-        factors = []
-        
-        factor_keywords = [
-            "reliability", "maintenance", "depreciation", "demand", 
-            "reputation", "fuel economy", "features", "condition"
-        ]
-        
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in factor_keywords):
-                factors.append(sentence.strip())
-        
-        return factors[:5]
+        return [parsed.sentences[i].strip() for i in parsed.matching_sentences(_RESALE_FACTOR_RE)[:5]]
     
-    def _extract_optimal_timing(self, content: str) -> str:
+    def _extract_optimal_timing(self, parsed: _ParsedContent) -> str:
         """Extract optimal resale timing"""
-        timing_patterns = [
-            r'(spring|summer|fall|winter)',
-            r'([0-9]+)\s*(?:days?|weeks?|months?)',
-            r'(immediately|quickly|soon|later)'
-        ]
-        
-        for pattern in timing_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        for _, match in parsed.field_matches("timing"):
+            return match[0]
         
         return "30-60 days"  # Default
     
-    def _extract_pricing_strategy(self, content: str) -> str:
+    def _extract_pricing_strategy(self, parsed: _ParsedContent) -> str:
         """Extract recommended pricing strategy"""
-        content_lower = content.lower()
+        content_lower = parsed.lower
         
         if "competitive" in content_lower or "below market" in content_lower:
             return "competitive"
@@ -704,58 +1100,135 @@ class PerplexityService:
         else:
             return "market_rate"
     
-    def _extract_trend_direction(self, content: str) -> str:
-        """Extract overall trend direction"""
-        return self._extract_market_trend(content)
-    
-    def _extract_trend_factors(self, content: str) -> List[str]:
-        """Extract factors influencing trends"""
-        return self._extract_regional_factors(content)
-    
-    def _extract_seasonal_patterns(self, content: str) -> List[str]:
-        """Extract seasonal patterns"""
-        seasons = ["spring", "summer", "fall", "winter"]
-        patterns = []
-        
-        for season in seasons:
-            if season in content.lower():
-                # Find the sentence containing the season
-                sentences = content.split('.')
-                for sentence in sentences:
-                    if season in sentence.lower():
-                        patterns.append(f"{season.capitalize()}: {sentence.strip()}")
-                        break
-        
-        return patterns
-    
-    def _get_cached_result(self, key: str) -> Optional[Any]:
-        """Get cached result if still valid"""
-        if key in self._cache:
-            cached_data, timestamp = self._cache[key]
-            if datetime.utcnow() - timestamp < self._cache_duration:
+    def _analyze_trend_sentences(self, parsed: _ParsedContent) -> Tuple[List[str], List[str]]:
+        """
+        Collect trend factors and seasonal patterns from keyword hits
+        
+        Returns:
+            (factors, seasonal_patterns): up to 5 sentences mentioning regional
+            factors, and the first sentence mentioning each season (in season order)
+        """
+        factors = self._extract_regional_factors(parsed)
+        
+        season_sentences: Dict[str, str] = {}
+        seasons, sentence_indices = parsed.sentence_hits(_SEASON_RE)
+        for season, index in zip(seasons, sentence_indices):
+            season_sentences.setdefault(season, parsed.sentences[index].strip())
+        
+        seasonal_patterns = [
+            f"{season.capitalize()}: {season_sentences[season]}"
+            for season in _SEASONS if season in season_sentences
+        ]
+        return factors, seasonal_patterns
+    
+    def _cache_key(self, prefix: str, *parts: Any) -> str:
+        """Hash normalized key parts into a fixed-length cache key"""
+        digest = hashlib.blake2b(repr((prefix, *parts)).encode(), digest_size=16).hexdigest()
+        return f"{prefix}:{digest}"
+    
+    def _vehicle_cache_key(self, prefix: str, vehicle: Vehicle, **extras: Any) -> str:
+        """
+        Build a cache key that is insensitive to make/model case and whitespace
+        
+        Mileage is bucketed to 5k miles since the market answer doesn't change
+        between e.g. 47,123 and 48,901 miles.
+        """
+        return self._cache_key(
+            prefix,
+            vehicle.make.strip().lower(),
+            vehicle.model.strip().lower(),
+            int(vehicle.year),
+            (int(vehicle.mileage) // 5000) * 5000,
+            *sorted(extras.items())
+        )
+    
+    @asynccontextmanager
+    async def _key_lock(self, key: str):
+        """Hold the lock for a cache key; the lock is dropped once no coroutine uses it"""
+        entry = _KEY_LOCKS.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _KEY_LOCKS[key]
+    
+    async def _get_cached_result(self, key: str) -> Optional[Any]:
+        """Get cached result if still valid, falling back to the shared Redis cache"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            cached_data, expiry = entry
+            if expiry > time.monotonic():
+                self._cache.move_to_end(key)
                 return cached_data
-            else:
-                # Remove expired cache entry
-                del self._cache[key]
-        return None
+            
+            # Remove expired cache entry
+            del self._cache[key]
+        
+        redis_client = get_redis()
+        if redis_client is None:
+            return None
+        
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(f"{_L2_KEY_PREFIX}{key}")
+                pipe.ttl(f"{_L2_KEY_PREFIX}{key}")
+                raw, ttl = await pipe.execute()
+            if raw is None or ttl <= 0:
+                return None
+            cached_data = _l2_loads(raw)
+        except Exception as e:
+            logger.debug(f"Perplexity L2 cache read failed for {key}: {e}")
+            return None
+        
+        # Hydrate L1 for the remaining lifetime of the L2 entry
+        self._cache_local(key, cached_data, ttl)
+        return cached_data
     
-    def _cache_result(self, key: str, data: Any, duration: timedelta = None) -> None:
-        """Cache result with timestamp"""
-        self._cache[key] = (data, datetime.utcnow())
+    async def _cache_result(self, key: str, data: Any, ttl_seconds: float = None) -> None:
+        """Cache result in memory and in the shared Redis cache (if connected)"""
+        ttl_seconds = ttl_seconds or self._cache_ttl_seconds
+        self._cache_local(key, data, ttl_seconds)
+        
+        redis_client = get_redis()
+        if redis_client is None:
+            return
         
-        # Clean old cache entries periodically
-        if len(self._cache) > 100:
-            cutoff = datetime.utcnow() - (duration or self._cache_duration)
-            expired_keys = [
-                k for k, (_, timestamp) in self._cache.items()
-                if timestamp < cutoff
-            ]
-            for k in expired_keys:
-                del self._cache[k]
+        try:
+            await redis_client.setex(f"{_L2_KEY_PREFIX}{key}", int(ttl_seconds), _l2_dumps(data))
+        except Exception as e:
+            logger.debug(f"Perplexity L2 cache write failed for {key}: {e}")
+    
+    def _cache_local(self, key: str, data: Any, ttl_seconds: float) -> None:
+        """Cache result in the in-memory LRU with an expiry deadline"""
+        now = time.monotonic()
+        expiry = now + ttl_seconds
+        self._cache[key] = (data, expiry)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        
+        # Drop expired entries from the head of the heap (skipping stale heap records
+        # for keys that were re-cached or evicted since)
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expired_at, expired_key = heapq.heappop(self._expiry_heap)
+            entry = self._cache.get(expired_key)
+            if entry is not None and entry[1] == expired_at:
+                del self._cache[expired_key]
+        
+        # Evict least recently used entries beyond the size cap
+        while len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+        
+        # Keep the heap from accumulating stale records indefinitely
+        if len(self._expiry_heap) > 2 * self._cache_max_size:
+            self._expiry_heap = [(expiry, k) for k, (_, expiry) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
     
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """No-op: the shared HTTP client pool outlives service instances (see close_perplexity_clients)"""
+        return None
 
 
 # Helper function to create service instance
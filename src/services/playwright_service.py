@@ -6,17 +6,684 @@ for reliable automation, form interaction, and data extraction.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import inspect
+import re
+import time
+import types
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Locator, Page, Route
 
 from src.core.config import settings
 from src.models.schemas import SearchCriteria
 from src.services.firecrawl_service import ScrapingResult  # Reuse the same result format
+from src.services import http_api_service
 
 
+def _disable_api_stack_capture() -> None:
+    """
+    Stop playwright-python from calling inspect.stack() on every API call
+    
+    The connection layer walks (and reads the source of) the whole Python stack
+    for each locator/page call just to label traces, which dominates CPU on
+    locator-heavy scrapes. Only the connection module's view of `inspect` is
+    replaced, so the rest of the process is unaffected.
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return
+    
+    if not hasattr(getattr(_connection, "inspect", None), "stack"):
+        logger.debug("🎭 Playwright internals changed; leaving API stack capture enabled")
+        return
+    
+    no_stack_inspect = types.ModuleType("inspect")
+    no_stack_inspect.__dict__.update(inspect.__dict__)
+    no_stack_inspect.stack = lambda *args, **kwargs: []
+    _connection.inspect = no_stack_inspect
+
+
+if not settings.PLAYWRIGHT_CAPTURE_API_STACKS:
+    _disable_api_stack_capture()
+
+
+# Subresources the scrapers never read; aborting them saves bandwidth and render work
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_HOSTS = (
+    "doubleclick",
+    "googletagmanager",
+    "googlesyndication",
+    "google-analytics",
+    "scorecardresearch",
+    "facebook.net",
+    "adsystem",  # amazon-adsystem and similar ad exchanges
+    "segment.com",
+    "segment.io",
+)
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort images/media/fonts/stylesheets and ad/analytics requests, continue everything else"""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(host in request.url for host in _BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Prefixes for relative listing links
+_CARS_COM_BASE_URL = "https://www.cars.com"
+_EDMUNDS_BASE_URL = "https://www.edmunds.com"
+
+# Elements that signal a Cars.com page is ready for the next step
+_CARS_COM_SEARCH_READY = 'input[name="one_hitter"], input[data-testid="sitewide-search-filter-text"]'
+_CARS_COM_RESULT_CARDS = (
+    'article[data-tracking-id*="srp_listing"], article[data-qa="vehicle_card"], '
+    'div[data-testid*="listing"], .vehicle-card, div[data-listing-id]'
+)
+
+# Elements that signal an Edmunds page (search or results) is ready
+_EDMUNDS_LISTINGS = '.inventory-listing, .vehicle-card, .listing-card, [data-testid*="vehicle"]'
+_EDMUNDS_PAGE_READY = f'textarea[name="query"], .global-search-input, {_EDMUNDS_LISTINGS}'
+
+# Patterns applied to every listing card
+_PRICE_RE = re.compile(r'\$([0-9,]+)')
+_MILEAGE_RE = re.compile(r'([0-9,]+)')
+_YEAR_RE = re.compile(r'\b(20[0-2][0-9])\b')
+_FOUR_DIGITS_RE = re.compile(r'^\d{4}$')
+_TITLE_RE = re.compile(r'\s*(20[0-2]\d|2030)\s+(\S+)\s+(\S+)')  # "2019 Honda Accord EX" -> year, make, model
+_PAGE_PARAM_RE = re.compile(r'page=(\d+)')
+# Accessible names/placeholders for the role-based search fallbacks
+_SEARCH_PLACEHOLDER_RE = re.compile(r'make|search', re.IGNORECASE)
+_SEARCH_BUTTON_NAME_RE = re.compile(r'search|find', re.IGNORECASE)
+# Words that mark a title candidate as a real listing title (substring match, any case)
+_CARS_COM_TITLE_KEYWORDS_RE = re.compile(r'honda|accord|201[6-9]|202[01]', re.IGNORECASE)
+_EDMUNDS_TITLE_KEYWORDS_RE = re.compile(r'honda|accord|201[6-9]|202[0-5]', re.IGNORECASE)
+
+# Makes/models recognised in card text when no title selector matched, in priority order
+_FALLBACK_MAKES = (
+    'Honda', 'Toyota', 'BMW', 'Mercedes', 'Audi', 'Lexus', 'Acura', 'Infiniti',
+    'Volkswagen', 'Nissan', 'Hyundai', 'Kia', 'Ford', 'Chevrolet', 'Cadillac',
+    'Buick', 'Mazda', 'Subaru', 'Jeep', 'Ram', 'Dodge', 'Chrysler'
+)
+_FALLBACK_MODELS = ('Accord', 'Civic', 'Camry', 'Corolla', 'X3', 'X5', 'X1', 'A4', 'A6', 'ES', 'IS', 'RX')
+# The word following each make, e.g. "Honda Accord"
+_MODEL_AFTER_MAKE_RES = {make: re.compile(rf'{make}\s+([A-Za-z0-9\-]+)', re.IGNORECASE) for make in _FALLBACK_MAKES}
+
+# Cars.com selector lists, in priority order
+_CARS_COM_SEARCH_INPUTS = (
+    'input[name="one_hitter"]',  # Cars.com main search field (PRIORITY)
+    'input[data-testid="sitewide-search-filter-text"]',
+    'input[name="searchTerm"]',
+    'input[placeholder*="make"]',
+    'input[placeholder*="Make"]',
+    'input[placeholder*="Search"]',
+    'input[placeholder*="Enter"]',
+    '.search-input',
+    '#search-input',
+    '[data-qa="search-input"]',
+    'input[type="search"]',
+    'input[aria-label*="search"]',
+    'input[aria-label*="Search"]',
+    # Modern Cars.com specific selectors
+    'input[data-linkname*="search"]',
+    'input[class*="search"]',
+    'input[id*="search"]'
+)
+_CARS_COM_FILTER_INPUTS = (
+    'input[placeholder*="Make"]',
+    'input[placeholder*="Model"]',
+    'input[name="make"]',
+    'input[name="model"]',
+    'select[name="make"]',
+    'select[name="model"]'
+)
+_CARS_COM_ENTER_INPUTS = ", ".join(_CARS_COM_SEARCH_INPUTS[:3] + ('input[placeholder*="Search"]',))
+_CARS_COM_VEHICLE_CARDS = (
+    # Modern Cars.com selectors (updated for 2024)
+    'article[data-tracking-id*="srp_listing"]',  # Current Cars.com article structure
+    'article[data-qa="vehicle_card"]',           # Alternative Cars.com structure
+    'div[data-testid*="listing"]',               # Modern testid pattern
+    'article[class*="vehicle"]',                 # Article with vehicle in class
+    '[data-cmp="VehicleCard"]',                  # Component-based selector
+    '.sds-card',                                 # Cars.com design system card
+    'article.sds-card',                          # Article with SDS card class
+    
+    # Legacy selectors (fallback)
+    '.vehicle-card',                             # Classic selector
+    'div[data-listing-id]',                      # Legacy data attribute
+    '[data-tracking-type="srp-vehicle-card"]',   # Old tracking
+    '.vehicle-cards .vehicle-card',              # Nested structure
+    '[id^="vehicle-card-"]',                     # ID-based selector
+    
+    # Generic fallback selectors
+    '.listing',
+    '.vehicle-listing',
+    '.car-listing',
+    '.search-result',
+    'article',                                   # Any article element
+    '[class*="card"]'                            # Any element with card in class
+)
+
+# Cars.com card field selectors, in priority order
+_CARS_COM_PRICE_SELECTORS = (
+    # Modern Cars.com 2024+ selectors
+    '.sds-card__price',                      # Cars.com design system price
+    '.sds-card__pricing .sds-card__price',   # Nested price structure
+    '[data-cmp="VehicleCard"] .sds-card__price', # Component-based price
+    '[class*="price"] span',                  # Price span elements
+
+    # Legacy Cars.com selectors
+    '.price-section .primary-price',         # Classic Cars.com price
+    '.price-section-vehicle-card .primary-price', # Specific Cars.com path
+    '.price-section',                        # Cars.com price container
+    '.vehicle-card .price',                  # Generic price in card
+
+    # Generic fallback selectors
+    '[data-testid="listing-price"]',         # Test ID
+    '.price',                                # Basic price class
+    '.listing-price',                        # Listing price
+    '.vehicle-price',                        # Vehicle price
+    '[class*="price"]',                      # Any class with "price"
+    ':has-text("$")'                         # Any element with $
+)
+
+_CARS_COM_TITLE_SELECTORS = (
+    # Modern Cars.com 2024+ selectors
+    '.sds-card__title',                      # Cars.com design system title
+    '.sds-card__header .sds-card__title',    # Nested title structure
+    'h3.sds-card__title',                    # H3 with SDS title class
+    '[data-cmp="VehicleCard"] .sds-card__title', # Component title
+    'article h3',                            # Article heading
+    'article h2',                            # Article secondary heading
+
+    # Legacy Cars.com selectors
+    '.vehicle-card-link',                    # Classic Cars.com vehicle link
+    '.vehicle-card h3',                      # Cars.com title structure
+    '.vehicle-card h2',                      # Alternative Cars.com title
+    '.vehicle-details .vehicle-info',        # Cars.com vehicle info section
+
+    # Generic fallback selectors
+    '[data-testid="listing-title"]',         # Test ID
+    '.listing-title',                        # Listing title
+    '.vehicle-title',                        # Vehicle title
+    '.car-title',                            # Car title
+    'h2', 'h3', 'h4',                       # Any heading
+    'a[href*="vehicle"]',                    # Links to vehicle pages
+    'a[href*="listing"]'                     # Links to listing pages
+)
+
+_CARS_COM_MILEAGE_SELECTORS = (
+    # Modern Cars.com 2024+ selectors
+    '.sds-card__mileage',                    # Cars.com design system mileage
+    '.sds-card__extra',                      # Cars.com extra info (may contain mileage)
+    '[data-cmp="VehicleCard"] .sds-card__mileage', # Component mileage
+    'span:has-text("mi")',                   # Span containing "mi"
+    'span:has-text("miles")',                # Span containing "miles"
+
+    # Legacy Cars.com selectors
+    '.vehicle-card .mileage',                # Cars.com mileage class
+    '.vehicle-details .mileage',             # Cars.com vehicle details
+    '.vehicle-card-main .mileage',           # Cars.com card main section
+
+    # Generic fallback selectors
+    '[data-testid="listing-mileage"]',       # Test ID
+    '.mileage',                              # Basic mileage class
+    '.listing-mileage',                      # Listing mileage
+    ':has-text("miles")',                    # Text containing "miles"
+    ':has-text("mi")',                       # Text containing "mi"
+    '[class*="mileage"]'                     # Any class with "mileage"
+)
+
+_CARS_COM_LOCATION_SELECTORS = (
+    # Modern Cars.com 2024+ selectors
+    '.sds-card__extra span',                 # Cars.com extra info span
+    '[data-cmp="VehicleCard"] .location',    # Component location
+    'span:has-text(",")span:has-text("CA")', # State abbreviations
+    'span:has-text(",")span:has-text("FL")', # State abbreviations
+    'span:has-text(",")span:has-text("TX")', # State abbreviations
+
+    # Legacy Cars.com selectors
+    '[data-testid="listing-dealer-city-state"]', # Test ID
+    '.location',                             # Basic location class
+    '.dealer-location',                      # Dealer location
+    '.listing-location',                     # Listing location
+
+    # Generic fallback selectors
+    '[class*="location"]',                   # Any class with "location"
+    ':has-text("," )',                       # Text with comma (city, state)
+    'span[title*="location"]'                # Span with location in title
+)
+
+_CARS_COM_LINK_SELECTORS = (
+    # Modern Cars.com 2024+ selectors
+    '.sds-card__link',                       # Cars.com design system link
+    'article a[href*="/vehicle"]',           # Article with vehicle link
+    'a[data-tracking-id*="srp_listing"]',    # Tracking-based link
+    'a[data-cmp="VehicleCard"]',             # Component-based link
+    'a.sds-card__link',                      # SDS card link class
+
+    # Legacy Cars.com selectors
+    'a.vehicle-card-link',                   # Classic Cars.com link
+    'a[href*="/vehicledetail/"]',            # Legacy vehicle detail URLs
+    '.vehicle-card-link',                    # Cars.com link class
+    'a[data-linkname="vehicle-listing"]',    # Cars.com tracking attribute
+
+    # Generic fallback selectors
+    'a[href*="/vehicle/"]',                  # Generic vehicle URLs
+    'a[href*="/listing/"]',                  # Generic listing URLs
+    'a[href*="/shopping/"]',                 # Shopping URLs
+    'a[href*="cars.com"]',                   # Cars.com URLs
+    'a'                                      # Fallback to any link
+)
+_CARS_COM_MAKE_INPUTS = (
+    'select[name="make"]',
+    'input[name="make"]',
+    'select[placeholder*="Make"]',
+    'input[placeholder*="Make"]',
+    'select[data-qa*="make"]',
+    'input[data-qa*="make"]',
+    # Cars.com specific
+    'input[name="one_hitter"]'  # Main search field on Cars.com
+)
+_CARS_COM_MODEL_INPUTS = (
+    'select[name="model"]',
+    'input[name="model"]',
+    'select[placeholder*="Model"]',
+    'input[placeholder*="Model"]',
+    'select[data-qa*="model"]',
+    'input[data-qa*="model"]'
+)
+_CARS_COM_LOCATION_INPUTS = (
+    'input[name="zip"]',  # Cars.com ZIP field (PRIORITY)
+    'input[data-testid="sitewide-search-filter-location"]',
+    'input[name="location"]',
+    'input[placeholder*="location"]',
+    'input[placeholder*="Location"]',
+    'input[placeholder*="zip"]',
+    'input[placeholder*="ZIP"]'
+)
+_CARS_COM_PRICE_MIN_INPUTS = (
+    'input[name="price_min"]',
+    'input[name="priceMin"]',
+    'input[placeholder*="Min price"]',
+    'input[placeholder*="Minimum"]',
+    'select[name="price_min"]'
+)
+_CARS_COM_PRICE_MAX_INPUTS = (
+    'input[name="price_max"]',
+    'input[name="priceMax"]',
+    'input[placeholder*="Max price"]',
+    'input[placeholder*="Maximum"]',
+    'select[name="price_max"]'
+)
+_CARS_COM_YEAR_MIN_INPUTS = (
+    'select[name="year_min"]',
+    'select[name="yearMin"]',
+    'input[name="year_min"]',
+    'select[placeholder*="Min year"]',
+    'select[placeholder*="From year"]'
+)
+_CARS_COM_YEAR_MAX_INPUTS = (
+    'select[name="year_max"]',
+    'select[name="yearMax"]',
+    'input[name="year_max"]',
+    'select[placeholder*="Max year"]',
+    'select[placeholder*="To year"]'
+)
+_CARS_COM_SORT_SELECTS = (
+    'select[name="sort"]',  # Cars.com sort dropdown
+    'select[data-testid="sort-dropdown"]',
+    'select:has(option[value*="price"])',
+    'select:has(option:contains("price"))',
+    '[data-qa="sort-select"]'
+)
+# Lowest-price sort option, by value and then by visible label, in priority order
+_CARS_COM_PRICE_SORT_VALUES = ("price_lowest", "price_asc", "price", "lowest_price", "price-asc")
+_CARS_COM_PRICE_SORT_LABELS = ("Lowest price", "Price: Low to High", "Price (Low to High)", "Price - Low to High")
+_CARS_COM_SEARCH_BUTTONS = (
+    'button[data-testid="sitewide-search-submit"]',
+    'button[type="submit"]',
+    'input[type="submit"]',
+    '.search-button',
+    'button:has-text("Search")',
+    'button:has-text("Find")',
+    '[data-qa="search-button"]'
+)
+_CARS_COM_NEXT_PAGE = (
+    '.sds-pagination__list a[aria-label="Go to next page"]',  # Cars.com specific
+    '.sds-pagination a[aria-label*="next"]',  # Cars.com pagination
+    'a[aria-label="Next Page"]',
+    'a[title="Next"]',
+    'a[aria-label="Go to next page"]',  # Common Cars.com pattern
+    '.pagination a:has-text("Next")',
+    '.pagination [aria-label*="next"]',
+    'button:has-text("Next")',
+    '.sds-pagination a:last-child',  # Cars.com specific pagination
+    '[data-testid="pagination-next"]',
+    '.sds-pagination__list li:last-child a',  # Cars.com pagination structure
+    '.pagination-next a',  # Alternative structure
+    'a:has-text("›")',  # Next arrow symbol
+    'a:has-text("❯")',  # Alternative arrow
+    'a[title*="Next"]'
+)
+_CARS_COM_LOAD_MORE = (
+    'button:has-text("Load more")',
+    'button:has-text("Show more")',
+    'button:has-text("More results")',
+    'a:has-text("Load more")',
+    'a:has-text("Show more")',
+    '[data-testid="load-more"]',
+    '.load-more-button'
+)
+_CARS_COM_CARD_FIELDS = {
+    "price": list(_CARS_COM_PRICE_SELECTORS),
+    "title": list(_CARS_COM_TITLE_SELECTORS),
+    "mileage": list(_CARS_COM_MILEAGE_SELECTORS),
+    "location": list(_CARS_COM_LOCATION_SELECTORS),
+    "url": list(_CARS_COM_LINK_SELECTORS)
+}
+
+# Edmunds selector lists, in priority order
+_EDMUNDS_PRICE_SELECTORS = (
+    '.price',  # Generic price class
+    '.pricing-info .price',  # Edmunds pricing structure
+    '.vehicle-price',  # Vehicle price class
+    '.listing-price',  # Listing price class
+    '[data-testid*="price"]',  # Test ID patterns
+    '.price-display',  # Price display class
+    '.cost',  # Cost class
+    ':has-text("$")'  # Any element containing $
+)
+_EDMUNDS_TITLE_SELECTORS = (
+    '.vehicle-title',  # Edmunds vehicle title
+    '.listing-title',  # Listing title
+    '.vehicle-name',  # Vehicle name
+    '.car-title',  # Car title
+    'h2', 'h3', 'h4',  # Heading tags
+    '.title',  # Generic title
+    '[data-testid*="title"]',  # Test ID patterns
+    'a[href*="/inventory/"]',  # Inventory links
+    'a[href*="/vehicle/"]'  # Vehicle links
+)
+_EDMUNDS_MILEAGE_SELECTORS = (
+    '.mileage',  # Mileage class
+    '.vehicle-mileage',  # Vehicle mileage
+    '.odometer',  # Odometer reading
+    '[data-testid*="mileage"]',  # Test ID patterns
+    ':has-text("miles")',  # Text containing "miles"
+    ':has-text("mi")'  # Text containing "mi"
+)
+_EDMUNDS_LOCATION_SELECTORS = (
+    '.location',  # Location class
+    '.dealer-location',  # Dealer location
+    '.listing-location',  # Listing location
+    '.vehicle-location',  # Vehicle location
+    '[data-testid*="location"]'  # Test ID patterns
+)
+_EDMUNDS_LINK_SELECTORS = (
+    'a[href*="/inventory/"]',  # Edmunds inventory URLs
+    'a[href*="/vehicle/"]',  # Edmunds vehicle URLs
+    'a[href*="/used/"]',  # Used vehicle URLs
+    'a[href*="/new/"]',  # New vehicle URLs
+    '.vehicle-link',  # Vehicle link class
+    '.listing-link',  # Listing link class
+    'a'  # Fallback to any link
+)
+_EDMUNDS_SEARCH_INPUTS = (
+    'textarea[name="query"]',  # Edmunds main search field (PRIORITY)
+    '.global-search-input',  # Edmunds global search class
+    'textarea[placeholder*="looking for"]',  # Edmunds placeholder text
+    'textarea[aria-label="Search:"]',  # Edmunds aria label
+    '.autosized-area-field',  # Edmunds search field class
+    'input[type="search"]',
+    '.search-input',
+    '#search-input'
+)
+_EDMUNDS_SEARCH_BUTTONS = (
+    '.global-search-form button[type="submit"]',
+    '.search-button',
+    'button:has-text("Search")',
+    '[data-tracking-id*="search"]'
+)
+_EDMUNDS_VEHICLE_CARDS = (
+    '.inventory-listing',  # Common Edmunds inventory class
+    '.vehicle-card',  # Standard vehicle card class
+    '.listing-card',  # Alternative listing class
+    '[data-testid*="vehicle"]',  # Test ID patterns
+    '[data-testid*="listing"]',  # Test ID patterns
+    '.search-result',  # Generic search result
+    '.car-listing',  # Car listing class
+    '[class*="listing"]',  # Any class containing "listing"
+    '[class*="vehicle"]',  # Any class containing "vehicle"
+    '.result-item',  # Generic result item
+    '.inventory-item'  # Inventory item class
+)
+_EDMUNDS_NEXT_PAGE = (
+    '.pagination a[aria-label="Next Page"]',  # Edmunds pagination
+    '.pagination a[title="Next"]',
+    'a[aria-label="Go to next page"]',
+    '.pagination a:has-text("Next")',
+    '.pagination [aria-label*="next"]',
+    'button:has-text("Next")',
+    '[data-testid="pagination-next"]',
+    'a:has-text("›")',  # Next arrow symbol
+    'a:has-text("❯")',  # Alternative arrow
+    'a[title*="Next"]'
+)
+_EDMUNDS_CARD_FIELDS = {
+    "price": list(_EDMUNDS_PRICE_SELECTORS),
+    "title": list(_EDMUNDS_TITLE_SELECTORS),
+    "mileage": list(_EDMUNDS_MILEAGE_SELECTORS),
+    "location": list(_EDMUNDS_LOCATION_SELECTORS),
+    "url": list(_EDMUNDS_LINK_SELECTORS)
+}
+
+# "No results" banners on either marketplace, as one Playwright selector list
+_NO_RESULTS = ':has-text("No results"), :has-text("no vehicles"), :has-text("0 results"), .no-results, .empty-results'
+
+# Match count per selector, in one round-trip (0 for selectors the DOM can't parse)
+_COUNT_MATCHES_JS = """selectors => selectors.map(sel => {
+    try {
+        return document.querySelectorAll(sel).length;
+    } catch (e) {
+        return 0;
+    }
+})"""
+
+# Per term, how many elements contain it (case-insensitive, like :has-text), in one round-trip
+_COUNT_TEXT_JS = """texts => {
+    const contents = Array.from(document.querySelectorAll('body, body *'), el => (el.textContent || '').toLowerCase());
+    return texts.map(text => {
+        const needle = text.toLowerCase();
+        return contents.filter(content => content.includes(needle)).length;
+    });
+}"""
+
+# Contents of every JSON-LD script on the page
+_JSON_LD_BLOCKS_JS = """() => Array.from(document.querySelectorAll('script[type="application/ld+json"]'), s => s.textContent || '')"""
+
+# First selector (in list order) that matches anything, resolved in one round-trip
+_FIRST_MATCHING_SELECTOR_JS = """selectors => selectors.find(sel => {
+    try {
+        return document.querySelector(sel) !== null;
+    } catch (e) {
+        return false;
+    }
+}) || null"""
+
+# Type/name/placeholder/visibility of the first 10 inputs, for the search-form debug log
+_DESCRIBE_INPUTS_JS = """() => {
+    const inputs = document.querySelectorAll('input');
+    return [inputs.length, Array.from(inputs).slice(0, 10).map(i => ({
+        type: i.getAttribute('type'),
+        name: i.getAttribute('name'),
+        placeholder: i.getAttribute('placeholder'),
+        visible: !!(i.offsetWidth || i.offsetHeight || i.getClientRects().length)
+    }))];
+}"""
+
+# Card text plus, per field, the first match for each selector: its text (or href for
+# "url"), null when nothing matches, or false for Playwright-only syntax such as :has-text.
+# The HTML/class debug fields (innerHTML serialises the whole card) are only read when `debug`
+_CARD_SNAPSHOT_JS = """(el, [fields, debug]) => {
+    const read = (sel, attr) => {
+        try {
+            const match = el.querySelector(sel);
+            return match ? (attr ? match.getAttribute(attr) : match.textContent) : null;
+        } catch (e) {
+            return false;
+        }
+    };
+    const matches = {};
+    for (const [name, selectors] of Object.entries(fields)) {
+        matches[name] = selectors.map(sel => read(sel, name === 'url' ? 'href' : null));
+    }
+    return {
+        text: el.textContent || '',
+        html: debug ? el.innerHTML.slice(0, 400) : null,
+        classes: debug ? el.getAttribute('class') : null,
+        matches
+    };
+}"""
+
+# Snapshot of a whole result grid (capped at `limit` cards) plus the total card count
+_CARD_SNAPSHOTS_JS = f"""(els, [fields, limit, debug]) => [
+    els.length,
+    els.slice(0, limit).map(el => ({_CARD_SNAPSHOT_JS})(el, [fields, debug]))
+]"""
+
+
+# Text (or the given attribute) of the first element in a locator's matches, null if none;
+# reads a Playwright-only selector in one round-trip, without waiting for it to appear
+_FIRST_ELEMENT_VALUE_JS = """(els, attr) => els.length ? (attr ? els[0].getAttribute(attr) : els[0].textContent) : null"""
+
+
+async def _first_value(locator: Locator, attribute: Optional[str] = None) -> Optional[str]:
+    """Text (or `attribute`) of the locator's first match, or None if nothing matches or the read fails"""
+    try:
+        return await locator.evaluate_all(_FIRST_ELEMENT_VALUE_JS, attribute)
+    except Exception as e:
+        logger.debug(f"🎭 Failed to read {locator}: {str(e)}")
+        return None
+
+
+async def _card_candidates(card, selectors, values, attribute: Optional[str] = None):
+    """
+    Yield (selector, value) pairs in priority order from a card snapshot
+    
+    Values the DOM couldn't resolve (Playwright-only selectors) are looked up
+    through the card locator, lazily, only if no earlier candidate was taken.
+    """
+    for selector, value in zip(selectors, values):
+        if value is False:
+            value = await _first_value(card.locator(selector), attribute)
+        if value:
+            yield selector, value
+
+
+def _scrape_timestamps() -> Tuple[str, str]:
+    """Current UTC time as (ISO `discovered_at`, compact `external_id` suffix), taken once per result page"""
+    now = datetime.utcnow()
+    return now.isoformat(), now.strftime('%Y%m%d_%H%M%S')
+
+
+# First selector (in list order) with a visible match, plus the selectors the DOM couldn't
+# parse (Playwright-only syntax such as :has-text) that were listed ahead of it
+_FIRST_VISIBLE_SELECTOR_JS = """selectors => {
+    const unsupported = [];
+    for (const sel of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(sel);
+        } catch (e) {
+            unsupported.push(sel);
+            continue;
+        }
+        for (const el of elements) {
+            if (el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden') {
+                return [sel, unsupported];
+            }
+        }
+    }
+    return [null, unsupported];
+}"""
+
+
+async def _is_visible(page: Page, selector: str) -> bool:
+    """Whether any element matching a (possibly Playwright-only) selector is visible; invalid selectors count as no match"""
+    try:
+        return await page.locator(f"{selector} >> visible=true").count() > 0
+    except Exception as e:
+        logger.debug(f"🎭 Visibility check failed for {selector}: {str(e)}")
+        return False
+
+
+async def _first_to_appear(page: Page, selectors, timeout_ms: int) -> Optional[str]:
+    """
+    Race separate visibility waits for `selectors`
+    
+    Each selector gets its own locator so an invalid one only fails its own wait.
+    
+    Returns:
+        The first selector to become visible within `timeout_ms` (the earliest
+        listed one if several resolve together), or None
+    """
+    tasks = [
+        asyncio.create_task(page.locator(f"{selector} >> visible=true").first.wait_for(state="visible", timeout=timeout_ms))
+        for selector in selectors
+    ]
+    pending = set(tasks)
+    try:
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for selector, task in zip(selectors, tasks):
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    return selector
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        # Retrieve the failed waits' exceptions so asyncio doesn't log them as unhandled
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                task.exception()
+
+
+async def _first_visible(page: Page, selectors, timeout_ms: int = 500) -> Optional[Tuple[str, Locator]]:
+    """
+    Find the highest-priority selector with a visible element
+    
+    Plain CSS candidates are checked in a single evaluate. Playwright-only
+    candidates listed ahead of the CSS match are then checked one at a time, in
+    order, so they keep their priority. If nothing is visible yet, the
+    Playwright-only candidates are raced as separate locators for up to
+    `timeout_ms`.
+    
+    Returns:
+        (selector, locator of its first visible element), or None
+    """
+    try:
+        selector, unsupported = await page.evaluate(_FIRST_VISIBLE_SELECTOR_JS, list(selectors))
+    except Exception as e:
+        logger.debug(f"🎭 Visibility probe failed: {str(e)}")
+        return None
+    for candidate in unsupported:
+        if await _is_visible(page, candidate):
+            selector = candidate
+            break
+    else:
+        if selector is None and unsupported:
+            selector = await _first_to_appear(page, unsupported, timeout_ms)
+    if selector is None:
+        return None
+    return selector, page.locator(f"{selector} >> visible=true").first
+
 @dataclass
 class PlaywrightConfig:
     """Configuration for Playwright scraping"""
@@ -25,34 +692,78 @@ class PlaywrightConfig:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     viewport_width: int = 1920
     viewport_height: int = 1080
+    max_concurrent_pages: int = 3  # Pages open at once in the shared context
+    recycle_context_every: int = 50  # Fresh context after this many pages (long-lived contexts leak memory)
+    page_pool_size: int = 2  # Idle pages kept per marketplace for reuse
+
+
+@dataclass
+class _LoopState:
+    """Playwright driver, shared browsers and launch lock bound to one event loop"""
+    playwright: Any = None
+    # One browser per headless mode, shared by every service instance; instances only own their contexts
+    browsers: Dict[bool, Browser] = field(default_factory=dict)
+    launch_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# The driver's transport is bound to the loop that started it, and scripts call asyncio.run
+# more than once, so each loop gets its own driver and browsers; entries go away with their loop
+_LOOP_STATES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+
+def _loop_state() -> _LoopState:
+    """Get (or lazily create) the shared state for the running event loop"""
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATES.get(loop)
+    if state is None:
+        state = _LOOP_STATES[loop] = _LoopState()
+    return state
 
 
 class PlaywrightScrapingService:
     """Service for scraping vehicle data using Playwright automation"""
     
+    # Recent successful results by search key, shared across instances (LRU order, monotonic expiry)
+    _result_cache: "OrderedDict[tuple, Tuple[float, ScrapingResult]]" = OrderedDict()
+    _result_cache_ttl_seconds = 300.0
+    _result_cache_max_size = 1024
+    
+    # Marketplace configurations, shared by every instance; "scraper" names the method search_marketplace dispatches to
+    marketplaces = {
+        "cars_com": {
+            "name": "Cars.com",
+            "url": "https://www.cars.com/shopping/",
+            "base_url": _CARS_COM_BASE_URL,
+            "source": "cars.com",
+            "scraper": "_scrape_cars_com",
+            "supports_automation": True
+        },
+        "edmunds": {
+            "name": "Edmunds",
+            "url": "https://www.edmunds.com/inventory/",
+            "scraper": "_scrape_edmunds",
+            "supports_automation": True
+        },
+        "cargurus": {
+            "name": "CarGurus", 
+            "url": "https://www.cargurus.com/Cars/",
+            "scraper": "_scrape_cargurus",
+            "supports_automation": False  # Scraper not implemented yet
+        }
+    }
+    
     def __init__(self, config: PlaywrightConfig = None):
         self.config = config or PlaywrightConfig()
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self._page_semaphore = asyncio.Semaphore(self.config.max_concurrent_pages)
+        self._context_lock = asyncio.Lock()
+        self._pages_since_recycle = 0
+        self._page_pools: Dict[str, asyncio.Queue] = {}
         
-        # Marketplace configurations
-        self.marketplaces = {
-            "cars_com": {
-                "name": "Cars.com",
-                "url": "https://www.cars.com/shopping/",
-                "supports_automation": True
-            },
-            "edmunds": {
-                "name": "Edmunds",
-                "url": "https://www.edmunds.com/inventory/",
-                "supports_automation": True
-            },
-            "cargurus": {
-                "name": "CarGurus", 
-                "url": "https://www.cargurus.com/Cars/",
-                "supports_automation": True
-            }
-        }
+        # Running average search duration per marketplace (seconds), seeded with rough
+        # priors; run_batch uses it to start the longest jobs first
+        self._avg_search_seconds = {"cars_com": 30.0, "edmunds": 20.0, "cargurus": 5.0}
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -64,58 +775,162 @@ class PlaywrightScrapingService:
         await self.close()
     
     async def initialize(self):
-        """Initialize Playwright browser and context"""
+        """Attach to the shared browser (launching it on first use) and create this instance's context"""
         try:
-            self.playwright = await async_playwright().start()
+            self.browser = await self._get_browser(self.config.headless)
+            self.context = await self._new_context()
+            
+            logger.info("🎭 Playwright browser initialized successfully")
+            
+        except Exception as e:
+            logger.error(f"🎭 Failed to initialize Playwright: {str(e)}")
+            raise
+    
+    @staticmethod
+    async def _get_browser(headless: bool) -> Browser:
+        """Get the running loop's shared browser for this headless mode, launching Playwright/Chromium once per loop"""
+        state = _loop_state()
+        async with state.launch_lock:
+            browser = state.browsers.get(headless)
+            if browser is not None and browser.is_connected():
+                return browser
+            
+            if state.playwright is None:
+                state.playwright = await async_playwright().start()
             
             # Launch browser with optimized settings for better anti-detection
             # Note: Will try to use downloaded browsers, fallback to error with helpful message
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.config.headless,
+            browser = await state.playwright.chromium.launch(
+                headless=headless,
                 args=[
                     '--no-sandbox',
                     '--disable-blink-features=AutomationControlled',
                     '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
+                    '--disable-features=VizDisplayCompositor,TranslateUI,site-per-process,IsolateOrigins',
                     '--disable-dev-shm-usage',
                     '--disable-gpu',
+                    '--disable-accelerated-2d-canvas',
                     '--no-first-run',
                     '--no-default-browser-check',
                     '--disable-extensions',
                     '--disable-plugins',
-                    '--disable-images',  # Faster loading
+                    '--blink-settings=imagesEnabled=false',  # Skip image decoding (--disable-images is not a Chromium flag)
+                    # Background services a headless scraper never needs
+                    '--disable-background-networking',
+                    '--disable-background-timer-throttling',
+                    '--disable-renderer-backgrounding',
+                    '--disable-component-update',
+                    '--disable-default-apps',
+                    '--disable-sync',
+                    '--disable-domain-reliability',
+                    '--disable-client-side-phishing-detection',
+                    '--disable-breakpad',
+                    '--disable-hang-monitor',
+                    '--disable-prompt-on-repost',
+                    '--metrics-recording-only',
+                    '--mute-audio',
                     '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
                 ]
             )
-            
-            # Create browser context with realistic settings
-            self.context = await self.browser.new_context(
-                user_agent=self.config.user_agent,
-                viewport={
-                    'width': self.config.viewport_width,
-                    'height': self.config.viewport_height
-                },
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br'
-                }
-            )
-            
-            logger.info("🎭 Playwright browser initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"🎭 Failed to initialize Playwright: {str(e)}")
-            raise
+            state.browsers[headless] = browser
+            return browser
+    
+    @staticmethod
+    async def shutdown():
+        """Close the running loop's shared browsers and stop its Playwright driver (call on application shutdown)"""
+        state = _loop_state()
+        async with state.launch_lock:
+            try:
+                for browser in state.browsers.values():
+                    await browser.close()
+                if state.playwright is not None:
+                    await state.playwright.stop()
+                logger.info("🎭 Shared Playwright browsers shut down")
+            except Exception as e:
+                logger.error(f"🎭 Error shutting down Playwright: {str(e)}")
+            finally:
+                state.browsers = {}
+                state.playwright = None
+    
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with realistic settings and resource blocking"""
+        context = await self.browser.new_context(
+            user_agent=self.config.user_agent,
+            viewport={
+                'width': self.config.viewport_width,
+                'height': self.config.viewport_height
+            },
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br'
+            },
+            service_workers="block",  # Service workers would bypass the context route below
+            bypass_csp=True
+        )
+        
+        # Timeouts and subresource blocking apply to every page in the context
+        context.set_default_timeout(self.config.timeout)
+        context.set_default_navigation_timeout(self.config.timeout)
+        await context.route("**/*", _block_heavy_resources)
+        return context
+    
+    async def _open_page(self, marketplace: str) -> Page:
+        """
+        Take an idle page from the marketplace's pool, or open a new one
+        
+        Every `recycle_context_every` pages the context is swapped for a fresh one
+        and the idle pool is emptied. A retired context stays alive until its last
+        in-flight page closes (see _close_page), so concurrent searches are never cut off.
+        """
+        async with self._context_lock:
+            if self._pages_since_recycle >= self.config.recycle_context_every:
+                retired = self.context
+                self.context = await self._new_context()
+                self._pages_since_recycle = 0
+                logger.info(f"🎭 Recycled browser context after {self.config.recycle_context_every} pages")
+                
+                for pool in self._page_pools.values():
+                    while not pool.empty():
+                        await pool.get_nowait().close()
+                if not retired.pages:
+                    await retired.close()
+            
+            self._pages_since_recycle += 1
+            pool = self._page_pools.get(marketplace)
+            while pool is not None and not pool.empty():
+                page = pool.get_nowait()
+                if not page.is_closed():  # Skip tabs that crashed while idle
+                    return page
+            return await self.context.new_page()
+    
+    async def _close_page(self, page: Page, marketplace: str):
+        """
+        Return a page to the marketplace's pool, or close it
+        
+        Pages from a retired context are never pooled; the context itself is
+        closed once its last page is gone.
+        """
+        context = page.context
+        pool = self._page_pools.setdefault(marketplace, asyncio.Queue())
+        if context is self.context and pool.qsize() < self.config.page_pool_size:
+            try:
+                # Drop the previous results page (and its scripts) before parking the tab
+                await page.goto("about:blank")
+                pool.put_nowait(page)
+                return
+            except Exception as e:
+                logger.debug(f"🎭 Could not reset page for reuse: {str(e)}")
+        
+        await page.close()
+        if context is not self.context and not context.pages:
+            await context.close()
     
     async def close(self):
-        """Close browser and cleanup resources"""
+        """Close this instance's context; the shared browser stays up for other instances"""
         try:
+            self._page_pools.clear()  # Closing the context closes the pooled pages
             if self.context:
                 await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
             logger.info("🎭 Playwright resources cleaned up")
         except Exception as e:
             logger.error(f"🎭 Error closing Playwright: {str(e)}")
@@ -136,37 +951,80 @@ class PlaywrightScrapingService:
             if marketplace not in self.marketplaces:
                 raise ValueError(f"Unsupported marketplace: {marketplace}")
             
-            logger.info(f"🎭 Starting Playwright search on {marketplace}")
-            
-            # Create new page for this search
-            page = await self.context.new_page()
-            
-            try:
-                # Set page timeout
-                page.set_default_timeout(self.config.timeout)
-                
-                # Route to marketplace-specific scraper
-                if marketplace == "cars_com":
-                    vehicles = await self._scrape_cars_com(page, criteria, location_zip)
-                elif marketplace == "edmunds":
-                    vehicles = await self._scrape_edmunds(page, criteria, location_zip)
-                elif marketplace == "cargurus":
-                    vehicles = await self._scrape_cargurus(page, criteria, location_zip)
-                else:
-                    vehicles = []
-                
-                logger.info(f"🎭 Found {len(vehicles)} vehicles on {marketplace}")
-                
-                return ScrapingResult(
+            cache_key = self._result_cache_key(marketplace, criteria, location_zip)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"🎭 Using cached results for {marketplace} ({cached.total_found} vehicles)")
+                return cached
+            
+            # Server-rendered listing data is enough for some marketplaces; skip the browser then
+            vehicles = await http_api_service.try_fetch(marketplace, criteria, location_zip)
+            if vehicles:
+                logger.info(f"🎭 Found {len(vehicles)} vehicles on {marketplace} via direct HTTP")
+                return self._cache_result(cache_key, ScrapingResult(
                     vehicles=vehicles,
                     source=marketplace,
                     total_found=len(vehicles),
                     success=True,
-                    raw_content=f"Playwright automation results from {marketplace}"
+                    raw_content=f"Direct HTTP results from {marketplace}"
+                ))
+            
+            # No browser scraper yet: don't spend a page and a navigation on an empty result
+            if not self.marketplaces[marketplace]["supports_automation"]:
+                logger.info(f"🎭 Skipping {marketplace}: browser scraper not implemented")
+                return ScrapingResult(
+                    vehicles=[],
+                    source=marketplace,
+                    total_found=0,
+                    success=True,
+                    raw_content=f"No Playwright scraper for {marketplace}"
                 )
+            
+            # Concurrent searches share one context; cap how many pages it has open
+            async with self._page_semaphore:
+                logger.info(f"🎭 Starting Playwright search on {marketplace}")
                 
-            finally:
-                await page.close()
+                # Reuse a pooled page for this marketplace when one is idle
+                page = await self._open_page(marketplace)
+                
+                try:
+                    # Route to marketplace-specific scraper; the nested waits inside can compound on
+                    # slow pages, so give the whole run one ceiling and free the page slot when it's hit.
+                    # The scraper appends to `collected`, so whatever it extracted survives the cutoff.
+                    scraper = getattr(self, self.marketplaces[marketplace]["scraper"])
+                    deadline = self.config.timeout / 1000 * 2
+                    collected: List[Dict[str, Any]] = []
+                    try:
+                        vehicles = await asyncio.wait_for(
+                            scraper(page, criteria, location_zip, collected),
+                            timeout=deadline
+                        )
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            f"🎭 {marketplace} search exceeded {deadline:.0f}s, returning {len(collected)} vehicles collected so far"
+                        )
+                        # Partial results aren't cached, so the next identical search gets a full run
+                        return ScrapingResult(
+                            vehicles=collected,
+                            source=marketplace,
+                            total_found=len(collected),
+                            success=bool(collected),
+                            error_message="overall timeout",
+                            raw_content=f"Playwright automation on {marketplace} timed out after {deadline:.0f}s"
+                        )
+                    
+                    logger.info(f"🎭 Found {len(vehicles)} vehicles on {marketplace}")
+                    
+                    return self._cache_result(cache_key, ScrapingResult(
+                        vehicles=vehicles,
+                        source=marketplace,
+                        total_found=len(vehicles),
+                        success=True,
+                        raw_content=f"Playwright automation results from {marketplace}"
+                    ))
+                    
+                finally:
+                    await self._close_page(page, marketplace)
                 
         except Exception as e:
             logger.error(f"🎭 Error searching {marketplace}: {str(e)}")
@@ -179,14 +1037,63 @@ class PlaywrightScrapingService:
                 raw_content=f"Error during Playwright automation: {str(e)}"
             )
     
-    async def _scrape_cars_com(self, page: Page, criteria: SearchCriteria, location_zip: str) -> List[Dict[str, Any]]:
-        """Scrape Cars.com using form automation"""
+    @staticmethod
+    def _result_cache_key(marketplace: str, criteria: SearchCriteria, location_zip: str) -> tuple:
+        """Key on everything the scrapers read from the criteria"""
+        return (
+            marketplace,
+            tuple(make.strip().lower() for make in criteria.makes),
+            tuple(model.strip().lower() for model in criteria.models),
+            criteria.year_min,
+            criteria.year_max,
+            criteria.price_min,
+            criteria.price_max,
+            criteria.max_results,
+            location_zip
+        )
+    
+    @classmethod
+    def _get_cached_result(cls, key: tuple) -> Optional[ScrapingResult]:
+        """Return a copy of a fresh cached result, dropping it if expired"""
+        entry = cls._result_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del cls._result_cache[key]
+            return None
+        
+        cls._result_cache.move_to_end(key)
+        return replace(result, vehicles=list(result.vehicles))
+    
+    @classmethod
+    def _cache_result(cls, key: tuple, result: ScrapingResult) -> ScrapingResult:
+        """Remember a successful, non-empty result and hand it back"""
+        if result.success and result.vehicles:
+            cls._result_cache[key] = (time.monotonic() + cls._result_cache_ttl_seconds, replace(result, vehicles=list(result.vehicles)))
+            cls._result_cache.move_to_end(key)
+            while len(cls._result_cache) > cls._result_cache_max_size:
+                cls._result_cache.popitem(last=False)
+        return result
+    
+    async def _scrape_cars_com(
+        self,
+        page: Page,
+        criteria: SearchCriteria,
+        location_zip: str,
+        collected: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scrape Cars.com using form automation, appending vehicles to `collected` as they're extracted"""
         try:
             logger.info("🎭 Navigating to Cars.com...")
-            await page.goto("https://www.cars.com/shopping/", wait_until="domcontentloaded")
-            
-            # Wait a bit for JS to fully load
-            await page.wait_for_timeout(5000)
+            # Return as soon as navigation commits; the visible search UI is the real readiness signal
+            await page.goto("https://www.cars.com/shopping/", wait_until="commit", timeout=15000)
+            try:
+                await page.locator(_CARS_COM_SEARCH_READY).first.wait_for(state="visible", timeout=10000)
+            except Exception:
+                logger.info("🎭 Main search input did not appear, probing fallbacks...")
+                await page.wait_for_load_state("domcontentloaded")
             logger.info("🎭 Page loaded, looking for search elements...")
             
             # Take a screenshot for debugging and log page info
@@ -195,77 +1102,48 @@ class PlaywrightScrapingService:
             logger.info(f"🎭 Current URL: {current_url}")
             logger.info(f"🎭 Page title: {page_title}")
             
-            # Debug: log all input elements on the page
-            all_inputs = await page.locator('input').all()
-            logger.info(f"🎭 Found {len(all_inputs)} total input elements")
-            
-            for i, inp in enumerate(all_inputs[:10]):  # Log first 10 inputs
-                try:
-                    placeholder = await inp.get_attribute('placeholder') or "no placeholder"
-                    input_type = await inp.get_attribute('type') or "no type"
-                    input_name = await inp.get_attribute('name') or "no name"
-                    is_visible = await inp.is_visible()
-                    logger.info(f"🎭 Input {i+1}: type='{input_type}', name='{input_name}', placeholder='{placeholder}', visible={is_visible}")
-                except:
-                    logger.info(f"🎭 Input {i+1}: could not read attributes")
-            
-            # Also check for any obvious search-related text on page
-            search_texts = ['Search', 'Make', 'Model', 'Year', 'Price', 'Location']
-            for text in search_texts:
+            # Page diagnostics cost extra round-trips, so only collect them in debug mode
+            if settings.DEBUG:
+                input_count, input_infos = await page.evaluate(_DESCRIBE_INPUTS_JS)
+                logger.info(
+                    "🎭 Found {} total input elements, first {}: {}",
+                    input_count,
+                    len(input_infos),
+                    [
+                        f"type='{info['type'] or 'no type'}', name='{info['name'] or 'no name'}', "
+                        f"placeholder='{info['placeholder'] or 'no placeholder'}', visible={info['visible']}"
+                        for info in input_infos
+                    ]
+                )
+                
+                # Also check for any obvious search-related text on page (all terms in one evaluate)
+                search_texts = ['Search', 'Make', 'Model', 'Year', 'Price', 'Location']
                 try:
-                    elements = await page.locator(f':has-text("{text}")').count()
-                    if elements > 0:
-                        logger.info(f"🎭 Found {elements} elements containing '{text}'")
-                except:
-                    pass
+                    text_counts = dict(zip(search_texts, await page.evaluate(_COUNT_TEXT_JS, search_texts)))
+                    logger.info(f"🎭 Elements containing search-related text: {text_counts}")
+                except Exception as e:
+                    logger.debug(f"🎭 Failed to count search-related text: {str(e)}")
             
             # Look for different types of search interfaces
             search_found = False
             
-            # Try the main search form first with updated selectors
-            main_search_selectors = [
-                'input[name="one_hitter"]',  # Cars.com main search field (PRIORITY)
-                'input[data-testid="sitewide-search-filter-text"]',
-                'input[name="searchTerm"]', 
-                'input[placeholder*="make"]',
-                'input[placeholder*="Make"]',
-                'input[placeholder*="Search"]',
-                'input[placeholder*="Enter"]',
-                '.search-input',
-                '#search-input',
-                '[data-qa="search-input"]',
-                'input[type="search"]',
-                'input[aria-label*="search"]',
-                'input[aria-label*="Search"]',
-                # Modern Cars.com specific selectors
-                'input[data-linkname*="search"]',
-                'input[class*="search"]',
-                'input[id*="search"]'
-            ]
-            
-            for selector in main_search_selectors:
-                try:
-                    element = page.locator(selector)
-                    if await element.count() > 0:
-                        logger.info(f"🎭 Found search input: {selector}")
-                        search_found = True
-                        break
-                except:
-                    continue
+            # Try the main search form first
+            selector = await page.evaluate(_FIRST_MATCHING_SELECTOR_JS, list(_CARS_COM_SEARCH_INPUTS))
+            if selector:
+                logger.info(f"🎭 Found search input: {selector}")
+                search_found = True
             
             if not search_found:
                 logger.warning("🎭 Main search not found, trying alternative approach...")
-                # Try to find any input field and use it
-                all_inputs = await page.locator('input[type="text"], input[type="search"], input:not([type])').all()
-                logger.info(f"🎭 Found {len(all_inputs)} input fields on page")
+                # Try to find any visible input field and use it (counted in one call, no handles)
+                visible_inputs = await page.locator(
+                    'input[type="text"], input[type="search"], input:not([type]) >> visible=true'
+                ).count()
+                logger.info(f"🎭 Found {visible_inputs} visible input fields on page")
                 
-                if len(all_inputs) > 0:
-                    # Use the first visible input
-                    for inp in all_inputs:
-                        if await inp.is_visible():
-                            search_found = True
-                            logger.info("🎭 Using first visible input field")
-                            break
+                if visible_inputs > 0:
+                    search_found = True
+                    logger.info("🎭 Using first visible input field")
             
             if not search_found:
                 logger.warning("🎭 No search inputs found on main page, trying advanced search page...")
@@ -273,27 +1151,17 @@ class PlaywrightScrapingService:
                 # Try navigating to the advanced search page
                 try:
                     await page.goto("https://www.cars.com/shopping/results/", wait_until="domcontentloaded")
-                    await page.wait_for_timeout(3000)
                     
                     # Look for search elements on results page
-                    results_search_selectors = [
-                        'input[placeholder*="Make"]',
-                        'input[placeholder*="Model"]',
-                        'input[name="make"]',
-                        'input[name="model"]',
-                        'select[name="make"]',
-                        'select[name="model"]'
-                    ]
+                    try:
+                        await page.wait_for_selector(", ".join(_CARS_COM_FILTER_INPUTS), state="attached", timeout=8000)
+                    except Exception:
+                        pass
                     
-                    for selector in results_search_selectors:
-                        try:
-                            element = page.locator(selector)
-                            if await element.count() > 0:
-                                logger.info(f"🎭 Found search element on results page: {selector}")
-                                search_found = True
-                                break
-                        except:
-                            continue
+                    selector = await page.evaluate(_FIRST_MATCHING_SELECTOR_JS, list(_CARS_COM_FILTER_INPUTS))
+                    if selector:
+                        logger.info(f"🎭 Found search element on results page: {selector}")
+                        search_found = True
                     
                     if not search_found:
                         logger.error("🎭 No search forms found on advanced search page either")
@@ -303,9 +1171,6 @@ class PlaywrightScrapingService:
                     logger.error(f"🎭 Failed to navigate to advanced search: {str(e)}")
                     return []
             
-            # Wait for any search interface to be ready
-            await page.wait_for_timeout(2000)
-            
             # Fill search form
             if criteria.makes and criteria.models:
                 make = criteria.makes[0]
@@ -359,120 +1224,94 @@ class PlaywrightScrapingService:
                 model_filled = False
                 
                 # Try make dropdown/input
-                make_selectors = [
-                    'select[name="make"]',
-                    'input[name="make"]',
-                    'select[placeholder*="Make"]',
-                    'input[placeholder*="Make"]',
-                    'select[data-qa*="make"]',
-                    'input[data-qa*="make"]',
-                    # Cars.com specific
-                    'input[name="one_hitter"]'  # Main search field on Cars.com
-                ]
-                
-                for selector in make_selectors:
+                found = await _first_visible(page, _CARS_COM_MAKE_INPUTS)
+                if found:
+                    selector, make_element = found
                     try:
-                        make_element = page.locator(selector)
-                        if await make_element.count() > 0 and await make_element.is_visible():
-                            if 'select' in selector:
-                                # Handle dropdown
-                                await make_element.select_option(label=make)
-                                logger.info(f"🎭 Selected make '{make}' from dropdown: {selector}")
-                            else:
-                                # Handle text input
-                                await make_element.clear()
-                                await make_element.fill(make)
-                                logger.info(f"🎭 Filled make '{make}' in input: {selector}")
-                            make_filled = True
-                            break
+                        if 'select' in selector:
+                            # Handle dropdown
+                            await make_element.select_option(label=make)
+                            logger.info(f"🎭 Selected make '{make}' from dropdown: {selector}")
+                        else:
+                            # Handle text input
+                            await make_element.clear()
+                            await make_element.fill(make)
+                            logger.info(f"🎭 Filled make '{make}' in input: {selector}")
+                        make_filled = True
                     except Exception as e:
                         logger.debug(f"🎭 Failed to fill make with {selector}: {str(e)}")
-                        continue
                 
                 # Try model dropdown/input
-                model_selectors = [
-                    'select[name="model"]',
-                    'input[name="model"]',
-                    'select[placeholder*="Model"]',
-                    'input[placeholder*="Model"]',
-                    'select[data-qa*="model"]',
-                    'input[data-qa*="model"]'
-                ]
-                
-                for selector in model_selectors:
+                found = await _first_visible(page, _CARS_COM_MODEL_INPUTS)
+                if found:
+                    selector, model_element = found
                     try:
-                        model_element = page.locator(selector)
-                        if await model_element.count() > 0 and await model_element.is_visible():
-                            if 'select' in selector:
-                                # Handle dropdown
-                                await model_element.select_option(label=model)
-                                logger.info(f"🎭 Selected model '{model}' from dropdown: {selector}")
-                            else:
-                                # Handle text input
-                                await model_element.clear()
-                                await model_element.fill(model)
-                                logger.info(f"🎭 Filled model '{model}' in input: {selector}")
-                            model_filled = True
-                            break
+                        if 'select' in selector:
+                            # Handle dropdown
+                            await model_element.select_option(label=model)
+                            logger.info(f"🎭 Selected model '{model}' from dropdown: {selector}")
+                        else:
+                            # Handle text input
+                            await model_element.clear()
+                            await model_element.fill(model)
+                            logger.info(f"🎭 Filled model '{model}' in input: {selector}")
+                        model_filled = True
                     except Exception as e:
                         logger.debug(f"🎭 Failed to fill model with {selector}: {str(e)}")
-                        continue
                 
                 # If separate fields didn't work, try single search field
                 filled = make_filled and model_filled  # Both need to be filled for optimal results
                 if not filled:
                     logger.info("🎭 Trying single search field approach...")
-                    search_selectors = [
-                        'input[name="one_hitter"]',  # Cars.com main search field (PRIORITY)
-                        'input[data-testid="sitewide-search-filter-text"]',
-                        'input[name="searchTerm"]',
-                        'input[placeholder*="make"]',
-                        'input[placeholder*="Make"]',
-                        'input[placeholder*="Search"]',
-                        '.search-input',
-                        '#search-input'
-                    ]
+                    search_selectors = _CARS_COM_SEARCH_INPUTS
                     
                     # Try concise query first for better model matching
                     query_to_use = search_query
                     logger.info(f"🎭 Using concise query: {query_to_use}")
                     
                     search_filled = False
-                    for selector in search_selectors:
+                    found = await _first_visible(page, search_selectors)
+                    if found:
+                        selector, search_input = found
                         try:
-                            search_input = page.locator(selector)
-                            if await search_input.count() > 0 and await search_input.is_visible():
-                                logger.info(f"🎭 Filling search input with: {query_to_use}")
-                                await search_input.clear()
-                                await search_input.fill(query_to_use)
-                                search_filled = True
-                                logger.info(f"🎭 Successfully filled search input: {selector}")
-                                break
+                            logger.info(f"🎭 Filling search input with: {query_to_use}")
+                            await search_input.clear()
+                            await search_input.fill(query_to_use)
+                            search_filled = True
+                            logger.info(f"🎭 Successfully filled search input: {selector}")
                         except Exception as e:
                             logger.debug(f"🎭 Failed to fill {selector}: {str(e)}")
-                            continue
                     
                     # If concise query didn't work, try detailed query as fallback
                     if not search_filled:
                         logger.info("🎭 Trying detailed query as fallback...")
-                        for selector in search_selectors:
+                        found = await _first_visible(page, search_selectors)
+                        if found:
+                            selector, search_input = found
                             try:
-                                search_input = page.locator(selector)
-                                if await search_input.count() > 0 and await search_input.is_visible():
-                                    logger.info(f"🎭 Filling search input with detailed query: {detailed_search_query}")
-                                    await search_input.clear()
-                                    await search_input.fill(detailed_search_query)
-                                    search_filled = True
-                                    logger.info(f"🎭 Successfully filled search input with detailed query: {selector}")
-                                    break
+                                logger.info(f"🎭 Filling search input with detailed query: {detailed_search_query}")
+                                await search_input.clear()
+                                await search_input.fill(detailed_search_query)
+                                search_filled = True
+                                logger.info(f"🎭 Successfully filled search input with detailed query: {selector}")
                             except Exception as e:
                                 logger.debug(f"🎭 Failed to fill {selector} with detailed query: {str(e)}")
-                                continue
                     
                     filled = search_filled
                 
                 if not filled:
                     logger.warning("🎭 Could not find search input, trying alternative methods...")
+                    # Accessibility-tree lookup catches search boxes whose attributes changed
+                    search_box = page.get_by_role("searchbox").or_(page.get_by_placeholder(_SEARCH_PLACEHOLDER_RE)).first
+                    try:
+                        if await search_box.is_visible():
+                            await search_box.fill(search_query)
+                            filled = True
+                            logger.info("🎭 Filled search box found by role/placeholder")
+                    except Exception as e:
+                        logger.debug(f"🎭 Failed to fill search box by role: {str(e)}")
+                
+                if not filled:
                     # Try clicking somewhere and typing
                     await page.click('body')
                     await page.keyboard.type(search_query)
@@ -480,29 +1319,17 @@ class PlaywrightScrapingService:
                 
                 # Set location
                 logger.info(f"🎭 Setting location to: {location_zip}")
-                location_selectors = [
-                    'input[name="zip"]',  # Cars.com ZIP field (PRIORITY)
-                    'input[data-testid="sitewide-search-filter-location"]',
-                    'input[name="location"]',
-                    'input[placeholder*="location"]',
-                    'input[placeholder*="Location"]',
-                    'input[placeholder*="zip"]',
-                    'input[placeholder*="ZIP"]'
-                ]
-                
                 location_filled = False
-                for selector in location_selectors:
+                found = await _first_visible(page, _CARS_COM_LOCATION_INPUTS)
+                if found:
+                    selector, location_input = found
                     try:
-                        location_input = page.locator(selector).first  # Use first matching element
-                        if await location_input.count() > 0 and await location_input.is_visible():
-                            await location_input.clear()
-                            await location_input.fill(location_zip)
-                            location_filled = True
-                            logger.info(f"🎭 Successfully filled location: {selector}")
-                            break
+                        await location_input.clear()
+                        await location_input.fill(location_zip)
+                        location_filled = True
+                        logger.info(f"🎭 Successfully filled location: {selector}")
                     except Exception as e:
                         logger.debug(f"🎭 Failed to fill location {selector}: {str(e)}")
-                        continue
                 
                 if not location_filled:
                     logger.warning("🎭 Could not set location")
@@ -510,148 +1337,89 @@ class PlaywrightScrapingService:
                 # Set price range filters
                 if criteria.price_min:
                     logger.info(f"🎭 Setting minimum price: ${criteria.price_min}")
-                    price_min_selectors = [
-                        'input[name="price_min"]',
-                        'input[name="priceMin"]',
-                        'input[placeholder*="Min price"]',
-                        'input[placeholder*="Minimum"]',
-                        'select[name="price_min"]'
-                    ]
-                    
-                    for selector in price_min_selectors:
+                    found = await _first_visible(page, _CARS_COM_PRICE_MIN_INPUTS)
+                    if found:
+                        selector, price_min_input = found
                         try:
-                            price_min_input = page.locator(selector)
-                            if await price_min_input.count() > 0 and await price_min_input.is_visible():
-                                if 'select' in selector:
-                                    await price_min_input.select_option(value=str(int(criteria.price_min)))
-                                else:
-                                    await price_min_input.clear()
-                                    await price_min_input.fill(str(int(criteria.price_min)))
-                                logger.info(f"🎭 Set minimum price: {selector}")
-                                break
+                            if 'select' in selector:
+                                await price_min_input.select_option(value=str(int(criteria.price_min)))
+                            else:
+                                await price_min_input.clear()
+                                await price_min_input.fill(str(int(criteria.price_min)))
+                            logger.info(f"🎭 Set minimum price: {selector}")
                         except Exception as e:
                             logger.debug(f"🎭 Failed to set min price {selector}: {str(e)}")
-                            continue
                 
                 if criteria.price_max:
                     logger.info(f"🎭 Setting maximum price: ${criteria.price_max}")
-                    price_max_selectors = [
-                        'input[name="price_max"]',
-                        'input[name="priceMax"]',
-                        'input[placeholder*="Max price"]',
-                        'input[placeholder*="Maximum"]',
-                        'select[name="price_max"]'
-                    ]
-                    
-                    for selector in price_max_selectors:
+                    found = await _first_visible(page, _CARS_COM_PRICE_MAX_INPUTS)
+                    if found:
+                        selector, price_max_input = found
                         try:
-                            price_max_input = page.locator(selector)
-                            if await price_max_input.count() > 0 and await price_max_input.is_visible():
-                                if 'select' in selector:
-                                    await price_max_input.select_option(value=str(int(criteria.price_max)))
-                                else:
-                                    await price_max_input.clear()
-                                    await price_max_input.fill(str(int(criteria.price_max)))
-                                logger.info(f"🎭 Set maximum price: {selector}")
-                                break
+                            if 'select' in selector:
+                                await price_max_input.select_option(value=str(int(criteria.price_max)))
+                            else:
+                                await price_max_input.clear()
+                                await price_max_input.fill(str(int(criteria.price_max)))
+                            logger.info(f"🎭 Set maximum price: {selector}")
                         except Exception as e:
                             logger.debug(f"🎭 Failed to set max price {selector}: {str(e)}")
-                            continue
                 
                 # Set year range filters
                 if criteria.year_min:
                     logger.info(f"🎭 Setting minimum year: {criteria.year_min}")
-                    year_min_selectors = [
-                        'select[name="year_min"]',
-                        'select[name="yearMin"]',
-                        'input[name="year_min"]',
-                        'select[placeholder*="Min year"]',
-                        'select[placeholder*="From year"]'
-                    ]
-                    
-                    for selector in year_min_selectors:
+                    found = await _first_visible(page, _CARS_COM_YEAR_MIN_INPUTS)
+                    if found:
+                        selector, year_min_input = found
                         try:
-                            year_min_input = page.locator(selector)
-                            if await year_min_input.count() > 0 and await year_min_input.is_visible():
-                                if 'select' in selector:
-                                    await year_min_input.select_option(value=str(criteria.year_min))
-                                else:
-                                    await year_min_input.clear()
-                                    await year_min_input.fill(str(criteria.year_min))
-                                logger.info(f"🎭 Set minimum year: {selector}")
-                                break
+                            if 'select' in selector:
+                                await year_min_input.select_option(value=str(criteria.year_min))
+                            else:
+                                await year_min_input.clear()
+                                await year_min_input.fill(str(criteria.year_min))
+                            logger.info(f"🎭 Set minimum year: {selector}")
                         except Exception as e:
                             logger.debug(f"🎭 Failed to set min year {selector}: {str(e)}")
-                            continue
                 
                 if criteria.year_max:
                     logger.info(f"🎭 Setting maximum year: {criteria.year_max}")
-                    year_max_selectors = [
-                        'select[name="year_max"]',
-                        'select[name="yearMax"]',
-                        'input[name="year_max"]',
-                        'select[placeholder*="Max year"]',
-                        'select[placeholder*="To year"]'
-                    ]
-                    
-                    for selector in year_max_selectors:
+                    found = await _first_visible(page, _CARS_COM_YEAR_MAX_INPUTS)
+                    if found:
+                        selector, year_max_input = found
                         try:
-                            year_max_input = page.locator(selector)
-                            if await year_max_input.count() > 0 and await year_max_input.is_visible():
-                                if 'select' in selector:
-                                    await year_max_input.select_option(value=str(criteria.year_max))
-                                else:
-                                    await year_max_input.clear()
-                                    await year_max_input.fill(str(criteria.year_max))
-                                logger.info(f"🎭 Set maximum year: {selector}")
-                                break
+                            if 'select' in selector:
+                                await year_max_input.select_option(value=str(criteria.year_max))
+                            else:
+                                await year_max_input.clear()
+                                await year_max_input.fill(str(criteria.year_max))
+                            logger.info(f"🎭 Set maximum year: {selector}")
                         except Exception as e:
                             logger.debug(f"🎭 Failed to set max year {selector}: {str(e)}")
-                            continue
                 
                 # Set sorting to lowest price BEFORE submitting search
                 logger.info("🎭 Setting sort to lowest price...")
-                sort_selectors = [
-                    'select[name="sort"]',  # Cars.com sort dropdown
-                    'select[data-testid="sort-dropdown"]',
-                    'select:has(option[value*="price"])',
-                    'select:has(option:contains("price"))',
-                    '[data-qa="sort-select"]'
-                ]
-                
                 sort_set = False
-                for selector in sort_selectors:
+                found = await _first_visible(page, _CARS_COM_SORT_SELECTS)
+                if found:
+                    selector, sort_element = found
                     try:
-                        sort_element = page.locator(selector)
-                        if await sort_element.count() > 0 and await sort_element.is_visible():
-                            # Try different price sorting values
-                            price_values = ["price_lowest", "price_asc", "price", "lowest_price", "price-asc"]
-                            for value in price_values:
-                                try:
-                                    await sort_element.select_option(value=value)
-                                    sort_set = True
-                                    logger.info(f"🎭 Set sort to: {value} using {selector}")
-                                    break
-                                except:
-                                    continue
-                            if sort_set:
-                                break
-                            
-                            # If value selection failed, try by label
-                            price_labels = ["Lowest price", "Price: Low to High", "Price (Low to High)", "Price - Low to High"]
-                            for label in price_labels:
-                                try:
-                                    await sort_element.select_option(label=label)
-                                    sort_set = True
-                                    logger.info(f"🎭 Set sort by label: {label} using {selector}")
-                                    break
-                                except:
-                                    continue
-                            if sort_set:
-                                break
+                        # Read the options once and pick the lowest-price one here, rather than
+                        # trying select_option with every candidate value and label
+                        options = await sort_element.evaluate(
+                            "el => Array.from(el.options || [], o => [o.value, (o.textContent || '').trim()])"
+                        )
+                        option_values = {option_value for option_value, _ in options}
+                        option_labels = {option_label: option_value for option_value, option_label in options}
+                        value = next((candidate for candidate in _CARS_COM_PRICE_SORT_VALUES if candidate in option_values), None)
+                        if value is None:
+                            label = next((candidate for candidate in _CARS_COM_PRICE_SORT_LABELS if candidate in option_labels), None)
+                            value = option_labels.get(label)
+                        if value is not None:
+                            await sort_element.select_option(value=value)
+                            sort_set = True
+                            logger.info(f"🎭 Set sort to: {value} using {selector}")
                     except Exception as e:
                         logger.debug(f"🎭 Failed to set sort with {selector}: {str(e)}")
-                        continue
                 
                 if not sort_set:
                     logger.warning("🎭 Could not set price sorting, using default sort")
@@ -663,55 +1431,44 @@ class PlaywrightScrapingService:
                 submitted = False
                 
                 # Method 1: Click search/submit button
-                search_button_selectors = [
-                    'button[data-testid="sitewide-search-submit"]',
-                    'button[type="submit"]',
-                    'input[type="submit"]',
-                    '.search-button',
-                    'button:has-text("Search")',
-                    'button:has-text("Find")',
-                    '[data-qa="search-button"]'
-                ]
+                found = await _first_visible(page, _CARS_COM_SEARCH_BUTTONS)
+                if found:
+                    selector, button = found
+                    try:
+                        await button.click()
+                        submitted = True
+                        logger.info(f"🎭 Clicked search button: {selector}")
+                    except Exception as e:
+                        logger.debug(f"🎭 Failed to click button {selector}: {str(e)}")
                 
-                for selector in search_button_selectors:
+                # Method 1b: Any button whose accessible name reads like search/find
+                if not submitted:
+                    button = page.get_by_role("button", name=_SEARCH_BUTTON_NAME_RE).first
                     try:
-                        button = page.locator(selector).first  # Use first matching element
-                        if await button.count() > 0 and await button.is_visible():
+                        if await button.is_visible():
                             await button.click()
                             submitted = True
-                            logger.info(f"🎭 Clicked search button: {selector}")
-                            break
+                            logger.info("🎭 Clicked search button found by role")
                     except Exception as e:
-                        logger.debug(f"🎭 Failed to click button {selector}: {str(e)}")
-                        continue
+                        logger.debug(f"🎭 Failed to click search button by role: {str(e)}")
                 
                 # Method 2: Press Enter on search input
                 if not submitted:
-                    # Define search selectors for Enter press
-                    enter_selectors = [
-                        'input[name="one_hitter"]',
-                        'input[data-testid="sitewide-search-filter-text"]',
-                        'input[name="searchTerm"]',
-                        'input[placeholder*="Search"]'
-                    ]
-                    for selector in enter_selectors:
-                        try:
-                            search_input = page.locator(selector)
-                            if await search_input.count() > 0:
-                                await search_input.press("Enter")
-                                submitted = True
-                                logger.info(f"🎭 Pressed Enter on: {selector}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"🎭 Failed to press Enter on {selector}: {str(e)}")
-                            continue
+                    try:
+                        search_input = page.locator(_CARS_COM_ENTER_INPUTS).first
+                        if await search_input.count() > 0:
+                            await search_input.press("Enter")
+                            submitted = True
+                            logger.info("🎭 Pressed Enter on search input")
+                    except Exception as e:
+                        logger.debug(f"🎭 Failed to press Enter on search input: {str(e)}")
                 
                 # Method 3: Submit any form on the page
                 if not submitted:
                     try:
-                        forms = await page.locator('form').all()
-                        if forms:
-                            await forms[0].evaluate("form => form.submit()")
+                        form = page.locator('form').first
+                        if await form.count() > 0:
+                            await form.evaluate("form => form.submit()")
                             submitted = True
                             logger.info("🎭 Submitted first form on page")
                     except Exception as e:
@@ -720,37 +1477,14 @@ class PlaywrightScrapingService:
                 if submitted:
                     logger.info("🎭 Search submitted, waiting for results...")
                     
-                    # Try multiple wait strategies due to Cars.com having lots of dynamic content
-                    try:
-                        # First try networkidle with shorter timeout
-                        await page.wait_for_load_state("networkidle", timeout=10000)
-                        logger.info("🎭 Page reached networkidle state")
-                    except:
-                        logger.info("🎭 Networkidle timeout, trying domcontentloaded...")
-                        try:
-                            # Fallback to domcontentloaded
-                            await page.wait_for_load_state("domcontentloaded", timeout=10000)
-                            logger.info("🎭 Page reached domcontentloaded state")
-                        except:
-                            logger.info("🎭 Load state timeout, continuing with fixed wait...")
-                    
-                    # Wait for vehicle cards to appear with multiple attempts
+                    # Proceed as soon as the first result card exists instead of waiting for
+                    # networkidle (Cars.com keeps loading dynamic content long after)
                     logger.info("🎭 Waiting for vehicle content to load...")
-                    for attempt in range(3):
-                        await page.wait_for_timeout(2000)  # 2s wait
-                        
-                        # Check if vehicle cards are present
-                        vehicle_check = await page.locator('.vehicle-card').count()
-                        listing_check = await page.locator('div[data-listing-id]').count()
-                        
-                        logger.info(f"🎭 Attempt {attempt + 1}: Found {vehicle_check} vehicle-cards, {listing_check} listing-divs")
-                        
-                        if vehicle_check > 0 or listing_check > 0:
-                            logger.info(f"🎭 ✅ Vehicle content detected on attempt {attempt + 1}")
-                            break
-                        
-                        if attempt == 2:
-                            logger.warning("🎭 No vehicle content found after 3 attempts, proceeding anyway...")
+                    try:
+                        await page.wait_for_selector(_CARS_COM_RESULT_CARDS, state="attached", timeout=15000)
+                        logger.info("🎭 ✅ Vehicle content detected")
+                    except Exception:
+                        logger.warning("🎭 No vehicle content found within 15s, proceeding anyway...")
                     
                     # Log post-submission URL and check for redirects
                     post_submit_url = page.url
@@ -775,60 +1509,35 @@ class PlaywrightScrapingService:
             else:
                 logger.warning(f"🎭 Unexpected page URL: {current_url}")
             
+            # Listings embedded as JSON-LD make DOM card parsing unnecessary once they fill the request;
+            # a short list only covers this page, so the cards and pagination below still run
+            max_results = criteria.max_results or 100
+            structured_vehicles = await self._read_json_ld_vehicles(page, "cars_com", max_results)
+            if structured_vehicles:
+                logger.info(f"🎭 Read {len(structured_vehicles)} vehicles from embedded JSON-LD")
+                if len(structured_vehicles) >= max_results:
+                    return structured_vehicles
+            
             # Extract vehicle data with multiple approaches
-            vehicles = []
-            
-            # Modern Cars.com uses different selectors - update based on dynamic loading
-            vehicle_selectors = [
-                # Modern Cars.com selectors (updated for 2024)
-                'article[data-tracking-id*="srp_listing"]',  # Current Cars.com article structure
-                'article[data-qa="vehicle_card"]',           # Alternative Cars.com structure
-                'div[data-testid*="listing"]',               # Modern testid pattern
-                'article[class*="vehicle"]',                 # Article with vehicle in class
-                '[data-cmp="VehicleCard"]',                  # Component-based selector
-                '.sds-card',                                 # Cars.com design system card
-                'article.sds-card',                          # Article with SDS card class
-                
-                # Legacy selectors (fallback)
-                '.vehicle-card',                             # Classic selector
-                'div[data-listing-id]',                      # Legacy data attribute
-                '[data-tracking-type="srp-vehicle-card"]',   # Old tracking
-                '.vehicle-cards .vehicle-card',              # Nested structure
-                '[id^="vehicle-card-"]',                     # ID-based selector
-                
-                # Generic fallback selectors
-                '.listing',
-                '.vehicle-listing', 
-                '.car-listing',
-                '.search-result',
-                'article',                                   # Any article element
-                '[class*="card"]'                            # Any element with card in class
-            ]
+            vehicles = collected if collected is not None else []
             
             vehicle_cards = []
-            used_selector = None
-            
-            for selector in vehicle_selectors:
-                try:
-                    cards = await page.locator(selector).all()
-                    if len(cards) > 0:
-                        vehicle_cards = cards
-                        used_selector = selector
-                        logger.info(f"🎭 Found {len(vehicle_cards)} vehicle cards using selector: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to find vehicles with {selector}: {str(e)}")
-                    continue
+            used_selector = await page.evaluate(_FIRST_MATCHING_SELECTOR_JS, list(_CARS_COM_VEHICLE_CARDS))
+            if used_selector:
+                card_count, vehicle_cards = await self._snapshot_cards(page.locator(used_selector), _CARS_COM_CARD_FIELDS)
+                logger.info(f"🎭 Found {card_count} vehicle cards using selector: {used_selector}")
             
             # If no cards found with specific selectors, try generic approach
             if not vehicle_cards:
                 logger.warning("🎭 No vehicle cards found with specific selectors, trying generic approach...")
                 
                 # Look for any elements that might contain vehicle data
-                potential_cards = await page.locator('div:has-text("$"), div:has-text("Honda"), div:has-text("Accord")').all()
-                if potential_cards:
-                    logger.info(f"🎭 Found {len(potential_cards)} potential vehicle elements")
-                    vehicle_cards = potential_cards[:20]  # Limit to reasonable number
+                card_count, vehicle_cards = await self._snapshot_cards(
+                    page.locator('div:has-text("$"), div:has-text("Honda"), div:has-text("Accord")'),
+                    _CARS_COM_CARD_FIELDS
+                )
+                if vehicle_cards:
+                    logger.info(f"🎭 Found {card_count} potential vehicle elements")
                     used_selector = "generic price/vehicle text"
             
             # If still no results, log page content for debugging
@@ -838,55 +1547,39 @@ class PlaywrightScrapingService:
                 logger.info(f"🎭 Page title: {page_title}")
                 
                 # Check if there's a "no results" message
-                no_results_selectors = [
-                    ':has-text("No results")',
-                    ':has-text("no vehicles")',
-                    ':has-text("0 results")',
-                    '.no-results',
-                    '.empty-results'
-                ]
-                
-                for selector in no_results_selectors:
-                    try:
-                        no_results = await page.locator(selector).count()
-                        if no_results > 0:
-                            logger.info(f"🎭 Found 'no results' message: {selector}")
-                            break
-                    except:
-                        continue
+                try:
+                    if await page.locator(_NO_RESULTS).count() > 0:
+                        logger.info("🎭 Found 'no results' message")
+                except Exception:
+                    pass
                 
                 # Enhanced debugging: check for specific Cars.com elements
                 try:
-                    # Check if vehicle-cards container exists
-                    vehicle_container = await page.locator('.vehicle-cards').count()
+                    # Count vehicle-cards containers, data-listing-id divs and vehicle-card classes in one round-trip
+                    vehicle_container, listing_divs, all_vehicle_cards = await page.evaluate(
+                        _COUNT_MATCHES_JS, ['.vehicle-cards', 'div[data-listing-id]', '[class*="vehicle-card"]']
+                    )
                     logger.info(f"🎭 Found {vehicle_container} vehicle-cards containers")
-                    
-                    # Check for any divs with data-listing-id
-                    listing_divs = await page.locator('div[data-listing-id]').count()
                     logger.info(f"🎭 Found {listing_divs} divs with data-listing-id")
-                    
-                    # Check for any elements with vehicle-card class
-                    all_vehicle_cards = await page.locator('[class*="vehicle-card"]').count()
                     logger.info(f"🎭 Found {all_vehicle_cards} elements with vehicle-card in class")
                     
                     # Get page text for debugging (first 500 chars)
-                    page_text = await page.locator('body').text_content()
-                    if page_text:
-                        logger.debug(f"🎭 Page content preview: {page_text[:500]}...")
+                    if settings.DEBUG:
+                        page_text = await page.evaluate("() => (document.body.textContent || '').slice(0, 500)")
+                        logger.debug(f"🎭 Page content preview: {page_text}...")
                 except Exception as e:
                     logger.debug(f"🎭 Error during enhanced debugging: {str(e)}")
             
             # Process found vehicle cards on current page
-            for i, card in enumerate(vehicle_cards[:20]):  # Limit to first 20 results per page
-                try:
-                    logger.debug(f"🎭 Processing vehicle card {i+1}/{len(vehicle_cards)}")
-                    vehicle_data = await self._extract_cars_com_vehicle(card)
-                    if vehicle_data:
-                        vehicles.append(vehicle_data)
-                        logger.info(f"🎭 Successfully extracted vehicle: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
-                except Exception as e:
-                    logger.debug(f"🎭 Error extracting vehicle {i+1}: {str(e)}")
+            timestamps = _scrape_timestamps()
+            results = await self._extract_cards(self._extract_cars_com_vehicle, vehicle_cards, timestamps)
+            for i, vehicle_data in enumerate(results):  # Snapshots cover the first 20 results
+                if isinstance(vehicle_data, Exception):
+                    logger.debug(f"🎭 Error extracting vehicle {i+1}: {str(vehicle_data)}")
                     continue
+                if vehicle_data:
+                    vehicles.append(vehicle_data)
+                    logger.info(f"🎭 Successfully extracted vehicle: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
             
             logger.info(f"🎭 Extracted {len(vehicles)} vehicles from current page")
             
@@ -897,34 +1590,11 @@ class PlaywrightScrapingService:
             while current_page < max_pages and len(vehicles) < 20:  # Max 40 vehicles for testing
                 try:
                     # Look for "Next" button or page links (Updated for Cars.com structure)
-                    next_selectors = [
-                        '.sds-pagination__list a[aria-label="Go to next page"]',  # Cars.com specific
-                        '.sds-pagination a[aria-label*="next"]',  # Cars.com pagination
-                        'a[aria-label="Next Page"]',
-                        'a[title="Next"]',
-                        'a[aria-label="Go to next page"]',  # Common Cars.com pattern
-                        '.pagination a:has-text("Next")',
-                        '.pagination [aria-label*="next"]',
-                        'button:has-text("Next")',
-                        '.sds-pagination a:last-child',  # Cars.com specific pagination
-                        '[data-testid="pagination-next"]',
-                        '.sds-pagination__list li:last-child a',  # Cars.com pagination structure
-                        '.pagination-next a',  # Alternative structure
-                        'a:has-text("›")',  # Next arrow symbol
-                        'a:has-text("❯")',  # Alternative arrow
-                        'a[title*="Next"]'
-                    ]
-                    
                     next_button = None
-                    for selector in next_selectors:
-                        try:
-                            element = page.locator(selector)
-                            if await element.count() > 0 and await element.is_visible():
-                                next_button = element
-                                logger.info(f"🎭 Found next page button: {selector}")
-                                break
-                        except:
-                            continue
+                    found = await _first_visible(page, _CARS_COM_NEXT_PAGE)
+                    if found:
+                        selector, next_button = found
+                        logger.info(f"🎭 Found next page button: {selector}")
                     
                     if not next_button:
                         # Enhanced debugging for pagination elements
@@ -939,17 +1609,13 @@ class PlaywrightScrapingService:
                             pagination_links = await page.locator('.sds-pagination a, .pagination a').count()
                             logger.info(f"🎭 Found {pagination_links} pagination links")
                             
-                            # Log all pagination link text for debugging
+                            # Log all pagination link text for debugging (first 10, read in one round-trip)
                             if pagination_links > 0:
-                                all_links = await page.locator('.sds-pagination a, .pagination a').all()
-                                for i, link in enumerate(all_links[:10]):  # Limit to first 10
-                                    try:
-                                        link_text = await link.text_content()
-                                        aria_label = await link.get_attribute('aria-label')
-                                        href = await link.get_attribute('href')
-                                        logger.info(f"🎭 Pagination link {i+1}: text='{link_text}', aria-label='{aria_label}', href='{href}'")
-                                    except:
-                                        continue
+                                link_infos = await page.locator('.sds-pagination a, .pagination a').evaluate_all(
+                                    "els => els.slice(0, 10).map(a => [a.textContent, a.getAttribute('aria-label'), a.getAttribute('href')])"
+                                )
+                                for i, (link_text, aria_label, href) in enumerate(link_infos):
+                                    logger.info(f"🎭 Pagination link {i+1}: text='{link_text}', aria-label='{aria_label}', href='{href}'")
                             
                             # Check for page numbers
                             page_numbers = await page.locator('.sds-pagination__list li, .pagination li').count()
@@ -962,28 +1628,23 @@ class PlaywrightScrapingService:
                         logger.info("🎭 Trying alternative pagination methods...")
                         
                         # Look for "Load More" or "Show More" buttons
-                        load_more_selectors = [
-                            'button:has-text("Load more")',
-                            'button:has-text("Show more")',
-                            'button:has-text("More results")',
-                            'a:has-text("Load more")',
-                            'a:has-text("Show more")',
-                            '[data-testid="load-more"]',
-                            '.load-more-button'
-                        ]
-                        
                         load_more_found = False
-                        for selector in load_more_selectors:
+                        found = await _first_visible(page, _CARS_COM_LOAD_MORE)
+                        if found:
+                            selector, element = found
+                            logger.info(f"🎭 Found load more button: {selector}")
                             try:
-                                element = page.locator(selector)
-                                if await element.count() > 0 and await element.is_visible():
-                                    logger.info(f"🎭 Found load more button: {selector}")
-                                    await element.click()
-                                    await page.wait_for_timeout(3000)  # Wait for new content
-                                    load_more_found = True
-                                    break
-                            except:
-                                continue
+                                cards_before = await page.locator('.vehicle-card').count()
+                                await element.click()
+                                load_more_found = True
+                                # Wait for the appended cards rather than a fixed delay
+                                await page.wait_for_function(
+                                    "n => document.querySelectorAll('.vehicle-card').length > n",
+                                    arg=cards_before,
+                                    timeout=10000
+                                )
+                            except Exception as e:
+                                logger.debug(f"🎭 Load more did not add cards: {str(e)}")
                         
                         if load_more_found:
                             logger.info("🎭 Clicked load more, checking for new vehicles...")
@@ -998,8 +1659,7 @@ class PlaywrightScrapingService:
                             next_page_url = None
                             if "page=" in current_url:
                                 # URL has page parameter, increment it
-                                import re
-                                page_match = re.search(r'page=(\d+)', current_url)
+                                page_match = _PAGE_PARAM_RE.search(current_url)
                                 if page_match:
                                     current_page_num = int(page_match.group(1))
                                     next_page_url = current_url.replace(f"page={current_page_num}", f"page={current_page_num + 1}")
@@ -1014,7 +1674,10 @@ class PlaywrightScrapingService:
                                 try:
                                     logger.info(f"🎭 Navigating to URL: {next_page_url}")
                                     await page.goto(next_page_url, wait_until="domcontentloaded")
-                                    await page.wait_for_timeout(3000)
+                                    try:
+                                        await page.wait_for_selector('.vehicle-card', state="attached", timeout=10000)
+                                    except Exception:
+                                        pass
                                     
                                     # Check if we got new vehicle content
                                     vehicle_check = await page.locator('.vehicle-card').count()
@@ -1046,32 +1709,38 @@ class PlaywrightScrapingService:
                             break
                         
                         logger.info(f"🎭 Navigating to page {current_page + 1}...")
-                        await next_button.click()
-                    
-                    # Wait for new page to load
-                    await page.wait_for_timeout(3000)
+                        # Tie the wait to the navigation the click starts; a load-state or card wait
+                        # on its own can resolve against the page that's still showing
+                        try:
+                            async with page.expect_navigation(wait_until="domcontentloaded", timeout=10000):
+                                await next_button.click()
+                        except Exception as e:
+                            logger.debug(f"🎭 Next page click did not navigate: {str(e)}")
                     
-                    # Wait for vehicle content to appear
-                    for attempt in range(2):
-                        await page.wait_for_timeout(2000)
-                        vehicle_check = await page.locator('.vehicle-card').count()
-                        if vehicle_check > 0:
-                            logger.info(f"🎭 Page {current_page + 1} loaded with {vehicle_check} vehicles")
-                            break
+                    # Wait for vehicle content to appear on the new page
+                    try:
+                        await page.wait_for_selector('.vehicle-card', state="attached", timeout=10000)
+                    except Exception:
+                        logger.debug(f"🎭 No vehicle cards appeared on page {current_page + 1}")
                     
                     # Extract vehicles from the new page
-                    page_vehicle_cards = await page.locator('.vehicle-card').all()
+                    card_count, page_vehicle_cards = await self._snapshot_cards(page.locator('.vehicle-card'), _CARS_COM_CARD_FIELDS)
+                    logger.info(f"🎭 Page {current_page + 1} loaded with {card_count} vehicles")
                     page_vehicles = []
                     
-                    for i, card in enumerate(page_vehicle_cards[:20]):  # Limit per page
-                        try:
-                            vehicle_data = await self._extract_cars_com_vehicle(card)
-                            if vehicle_data:
-                                page_vehicles.append(vehicle_data)
-                                logger.debug(f"🎭 Page {current_page + 1} - Vehicle {i+1}: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
-                        except Exception as e:
-                            logger.debug(f"🎭 Error extracting vehicle {i+1} on page {current_page + 1}: {str(e)}")
+                    timestamps = _scrape_timestamps()
+                    results = await self._extract_cards(self._extract_cars_com_vehicle, page_vehicle_cards, timestamps)
+                    for i, vehicle_data in enumerate(results):  # Limit per page
+                        if isinstance(vehicle_data, Exception):
+                            logger.debug(f"🎭 Error extracting vehicle {i+1} on page {current_page + 1}: {str(vehicle_data)}")
                             continue
+                        if vehicle_data:
+                            page_vehicles.append(vehicle_data)
+                            logger.debug(
+                                "🎭 Page {} - Vehicle {}: {} {} - ${}",
+                                current_page + 1, i + 1,
+                                vehicle_data.get('make', 'Unknown'), vehicle_data.get('model', 'Unknown'), vehicle_data.get('price', 'Unknown')
+                            )
                     
                     vehicles.extend(page_vehicles)
                     logger.info(f"🎭 Page {current_page + 1}: Added {len(page_vehicles)} vehicles (Total: {len(vehicles)})")
@@ -1083,304 +1752,199 @@ class PlaywrightScrapingService:
                     break
             
             logger.info(f"🎭 Successfully extracted {len(vehicles)} vehicles from {current_page} page(s)")
+            if len(structured_vehicles) > len(vehicles):
+                logger.info(f"🎭 Keeping the {len(structured_vehicles)} JSON-LD vehicles over {len(vehicles)} from cards")
+                return structured_vehicles
             return vehicles
             
         except Exception as e:
             logger.error(f"🎭 Cars.com scraping error: {str(e)}")
             return []
     
-    async def _extract_cars_com_vehicle(self, card) -> Optional[Dict[str, Any]]:
-        """Extract vehicle data from Cars.com listing card"""
+    async def _read_json_ld_vehicles(self, page: Page, marketplace: str, max_results: int) -> List[Dict[str, Any]]:
+        """Parse the JSON-LD listings of the current results page (empty if it has none)"""
+        marketplace_config = self.marketplaces[marketplace]
         try:
+            blocks = await page.evaluate(_JSON_LD_BLOCKS_JS)
+            return http_api_service.parse_json_ld_blocks(
+                blocks,
+                marketplace_config["source"],
+                marketplace_config["base_url"],
+                max_results,
+                _scrape_timestamps()
+            )
+        except Exception as e:
+            logger.debug(f"🎭 Failed to read JSON-LD from {marketplace}: {str(e)}")
+            return []
+    
+    async def _snapshot_cards(self, cards: Locator, fields: Dict[str, List[str]], limit: int = 20) -> Tuple[int, List[Tuple[Locator, Dict[str, Any]]]]:
+        """
+        Snapshot the first `limit` result cards with a single evaluate
+        
+        Args:
+            cards: Locator matching every result card
+            fields: Per-field selector lists (e.g. _CARS_COM_CARD_FIELDS)
+            limit: Maximum number of cards to snapshot
+        
+        Returns:
+            Total number of matching cards, and (card locator, snapshot) pairs
+        """
+        card_count, snapshots = await cards.evaluate_all(_CARD_SNAPSHOTS_JS, [fields, limit, settings.DEBUG])
+        return card_count, [(cards.nth(i), snapshot) for i, snapshot in enumerate(snapshots)]
+    
+    async def _extract_cards(self, extract, cards: List[Tuple[Locator, Dict[str, Any]]], timestamps: Tuple[str, str]) -> List[Any]:
+        """
+        Run a per-card extractor over every snapshotted card concurrently
+        
+        Cards are independent, so the few driver reads a snapshot can't cover
+        (Playwright-only selectors) overlap instead of queuing card by card.
+        
+        Args:
+            extract: Marketplace extractor, e.g. self._extract_cars_com_vehicle
+            cards: (card locator, snapshot) pairs from _snapshot_cards
+            timestamps: Shared (discovered_at, external_id suffix) for the page
+        
+        Returns:
+            One entry per card, in card order: vehicle dict, None, or the exception raised
+        """
+        return await asyncio.gather(
+            *(extract(card, snapshot, timestamps) for card, snapshot in cards),
+            return_exceptions=True
+        )
+    
+    async def _extract_cars_com_vehicle(
+        self,
+        card,
+        snapshot: Optional[Dict[str, Any]] = None,
+        timestamps: Optional[Tuple[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Extract vehicle data from Cars.com listing card (from its snapshot when one was taken for the whole grid)"""
+        try:
+            discovered_at, timestamp = timestamps or _scrape_timestamps()
             vehicle_data = {
                 "source": "cars.com",
-                "discovered_at": datetime.utcnow().isoformat(),
+                "discovered_at": discovered_at,
                 "is_active": True,
                 "images": [],
                 "features": []
             }
             
-            # Get all text content for debugging
-            card_text = await card.text_content()
-            logger.debug(f"🎭 Card text content: {card_text[:300]}...")
-            
-            # Enhanced debugging - log the actual HTML structure
-            try:
-                card_html = await card.inner_html()
-                logger.debug(f"🎭 Card HTML structure (first 400 chars): {card_html[:400]}...")
-                
-                # Log available classes for debugging
-                class_attr = await card.get_attribute('class')
-                if class_attr:
-                    logger.debug(f"🎭 Card classes: {class_attr}")
-            except Exception as debug_error:
-                logger.debug(f"🎭 Debug error: {str(debug_error)}")
+            # Card text, debug info and every field candidate come back from a single evaluate
+            if snapshot is None:
+                snapshot = await card.evaluate(_CARD_SNAPSHOT_JS, [_CARS_COM_CARD_FIELDS, settings.DEBUG])
+            card_text = snapshot["text"]
+            matches = snapshot["matches"]
+            logger.opt(lazy=True).debug("🎭 Card text content: {}...", lambda: card_text[:300])
+            if snapshot["html"] is not None:
+                logger.debug("🎭 Card HTML structure (first 400 chars): {}...", snapshot["html"])
+            if snapshot["classes"]:
+                logger.debug("🎭 Card classes: {}", snapshot["classes"])
             
             # Extract price with multiple selectors (Updated for modern Cars.com)
-            price_selectors = [
-                # Modern Cars.com 2024+ selectors
-                '.sds-card__price',                      # Cars.com design system price
-                '.sds-card__pricing .sds-card__price',   # Nested price structure
-                '[data-cmp="VehicleCard"] .sds-card__price', # Component-based price
-                '[class*="price"] span',                  # Price span elements
-                
-                # Legacy Cars.com selectors
-                '.price-section .primary-price',         # Classic Cars.com price
-                '.price-section-vehicle-card .primary-price', # Specific Cars.com path
-                '.price-section',                        # Cars.com price container
-                '.vehicle-card .price',                  # Generic price in card
-                
-                # Generic fallback selectors
-                '[data-testid="listing-price"]',         # Test ID
-                '.price',                                # Basic price class
-                '.listing-price',                        # Listing price
-                '.vehicle-price',                        # Vehicle price
-                '[class*="price"]',                      # Any class with "price"
-                ':has-text("$")'                         # Any element with $
-            ]
-            
             price_found = False
-            for selector in price_selectors:
-                try:
-                    price_element = card.locator(selector)
-                    if await price_element.count() > 0:
-                        price_text = await price_element.text_content()
-                        if price_text and '$' in price_text:
-                            # Extract numeric price
-                            import re
-                            price_match = re.search(r'\$([0-9,]+)', price_text)
-                            if price_match:
-                                vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
-                                price_found = True
-                                logger.debug(f"🎭 Found price: ${vehicle_data['price']} using {selector}")
-                                break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract price with {selector}: {str(e)}")
-                    continue
+            async for selector, price_text in _card_candidates(card, _CARS_COM_PRICE_SELECTORS, matches["price"]):
+                if '$' in price_text:
+                    # Extract numeric price
+                    price_match = _PRICE_RE.search(price_text)
+                    if price_match:
+                        vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
+                        price_found = True
+                        logger.debug("🎭 Found price: ${} using {}", vehicle_data['price'], selector)
+                        break
             
             # If no price found with selectors, try text content search
             if not price_found and card_text:
-                import re
-                price_match = re.search(r'\$([0-9,]+)', card_text)
+                price_match = _PRICE_RE.search(card_text)
                 if price_match:
                     vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
                     price_found = True
-                    logger.debug(f"🎭 Found price from text content: ${vehicle_data['price']}")
+                    logger.debug("🎭 Found price from text content: ${}", vehicle_data['price'])
             
             # Extract year, make, model with multiple selectors (Updated for modern Cars.com)
-            title_selectors = [
-                # Modern Cars.com 2024+ selectors
-                '.sds-card__title',                      # Cars.com design system title
-                '.sds-card__header .sds-card__title',    # Nested title structure
-                'h3.sds-card__title',                    # H3 with SDS title class
-                '[data-cmp="VehicleCard"] .sds-card__title', # Component title
-                'article h3',                            # Article heading
-                'article h2',                            # Article secondary heading
-                
-                # Legacy Cars.com selectors
-                '.vehicle-card-link',                    # Classic Cars.com vehicle link
-                '.vehicle-card h3',                      # Cars.com title structure
-                '.vehicle-card h2',                      # Alternative Cars.com title
-                '.vehicle-details .vehicle-info',        # Cars.com vehicle info section
-                
-                # Generic fallback selectors
-                '[data-testid="listing-title"]',         # Test ID
-                '.listing-title',                        # Listing title
-                '.vehicle-title',                        # Vehicle title
-                '.car-title',                            # Car title
-                'h2', 'h3', 'h4',                       # Any heading
-                'a[href*="vehicle"]',                    # Links to vehicle pages
-                'a[href*="listing"]'                     # Links to listing pages
-            ]
-            
             title_found = False
-            for selector in title_selectors:
-                try:
-                    title_element = card.locator(selector)
-                    if await title_element.count() > 0:
-                        title_text = await title_element.text_content()
-                        if title_text and any(word in title_text.lower() for word in ['honda', 'accord', '2016', '2017', '2018', '2019', '2020', '2021']):
-                            # Parse title like "2019 Honda Accord EX"
-                            title_parts = title_text.strip().split()
-                            if len(title_parts) >= 3:
-                                year_candidate = title_parts[0]
-                                if year_candidate.isdigit() and 2000 <= int(year_candidate) <= 2030:
-                                    vehicle_data["year"] = int(year_candidate)
-                                    vehicle_data["make"] = title_parts[1]
-                                    vehicle_data["model"] = title_parts[2]
-                                    title_found = True
-                                    logger.debug(f"🎭 Found title: {title_text} using {selector}")
-                                    break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract title with {selector}: {str(e)}")
-                    continue
+            async for selector, title_text in _card_candidates(card, _CARS_COM_TITLE_SELECTORS, matches["title"]):
+                if _CARS_COM_TITLE_KEYWORDS_RE.search(title_text):
+                    # Parse title like "2019 Honda Accord EX"
+                    title_match = _TITLE_RE.match(title_text)
+                    if title_match:
+                        vehicle_data["year"] = int(title_match.group(1))
+                        vehicle_data["make"] = title_match.group(2)
+                        vehicle_data["model"] = title_match.group(3)
+                        title_found = True
+                        logger.debug("🎭 Found title: {} using {}", title_text, selector)
+                        break
             
             # If no title found with selectors, try text content search
             if not title_found and card_text:
-                import re
+                card_text_lower = card_text.lower()
+                
                 # Look for year patterns
-                year_match = re.search(r'\b(20[0-2][0-9])\b', card_text)
+                year_match = _YEAR_RE.search(card_text)
                 if year_match:
                     vehicle_data["year"] = int(year_match.group(1))
                 
-                # Define common makes to search for
-                makes = ['Honda', 'Toyota', 'BMW', 'Mercedes', 'Audi', 'Lexus', 'Acura', 'Infiniti', 
-                        'Volkswagen', 'Nissan', 'Hyundai', 'Kia', 'Ford', 'Chevrolet', 'Cadillac', 
-                        'Buick', 'Mazda', 'Subaru', 'Jeep', 'Ram', 'Dodge', 'Chrysler']
-                
                 # Look for make in text content (case insensitive)
-                for make in makes:
-                    if make.lower() in card_text.lower():
+                for make in _FALLBACK_MAKES:
+                    if make.lower() in card_text_lower:
                         vehicle_data["make"] = make
-                        logger.debug(f"🎭 Found make from text: {make}")
+                        logger.debug("🎭 Found make from text: {}", make)
                         break
                 
                 # Look for model patterns (after the make if found)
                 if "make" in vehicle_data:
                     make = vehicle_data["make"]
                     # Look for text after the make
-                    make_pattern = rf'{make}\s+([A-Za-z0-9\-]+)'
-                    model_match = re.search(make_pattern, card_text, re.IGNORECASE)
+                    model_match = _MODEL_AFTER_MAKE_RES[make].search(card_text)
                     if model_match:
                         potential_model = model_match.group(1)
                         # Filter out years and common non-model words
-                        if not re.match(r'^\d{4}$', potential_model) and potential_model.lower() not in ['for', 'sale', 'used', 'new']:
+                        if not _FOUR_DIGITS_RE.match(potential_model) and potential_model.lower() not in ['for', 'sale', 'used', 'new']:
                             vehicle_data["model"] = potential_model
-                            logger.debug(f"🎭 Found model from text: {potential_model}")
+                            logger.debug("🎭 Found model from text: {}", potential_model)
                 
                 # Look for specific model names if no pattern match
                 if "model" not in vehicle_data:
-                    models = ['Accord', 'Civic', 'Camry', 'Corolla', 'X3', 'X5', 'X1', 'A4', 'A6', 'ES', 'IS', 'RX']
-                    for model in models:
-                        if model.lower() in card_text.lower():
+                    for model in _FALLBACK_MODELS:
+                        if model.lower() in card_text_lower:
                             vehicle_data["model"] = model
-                            logger.debug(f"🎭 Found model from text: {model}")
+                            logger.debug("🎭 Found model from text: {}", model)
                             break
                 
                 if "make" in vehicle_data or "model" in vehicle_data:
                     title_found = True
-                    logger.debug(f"🎭 Successfully extracted make/model from text content")
+                    logger.debug("🎭 Successfully extracted make/model from text content")
             
             # Extract mileage with multiple selectors (Updated for modern Cars.com)
-            mileage_selectors = [
-                # Modern Cars.com 2024+ selectors
-                '.sds-card__mileage',                    # Cars.com design system mileage
-                '.sds-card__extra',                      # Cars.com extra info (may contain mileage)
-                '[data-cmp="VehicleCard"] .sds-card__mileage', # Component mileage
-                'span:has-text("mi")',                   # Span containing "mi"
-                'span:has-text("miles")',                # Span containing "miles"
-                
-                # Legacy Cars.com selectors
-                '.vehicle-card .mileage',                # Cars.com mileage class
-                '.vehicle-details .mileage',             # Cars.com vehicle details
-                '.vehicle-card-main .mileage',           # Cars.com card main section
-                
-                # Generic fallback selectors
-                '[data-testid="listing-mileage"]',       # Test ID
-                '.mileage',                              # Basic mileage class
-                '.listing-mileage',                      # Listing mileage
-                ':has-text("miles")',                    # Text containing "miles"
-                ':has-text("mi")',                       # Text containing "mi"
-                '[class*="mileage"]'                     # Any class with "mileage"
-            ]
-            
-            for selector in mileage_selectors:
-                try:
-                    mileage_element = card.locator(selector)
-                    if await mileage_element.count() > 0:
-                        mileage_text = await mileage_element.text_content()
-                        if mileage_text:
-                            # Extract numeric mileage
-                            import re
-                            mileage_match = re.search(r'([0-9,]+)', mileage_text)
-                            if mileage_match:
-                                vehicle_data["mileage"] = int(mileage_match.group(1).replace(',', ''))
-                                logger.debug(f"🎭 Found mileage: {vehicle_data['mileage']} using {selector}")
-                                break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract mileage with {selector}: {str(e)}")
-                    continue
+            async for selector, mileage_text in _card_candidates(card, _CARS_COM_MILEAGE_SELECTORS, matches["mileage"]):
+                # Extract numeric mileage
+                mileage_match = _MILEAGE_RE.search(mileage_text)
+                if mileage_match:
+                    vehicle_data["mileage"] = int(mileage_match.group(1).replace(',', ''))
+                    logger.debug("🎭 Found mileage: {} using {}", vehicle_data['mileage'], selector)
+                    break
             
             # Extract location with multiple selectors (Updated for modern Cars.com)
-            location_selectors = [
-                # Modern Cars.com 2024+ selectors
-                '.sds-card__extra span',                 # Cars.com extra info span
-                '[data-cmp="VehicleCard"] .location',    # Component location
-                'span:has-text(",")span:has-text("CA")', # State abbreviations
-                'span:has-text(",")span:has-text("FL")', # State abbreviations
-                'span:has-text(",")span:has-text("TX")', # State abbreviations
-                
-                # Legacy Cars.com selectors
-                '[data-testid="listing-dealer-city-state"]', # Test ID
-                '.location',                             # Basic location class
-                '.dealer-location',                      # Dealer location
-                '.listing-location',                     # Listing location
-                
-                # Generic fallback selectors
-                '[class*="location"]',                   # Any class with "location"
-                ':has-text("," )',                       # Text with comma (city, state)
-                'span[title*="location"]'                # Span with location in title
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_element = card.locator(selector)
-                    if await location_element.count() > 0:
-                        location_text = await location_element.text_content()
-                        if location_text:
-                            vehicle_data["location"] = location_text.strip()
-                            logger.debug(f"🎭 Found location: {vehicle_data['location']} using {selector}")
-                            break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract location with {selector}: {str(e)}")
-                    continue
+            async for selector, location_text in _card_candidates(card, _CARS_COM_LOCATION_SELECTORS, matches["location"]):
+                vehicle_data["location"] = location_text.strip()
+                logger.debug("🎭 Found location: {} using {}", vehicle_data['location'], selector)
+                break
             
             # Extract URL (Updated for modern Cars.com structure)
-            link_selectors = [
-                # Modern Cars.com 2024+ selectors
-                '.sds-card__link',                       # Cars.com design system link
-                'article a[href*="/vehicle"]',           # Article with vehicle link
-                'a[data-tracking-id*="srp_listing"]',    # Tracking-based link
-                'a[data-cmp="VehicleCard"]',             # Component-based link
-                'a.sds-card__link',                      # SDS card link class
-                
-                # Legacy Cars.com selectors
-                'a.vehicle-card-link',                   # Classic Cars.com link
-                'a[href*="/vehicledetail/"]',            # Legacy vehicle detail URLs
-                '.vehicle-card-link',                    # Cars.com link class
-                'a[data-linkname="vehicle-listing"]',    # Cars.com tracking attribute
-                
-                # Generic fallback selectors
-                'a[href*="/vehicle/"]',                  # Generic vehicle URLs
-                'a[href*="/listing/"]',                  # Generic listing URLs
-                'a[href*="/shopping/"]',                 # Shopping URLs
-                'a[href*="cars.com"]',                   # Cars.com URLs
-                'a'                                      # Fallback to any link
-            ]
-            
-            for selector in link_selectors:
-                try:
-                    link_element = card.locator(selector)
-                    if await link_element.count() > 0:
-                        href = await link_element.get_attribute('href')
-                        if href and ('vehicle' in href or 'listing' in href):
-                            vehicle_data["url"] = href if href.startswith('http') else f"https://www.cars.com{href}"
-                            logger.debug(f"🎭 Found URL: {vehicle_data['url']} using {selector}")
-                            break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract URL with {selector}: {str(e)}")
-                    continue
+            async for selector, href in _card_candidates(card, _CARS_COM_LINK_SELECTORS, matches["url"], attribute="href"):
+                if 'vehicle' in href or 'listing' in href:
+                    vehicle_data["url"] = href if href.startswith('http') else _CARS_COM_BASE_URL + href
+                    logger.debug("🎭 Found URL: {} using {}", vehicle_data['url'], selector)
+                    break
             
             # Generate external ID if we have enough data
             if "make" in vehicle_data and "model" in vehicle_data:
-                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
                 price_part = vehicle_data.get("price", "unknown")
                 year_part = vehicle_data.get("year", "unknown")
                 vehicle_data["external_id"] = f"{vehicle_data['make']}_{vehicle_data['model']}_{year_part}_{price_part}_{timestamp}"
             
             # Only return if we have essential data (at least make or price)
             if "price" in vehicle_data or "make" in vehicle_data:
-                logger.debug(f"🎭 Successfully extracted vehicle data: {vehicle_data}")
+                logger.debug("🎭 Successfully extracted vehicle data: {}", vehicle_data)
                 return vehicle_data
             else:
                 logger.debug("🎭 Not enough data extracted to create vehicle record")
@@ -1390,197 +1954,114 @@ class PlaywrightScrapingService:
             logger.debug(f"🎭 Error extracting Cars.com vehicle data: {str(e)}")
             return None
     
-    async def _extract_edmunds_vehicle(self, card) -> Optional[Dict[str, Any]]:
-        """Extract vehicle data from Edmunds listing card"""
+    async def _extract_edmunds_vehicle(
+        self,
+        card,
+        snapshot: Optional[Dict[str, Any]] = None,
+        timestamps: Optional[Tuple[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Extract vehicle data from Edmunds listing card (from its snapshot when one was taken for the whole grid)"""
         try:
+            discovered_at, timestamp = timestamps or _scrape_timestamps()
             vehicle_data = {
                 "source": "edmunds.com",
-                "discovered_at": datetime.utcnow().isoformat(),
+                "discovered_at": discovered_at,
                 "is_active": True,
                 "images": [],
                 "features": []
             }
             
-            # Get all text content for debugging
-            card_text = await card.text_content()
-            logger.debug(f"🎭 Card text content: {card_text[:200]}...")
+            # Card text and every field candidate come back from a single evaluate
+            if snapshot is None:
+                snapshot = await card.evaluate(_CARD_SNAPSHOT_JS, [_EDMUNDS_CARD_FIELDS, settings.DEBUG])
+            card_text = snapshot["text"]
+            matches = snapshot["matches"]
+            logger.opt(lazy=True).debug("🎭 Card text content: {}...", lambda: card_text[:200])
             
             # Extract price with multiple selectors (Edmunds structure)
-            price_selectors = [
-                '.price',  # Generic price class
-                '.pricing-info .price',  # Edmunds pricing structure
-                '.vehicle-price',  # Vehicle price class
-                '.listing-price',  # Listing price class
-                '[data-testid*="price"]',  # Test ID patterns
-                '.price-display',  # Price display class
-                '.cost',  # Cost class
-                ':has-text("$")'  # Any element containing $
-            ]
-            
             price_found = False
-            for selector in price_selectors:
-                try:
-                    price_element = card.locator(selector)
-                    if await price_element.count() > 0:
-                        price_text = await price_element.text_content()
-                        if price_text and '$' in price_text:
-                            # Extract numeric price
-                            import re
-                            price_match = re.search(r'\$([0-9,]+)', price_text)
-                            if price_match:
-                                vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
-                                price_found = True
-                                logger.debug(f"🎭 Found price: ${vehicle_data['price']} using {selector}")
-                                break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract price with {selector}: {str(e)}")
-                    continue
+            async for selector, price_text in _card_candidates(card, _EDMUNDS_PRICE_SELECTORS, matches["price"]):
+                if '$' in price_text:
+                    # Extract numeric price
+                    price_match = _PRICE_RE.search(price_text)
+                    if price_match:
+                        vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
+                        price_found = True
+                        logger.debug("🎭 Found price: ${} using {}", vehicle_data['price'], selector)
+                        break
             
             # If no price found with selectors, try text content search
             if not price_found and card_text:
-                import re
-                price_match = re.search(r'\$([0-9,]+)', card_text)
+                price_match = _PRICE_RE.search(card_text)
                 if price_match:
                     vehicle_data["price"] = int(price_match.group(1).replace(',', ''))
                     price_found = True
-                    logger.debug(f"🎭 Found price from text content: ${vehicle_data['price']}")
+                    logger.debug("🎭 Found price from text content: ${}", vehicle_data['price'])
             
             # Extract year, make, model with multiple selectors (Edmunds structure)
-            title_selectors = [
-                '.vehicle-title',  # Edmunds vehicle title
-                '.listing-title',  # Listing title
-                '.vehicle-name',  # Vehicle name
-                '.car-title',  # Car title
-                'h2', 'h3', 'h4',  # Heading tags
-                '.title',  # Generic title
-                '[data-testid*="title"]',  # Test ID patterns
-                'a[href*="/inventory/"]',  # Inventory links
-                'a[href*="/vehicle/"]'  # Vehicle links
-            ]
-            
             title_found = False
-            for selector in title_selectors:
-                try:
-                    title_element = card.locator(selector)
-                    if await title_element.count() > 0:
-                        title_text = await title_element.text_content()
-                        if title_text and any(word in title_text.lower() for word in ['honda', 'accord', '2016', '2017', '2018', '2019', '2020', '2021', '2022', '2023', '2024', '2025']):
-                            # Parse title like "2019 Honda Accord EX"
-                            title_parts = title_text.strip().split()
-                            if len(title_parts) >= 3:
-                                year_candidate = title_parts[0]
-                                if year_candidate.isdigit() and 2000 <= int(year_candidate) <= 2030:
-                                    vehicle_data["year"] = int(year_candidate)
-                                    vehicle_data["make"] = title_parts[1]
-                                    vehicle_data["model"] = title_parts[2]
-                                    title_found = True
-                                    logger.debug(f"🎭 Found title: {title_text} using {selector}")
-                                    break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract title with {selector}: {str(e)}")
-                    continue
+            async for selector, title_text in _card_candidates(card, _EDMUNDS_TITLE_SELECTORS, matches["title"]):
+                if _EDMUNDS_TITLE_KEYWORDS_RE.search(title_text):
+                    # Parse title like "2019 Honda Accord EX"
+                    title_match = _TITLE_RE.match(title_text)
+                    if title_match:
+                        vehicle_data["year"] = int(title_match.group(1))
+                        vehicle_data["make"] = title_match.group(2)
+                        vehicle_data["model"] = title_match.group(3)
+                        title_found = True
+                        logger.debug("🎭 Found title: {} using {}", title_text, selector)
+                        break
             
             # If no title found with selectors, try text content search
             if not title_found and card_text:
-                import re
+                card_text_lower = card_text.lower()
+                
                 # Look for year patterns
-                year_match = re.search(r'\b(20[0-2][0-9])\b', card_text)
+                year_match = _YEAR_RE.search(card_text)
                 if year_match:
                     vehicle_data["year"] = int(year_match.group(1))
                 
                 # Look for Honda/Accord specifically
-                if 'honda' in card_text.lower():
+                if 'honda' in card_text_lower:
                     vehicle_data["make"] = "Honda"
-                if 'accord' in card_text.lower():
+                if 'accord' in card_text_lower:
                     vehicle_data["model"] = "Accord"
                 
                 if "make" in vehicle_data and "model" in vehicle_data:
                     title_found = True
-                    logger.debug(f"🎭 Found make/model from text content")
+                    logger.debug("🎭 Found make/model from text content")
             
             # Extract mileage with multiple selectors (Edmunds structure)
-            mileage_selectors = [
-                '.mileage',  # Mileage class
-                '.vehicle-mileage',  # Vehicle mileage
-                '.odometer',  # Odometer reading
-                '[data-testid*="mileage"]',  # Test ID patterns
-                ':has-text("miles")',  # Text containing "miles"
-                ':has-text("mi")'  # Text containing "mi"
-            ]
-            
-            for selector in mileage_selectors:
-                try:
-                    mileage_element = card.locator(selector)
-                    if await mileage_element.count() > 0:
-                        mileage_text = await mileage_element.text_content()
-                        if mileage_text:
-                            # Extract numeric mileage
-                            import re
-                            mileage_match = re.search(r'([0-9,]+)', mileage_text)
-                            if mileage_match:
-                                vehicle_data["mileage"] = int(mileage_match.group(1).replace(',', ''))
-                                logger.debug(f"🎭 Found mileage: {vehicle_data['mileage']} using {selector}")
-                                break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract mileage with {selector}: {str(e)}")
-                    continue
+            async for selector, mileage_text in _card_candidates(card, _EDMUNDS_MILEAGE_SELECTORS, matches["mileage"]):
+                # Extract numeric mileage
+                mileage_match = _MILEAGE_RE.search(mileage_text)
+                if mileage_match:
+                    vehicle_data["mileage"] = int(mileage_match.group(1).replace(',', ''))
+                    logger.debug("🎭 Found mileage: {} using {}", vehicle_data['mileage'], selector)
+                    break
             
             # Extract location with multiple selectors
-            location_selectors = [
-                '.location',  # Location class
-                '.dealer-location',  # Dealer location
-                '.listing-location',  # Listing location
-                '.vehicle-location',  # Vehicle location
-                '[data-testid*="location"]'  # Test ID patterns
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_element = card.locator(selector)
-                    if await location_element.count() > 0:
-                        location_text = await location_element.text_content()
-                        if location_text:
-                            vehicle_data["location"] = location_text.strip()
-                            logger.debug(f"🎭 Found location: {vehicle_data['location']} using {selector}")
-                            break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract location with {selector}: {str(e)}")
-                    continue
+            async for selector, location_text in _card_candidates(card, _EDMUNDS_LOCATION_SELECTORS, matches["location"]):
+                vehicle_data["location"] = location_text.strip()
+                logger.debug("🎭 Found location: {} using {}", vehicle_data['location'], selector)
+                break
             
             # Extract URL (Edmunds structure)
-            link_selectors = [
-                'a[href*="/inventory/"]',  # Edmunds inventory URLs
-                'a[href*="/vehicle/"]',  # Edmunds vehicle URLs
-                'a[href*="/used/"]',  # Used vehicle URLs
-                'a[href*="/new/"]',  # New vehicle URLs
-                '.vehicle-link',  # Vehicle link class
-                '.listing-link',  # Listing link class
-                'a'  # Fallback to any link
-            ]
-            
-            for selector in link_selectors:
-                try:
-                    link_element = card.locator(selector)
-                    if await link_element.count() > 0:
-                        href = await link_element.get_attribute('href')
-                        if href and ('vehicle' in href or 'inventory' in href):
-                            vehicle_data["url"] = href if href.startswith('http') else f"https://www.edmunds.com{href}"
-                            logger.debug(f"🎭 Found URL: {vehicle_data['url']} using {selector}")
-                            break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to extract URL with {selector}: {str(e)}")
-                    continue
+            async for selector, href in _card_candidates(card, _EDMUNDS_LINK_SELECTORS, matches["url"], attribute="href"):
+                if 'vehicle' in href or 'inventory' in href:
+                    vehicle_data["url"] = href if href.startswith('http') else _EDMUNDS_BASE_URL + href
+                    logger.debug("🎭 Found URL: {} using {}", vehicle_data['url'], selector)
+                    break
             
             # Generate external ID if we have enough data
             if "make" in vehicle_data and "model" in vehicle_data:
-                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
                 price_part = vehicle_data.get("price", "unknown")
                 year_part = vehicle_data.get("year", "unknown")
                 vehicle_data["external_id"] = f"{vehicle_data['make']}_{vehicle_data['model']}_{year_part}_{price_part}_{timestamp}"
             
             # Only return if we have essential data (at least make or price)
             if "price" in vehicle_data or "make" in vehicle_data:
-                logger.debug(f"🎭 Successfully extracted vehicle data: {vehicle_data}")
+                logger.debug("🎭 Successfully extracted vehicle data: {}", vehicle_data)
                 return vehicle_data
             else:
                 logger.debug("🎭 Not enough data extracted to create vehicle record")
@@ -1590,8 +2071,14 @@ class PlaywrightScrapingService:
             logger.debug(f"🎭 Error extracting Edmunds vehicle data: {str(e)}")
             return None
     
-    async def _scrape_edmunds(self, page: Page, criteria: SearchCriteria, location_zip: str) -> List[Dict[str, Any]]:
-        """Scrape Edmunds using form automation"""
+    async def _scrape_edmunds(
+        self,
+        page: Page,
+        criteria: SearchCriteria,
+        location_zip: str,
+        collected: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scrape Edmunds using form automation, appending vehicles to `collected` as they're extracted"""
         try:
             logger.info("🎭 Navigating to Edmunds...")
             
@@ -1637,8 +2124,11 @@ class PlaywrightScrapingService:
                     logger.info("🎭 Trying Edmunds used cars page...")
                     await page.goto("https://www.edmunds.com/used-cars-for-sale/", wait_until="domcontentloaded", timeout=30000)
             
-            # Wait for page to load
-            await page.wait_for_timeout(5000)
+            # Wait for the search box or listings instead of a fixed delay
+            try:
+                await page.locator(_EDMUNDS_PAGE_READY).first.wait_for(state="visible", timeout=10000)
+            except Exception:
+                logger.info("🎭 No search box or listings visible yet, continuing...")
             logger.info("🎭 Page loaded, looking for search elements...")
             
             # Take a screenshot for debugging and log page info
@@ -1656,30 +2146,17 @@ class PlaywrightScrapingService:
                 
                 # Try using Edmunds' global search first (semantic search)
                 search_found = False
-                search_selectors = [
-                    'textarea[name="query"]',  # Edmunds main search field (PRIORITY)
-                    '.global-search-input',  # Edmunds global search class
-                    'textarea[placeholder*="looking for"]',  # Edmunds placeholder text
-                    'textarea[aria-label="Search:"]',  # Edmunds aria label
-                    '.autosized-area-field',  # Edmunds search field class
-                    'input[type="search"]',
-                    '.search-input',
-                    '#search-input'
-                ]
-                
-                for selector in search_selectors:
+                found = await _first_visible(page, _EDMUNDS_SEARCH_INPUTS)
+                if found:
+                    selector, element = found
                     try:
-                        element = page.locator(selector)
-                        if await element.count() > 0 and await element.is_visible():
-                            logger.info(f"🎭 Found search input: {selector}")
-                            await element.clear()
-                            await element.fill(search_query)
-                            search_found = True
-                            logger.info(f"🎭 Successfully filled search input: {selector}")
-                            break
+                        logger.info(f"🎭 Found search input: {selector}")
+                        await element.clear()
+                        await element.fill(search_query)
+                        search_found = True
+                        logger.info(f"🎭 Successfully filled search input: {selector}")
                     except Exception as e:
                         logger.debug(f"🎭 Failed to fill {selector}: {str(e)}")
-                        continue
                 
                 if not search_found:
                     logger.warning("🎭 Global search not found, trying direct inventory navigation...")
@@ -1687,8 +2164,11 @@ class PlaywrightScrapingService:
                     year = criteria.year_min if criteria.year_min else "2020"  # Default year
                     inventory_url = f"https://www.edmunds.com/inventory/srp.html?make={make.lower()}&model={model.lower()}&year={year}"
                     logger.info(f"🎭 Navigating directly to: {inventory_url}")
-                    await page.goto(inventory_url, wait_until="domcontentloaded")
-                    await page.wait_for_timeout(3000)
+                    await page.goto(inventory_url, wait_until="commit")
+                    try:
+                        await page.locator(_EDMUNDS_LISTINGS).first.wait_for(state="attached", timeout=10000)
+                    except Exception:
+                        await page.wait_for_load_state("domcontentloaded")
                 else:
                     # Submit the search
                     logger.info("🎭 Submitting search...")
@@ -1705,35 +2185,25 @@ class PlaywrightScrapingService:
                     
                     # Method 2: Look for search button
                     if not submitted:
-                        search_button_selectors = [
-                            '.global-search-form button[type="submit"]',
-                            '.search-button',
-                            'button:has-text("Search")',
-                            '[data-tracking-id*="search"]'
-                        ]
-                        
-                        for selector in search_button_selectors:
+                        found = await _first_visible(page, _EDMUNDS_SEARCH_BUTTONS)
+                        if found:
+                            selector, button = found
                             try:
-                                button = page.locator(selector)
-                                if await button.count() > 0 and await button.is_visible():
-                                    await button.click()
-                                    submitted = True
-                                    logger.info(f"🎭 Clicked search button: {selector}")
-                                    break
+                                await button.click()
+                                submitted = True
+                                logger.info(f"🎭 Clicked search button: {selector}")
                             except Exception as e:
                                 logger.debug(f"🎭 Failed to click button {selector}: {str(e)}")
-                                continue
                     
                     if submitted:
                         logger.info("🎭 Search submitted, waiting for results...")
                         
-                        # Wait for navigation to results page
+                        # Wait for the first listing rather than networkidle (ads/analytics never settle)
                         try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                            logger.info("🎭 Page reached networkidle state")
-                        except:
-                            logger.info("🎭 Networkidle timeout, continuing...")
-                            await page.wait_for_timeout(3000)
+                            await page.locator(_EDMUNDS_LISTINGS).first.wait_for(state="attached", timeout=10000)
+                            logger.info("🎭 Listings detected")
+                        except Exception:
+                            logger.info("🎭 No listings within 10s, continuing...")
                     else:
                         logger.error("🎭 Could not submit search")
                         return []
@@ -1749,47 +2219,26 @@ class PlaywrightScrapingService:
                 logger.warning(f"🎭 Unexpected page URL: {current_url}")
             
             # Extract vehicle data with multiple approaches
-            vehicles = []
-            
-            # Try different selectors for vehicle listings (Based on Edmunds structure)
-            vehicle_selectors = [
-                '.inventory-listing',  # Common Edmunds inventory class
-                '.vehicle-card',  # Standard vehicle card class
-                '.listing-card',  # Alternative listing class
-                '[data-testid*="vehicle"]',  # Test ID patterns
-                '[data-testid*="listing"]',  # Test ID patterns
-                '.search-result',  # Generic search result
-                '.car-listing',  # Car listing class
-                '[class*="listing"]',  # Any class containing "listing"
-                '[class*="vehicle"]',  # Any class containing "vehicle"
-                '.result-item',  # Generic result item
-                '.inventory-item'  # Inventory item class
-            ]
+            vehicles = collected if collected is not None else []
             
+            # First matching vehicle-listing selector, then every card's fields, in two round-trips
             vehicle_cards = []
-            used_selector = None
-            
-            for selector in vehicle_selectors:
-                try:
-                    cards = await page.locator(selector).all()
-                    if len(cards) > 0:
-                        vehicle_cards = cards
-                        used_selector = selector
-                        logger.info(f"🎭 Found {len(vehicle_cards)} vehicle cards using selector: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"🎭 Failed to find vehicles with {selector}: {str(e)}")
-                    continue
+            used_selector = await page.evaluate(_FIRST_MATCHING_SELECTOR_JS, list(_EDMUNDS_VEHICLE_CARDS))
+            if used_selector:
+                card_count, vehicle_cards = await self._snapshot_cards(page.locator(used_selector), _EDMUNDS_CARD_FIELDS)
+                logger.info(f"🎭 Found {card_count} vehicle cards using selector: {used_selector}")
             
             # If no cards found with specific selectors, try generic approach
             if not vehicle_cards:
                 logger.warning("🎭 No vehicle cards found with specific selectors, trying generic approach...")
                 
                 # Look for any elements that might contain vehicle data
-                potential_cards = await page.locator('div:has-text("$"), div:has-text("Honda"), div:has-text("Accord")').all()
-                if potential_cards:
-                    logger.info(f"🎭 Found {len(potential_cards)} potential vehicle elements")
-                    vehicle_cards = potential_cards[:20]  # Limit to reasonable number
+                card_count, vehicle_cards = await self._snapshot_cards(
+                    page.locator('div:has-text("$"), div:has-text("Honda"), div:has-text("Accord")'),
+                    _EDMUNDS_CARD_FIELDS
+                )
+                if vehicle_cards:
+                    logger.info(f"🎭 Found {card_count} potential vehicle elements")
                     used_selector = "generic price/vehicle text"
             
             # If still no results, log page content for debugging
@@ -1799,22 +2248,11 @@ class PlaywrightScrapingService:
                 logger.info(f"🎭 Page title: {page_title}")
                 
                 # Check if there's a "no results" message
-                no_results_selectors = [
-                    ':has-text("No results")',
-                    ':has-text("no vehicles")',
-                    ':has-text("0 results")',
-                    '.no-results',
-                    '.empty-results'
-                ]
-                
-                for selector in no_results_selectors:
-                    try:
-                        no_results = await page.locator(selector).count()
-                        if no_results > 0:
-                            logger.info(f"🎭 Found 'no results' message: {selector}")
-                            break
-                    except:
-                        continue
+                try:
+                    if await page.locator(_NO_RESULTS).count() > 0:
+                        logger.info("🎭 Found 'no results' message")
+                except Exception:
+                    pass
                 
                 # Enhanced debugging: check for specific Edmunds elements
                 try:
@@ -1823,23 +2261,22 @@ class PlaywrightScrapingService:
                     logger.info(f"🎭 Found {inventory_containers} inventory containers")
                     
                     # Get page text for debugging (first 500 chars)
-                    page_text = await page.locator('body').text_content()
-                    if page_text:
-                        logger.debug(f"🎭 Page content preview: {page_text[:500]}...")
+                    if settings.DEBUG:
+                        page_text = await page.evaluate("() => (document.body.textContent || '').slice(0, 500)")
+                        logger.debug(f"🎭 Page content preview: {page_text}...")
                 except Exception as e:
                     logger.debug(f"🎭 Error during enhanced debugging: {str(e)}")
             
             # Process found vehicle cards on current page
-            for i, card in enumerate(vehicle_cards[:20]):  # Limit to first 20 results per page
-                try:
-                    logger.debug(f"🎭 Processing vehicle card {i+1}/{len(vehicle_cards)}")
-                    vehicle_data = await self._extract_edmunds_vehicle(card)
-                    if vehicle_data:
-                        vehicles.append(vehicle_data)
-                        logger.info(f"🎭 Successfully extracted vehicle: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
-                except Exception as e:
-                    logger.debug(f"🎭 Error extracting vehicle {i+1}: {str(e)}")
+            timestamps = _scrape_timestamps()
+            results = await self._extract_cards(self._extract_edmunds_vehicle, vehicle_cards, timestamps)
+            for i, vehicle_data in enumerate(results):  # Snapshots cover the first 20 results
+                if isinstance(vehicle_data, Exception):
+                    logger.debug(f"🎭 Error extracting vehicle {i+1}: {str(vehicle_data)}")
                     continue
+                if vehicle_data:
+                    vehicles.append(vehicle_data)
+                    logger.info(f"🎭 Successfully extracted vehicle: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
             
             logger.info(f"🎭 Extracted {len(vehicles)} vehicles from current page")
             
@@ -1850,29 +2287,11 @@ class PlaywrightScrapingService:
             while current_page < max_pages and len(vehicles) < 20:  # Max 40 vehicles for testing
                 try:
                     # Look for "Next" button or page links (Edmunds structure)
-                    next_selectors = [
-                        '.pagination a[aria-label="Next Page"]',  # Edmunds pagination
-                        '.pagination a[title="Next"]',
-                        'a[aria-label="Go to next page"]',
-                        '.pagination a:has-text("Next")',
-                        '.pagination [aria-label*="next"]',
-                        'button:has-text("Next")',
-                        '[data-testid="pagination-next"]',
-                        'a:has-text("›")',  # Next arrow symbol
-                        'a:has-text("❯")',  # Alternative arrow
-                        'a[title*="Next"]'
-                    ]
-                    
                     next_button = None
-                    for selector in next_selectors:
-                        try:
-                            element = page.locator(selector)
-                            if await element.count() > 0 and await element.is_visible():
-                                next_button = element
-                                logger.info(f"🎭 Found next page button: {selector}")
-                                break
-                        except:
-                            continue
+                    found = await _first_visible(page, _EDMUNDS_NEXT_PAGE)
+                    if found:
+                        selector, next_button = found
+                        logger.info(f"🎭 Found next page button: {selector}")
                     
                     if not next_button:
                         logger.info("🎭 No next page button found, stopping pagination")
@@ -1887,30 +2306,34 @@ class PlaywrightScrapingService:
                     logger.info(f"🎭 Navigating to page {current_page + 1}...")
                     await next_button.click()
                     
-                    # Wait for new page to load
-                    await page.wait_for_timeout(3000)
-                    
-                    # Wait for vehicle content to appear
-                    for attempt in range(2):
-                        await page.wait_for_timeout(2000)
-                        vehicle_check = await page.locator('.inventory-listing, .vehicle-card').count()
-                        if vehicle_check > 0:
-                            logger.info(f"🎭 Page {current_page + 1} loaded with {vehicle_check} vehicles")
-                            break
+                    # Wait for vehicle content to appear on the new page
+                    try:
+                        await page.wait_for_load_state("domcontentloaded", timeout=10000)
+                        await page.wait_for_selector('.inventory-listing, .vehicle-card', state="attached", timeout=7000)
+                        logger.info(f"🎭 Page {current_page + 1} loaded")
+                    except Exception:
+                        logger.debug(f"🎭 No vehicle cards appeared on page {current_page + 1}")
                     
                     # Extract vehicles from the new page
-                    page_vehicle_cards = await page.locator('.inventory-listing, .vehicle-card').all()
+                    _, page_vehicle_cards = await self._snapshot_cards(
+                        page.locator('.inventory-listing, .vehicle-card'),
+                        _EDMUNDS_CARD_FIELDS
+                    )
                     page_vehicles = []
                     
-                    for i, card in enumerate(page_vehicle_cards[:20]):  # Limit per page
-                        try:
-                            vehicle_data = await self._extract_edmunds_vehicle(card)
-                            if vehicle_data:
-                                page_vehicles.append(vehicle_data)
-                                logger.debug(f"🎭 Page {current_page + 1} - Vehicle {i+1}: {vehicle_data.get('make', 'Unknown')} {vehicle_data.get('model', 'Unknown')} - ${vehicle_data.get('price', 'Unknown')}")
-                        except Exception as e:
-                            logger.debug(f"🎭 Error extracting vehicle {i+1} on page {current_page + 1}: {str(e)}")
+                    timestamps = _scrape_timestamps()
+                    results = await self._extract_cards(self._extract_edmunds_vehicle, page_vehicle_cards, timestamps)
+                    for i, vehicle_data in enumerate(results):  # Limit per page
+                        if isinstance(vehicle_data, Exception):
+                            logger.debug(f"🎭 Error extracting vehicle {i+1} on page {current_page + 1}: {str(vehicle_data)}")
                             continue
+                        if vehicle_data:
+                            page_vehicles.append(vehicle_data)
+                            logger.debug(
+                                "🎭 Page {} - Vehicle {}: {} {} - ${}",
+                                current_page + 1, i + 1,
+                                vehicle_data.get('make', 'Unknown'), vehicle_data.get('model', 'Unknown'), vehicle_data.get('price', 'Unknown')
+                            )
                     
                     vehicles.extend(page_vehicles)
                     logger.info(f"🎭 Page {current_page + 1}: Added {len(page_vehicles)} vehicles (Total: {len(vehicles)})")
@@ -1953,14 +2376,17 @@ class PlaywrightScrapingService:
             
             return []
     
-    async def _scrape_cargurus(self, page: Page, criteria: SearchCriteria, location_zip: str) -> List[Dict[str, Any]]:
-        """Scrape CarGurus using form automation"""
+    async def _scrape_cargurus(
+        self,
+        page: Page,
+        criteria: SearchCriteria,
+        location_zip: str,
+        collected: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scrape CarGurus using form automation, appending vehicles to `collected` as they're extracted"""
         try:
             logger.info("🎭 Navigating to CarGurus...")
-            await page.goto("https://www.cargurus.com/Cars/", wait_until="domcontentloaded")
-            
-            # Wait for page to load
-            await page.wait_for_timeout(3000)
+            await page.goto("https://www.cargurus.com/Cars/", wait_until="commit")
             
             # CarGurus search implementation would go here
             # For now, return empty list as placeholder
@@ -1971,13 +2397,58 @@ class PlaywrightScrapingService:
             logger.error(f"🎭 CarGurus scraping error: {str(e)}")
             return []
     
-    async def search_all_marketplaces(self, criteria: SearchCriteria, location_zips: List[str] = None) -> List[ScrapingResult]:
+    async def run_batch(self, jobs: List[Tuple[str, SearchCriteria, str]], workers: int = 5) -> List[ScrapingResult]:
+        """
+        Run many searches through a bounded worker pool, longest expected jobs first
+        
+        Args:
+            jobs: (marketplace, criteria, location_zip) tuples
+            workers: Number of searches in flight at once
+            
+        Returns:
+            ScrapingResult per job, in submission order
+        """
+        # LPT ordering: expensive jobs start first so they don't end up alone at the tail
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for index, (marketplace, _, _) in enumerate(jobs):
+            queue.put_nowait((-self._avg_search_seconds.get(marketplace, 10.0), index))
+        
+        results: List[Optional[ScrapingResult]] = [None] * len(jobs)
+        
+        async def worker():
+            while not queue.empty():
+                _, index = queue.get_nowait()
+                marketplace, criteria, location_zip = jobs[index]
+                
+                started = time.monotonic()
+                results[index] = await self.search_marketplace(marketplace, criteria, location_zip)
+                elapsed = time.monotonic() - started
+                
+                previous = self._avg_search_seconds.get(marketplace, elapsed)
+                self._avg_search_seconds[marketplace] = 0.8 * previous + 0.2 * elapsed
+        
+        await asyncio.gather(*(worker() for _ in range(min(workers, len(jobs)))))
+        return results
+    
+    async def search_all_marketplaces(
+        self,
+        criteria: SearchCriteria,
+        location_zips: List[str] = None,
+        max_concurrency: int = 5,
+        marketplaces: List[str] = None
+    ) -> List[ScrapingResult]:
         """
         Search all supported marketplaces concurrently
         
+        Searches (including their direct HTTP attempts) run through run_batch, so at
+        most `max_concurrency` are in flight; page-level concurrency is further bounded
+        by PlaywrightConfig.max_concurrent_pages.
+        
         Args:
             criteria: Search criteria
             location_zips: List of ZIP codes to search
+            max_concurrency: Maximum number of searches in flight at once
+            marketplaces: Marketplaces to search (default: all configured)
             
         Returns:
             List of ScrapingResult objects
@@ -1985,15 +2456,15 @@ class PlaywrightScrapingService:
         if not location_zips:
             location_zips = ["33101"]  # Default to Miami, FL
         
-        tasks = []
-        for marketplace in self.marketplaces.keys():
-            for zip_code in location_zips:
-                task = self.search_marketplace(marketplace, criteria, zip_code)
-                tasks.append(task)
+        jobs = [
+            (marketplace, criteria, zip_code)
+            for marketplace in (marketplaces or self.marketplaces.keys())
+            for zip_code in location_zips
+        ]
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self.run_batch(jobs, workers=max_concurrency)
         
-        # Filter out exceptions and return valid results
+        # Filter out failed workers and return valid results
         valid_results = []
         for result in results:
             if isinstance(result, ScrapingResult):
@@ -2001,4 +2472,4 @@ class PlaywrightScrapingService:
             else:
                 logger.error(f"🎭 Task failed with exception: {result}")
         
-        return valid_results 
\ No newline at end of file
+        return valid_results
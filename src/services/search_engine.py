@@ -126,15 +126,15 @@ class SearchEngine:
         try:
             logger.info(f"Analyzing vehicle: {vehicle.year} {vehicle.make} {vehicle.model}")
             
-            # Get market analysis from Perplexity
-            market_insight = await self.perplexity.analyze_vehicle_market(
-                vehicle, 
-                vehicle.location.state if vehicle.location else None
+            # Get market analysis and competitive pricing from Perplexity concurrently
+            market_insight, competitive_analysis = await asyncio.gather(
+                self.perplexity.analyze_vehicle_market(
+                    vehicle, 
+                    vehicle.location.state if vehicle.location else None
+                ),
+                self.perplexity.get_competitive_pricing(vehicle)
             )
             
-            # Get competitive pricing
-            competitive_analysis = await self.perplexity.get_competitive_pricing(vehicle)
-            
             # Calculate costs
             cost_breakdown = self._calculate_acquisition_costs(vehicle)
             